@@ -17,19 +17,43 @@ v2 reads Yoast's public sitemap_index.xml as the single source of truth:
 
 No WordPress credentials needed — sitemap is public.
 
+The post-sitemaps are fetched concurrently (MAX_WORKERS threads, each
+keeping one keep-alive connection per host) under a single DEADLINE for the
+whole walk, so one slow shard costs at most its own retries instead of
+stalling every shard behind it. Every body read is given only the time
+left before the DEADLINE, so a server trickling a sitemap can't outrun it.
+Response headers are read under the budget left when the request was
+sent, one socket timeout per read, so only a server trickling its headers
+can overrun it.
+
+Sitemaps are fetched with conditional GETs (If-None-Match /
+If-Modified-Since) against an on-disk cache of validators and parsed
+results, so a day with nothing published costs a handful of empty 304s.
+The workflow persists the cache with actions/cache.
+
+Sitemap bodies are parsed as they arrive (XMLPullParser fed CHUNK_SIZE
+reads, elements cleared as soon as their <loc> is read), so memory stays
+flat however large the multilingual sitemaps grow.
+
 Usage:
     python update_readme.py           # Dry run
     python update_readme.py --apply   # Actually update README.md
+    python update_readme.py --no-cache   # Ignore/skip the sitemap cache
 """
 
+import http.client
 import json
+import os
 import re
 import socket
 import sys
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
+from urllib.parse import urljoin, urlsplit
 from xml.etree import ElementTree as ET
 
 # ---------------------------------------------------------------------------
@@ -39,8 +63,20 @@ REGISTRY_PATH = Path(__file__).parent / "article_registry.json"
 README_PATH = Path(__file__).parent.parent / "README.md"
 SITEMAP_INDEX = "https://code-cogito.com/sitemap_index.xml"
 BASE_URL = "https://code-cogito.com"
-TIMEOUT = 20
+TIMEOUT = 20         # per request (connect + read)
+DEADLINE = 180       # whole sitemap walk, retries and body reads included
+MAX_WORKERS = 4      # concurrent post-sitemap fetches
+MAX_REDIRECTS = 5
+CHUNK_SIZE = 64 * 1024  # streamed read / parser feed size
+CACHE_PATH = Path(
+    os.environ.get("SITEMAP_CACHE", Path(__file__).parent / ".sitemap-cache" / "sitemaps.json")
+)
 NS = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+SM = "{%s}" % NS["sm"]  # Clark-notation prefix for streamed tags
+ZH_URL = re.compile(r"https://code-cogito\.com/([^/]+)/?$")
+# Bump when iter_locs or the sitemap/slug filters change: cached parsed
+# results from an older parser are then refetched instead of reused.
+PARSER_VERSION = 2
 
 # Words that don't carry semantic load — skipped when matching title to slug.
 STOPWORDS = {
@@ -68,70 +104,391 @@ BROWSER_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
-# Force IPv4 for getaddrinfo. Safe on GitHub-hosted Linux runners; on
-# machines where the patch isn't desired (no AAAA in DNS) this is a no-op.
-_orig_getaddrinfo = socket.getaddrinfo
+
+def _create_ipv4_connection(address, timeout=None, source_address=None):
+    """socket.create_connection, trying IPv4 addresses only (if there are any).
+
+    Used by the pool's own connections rather than patching
+    socket.getaddrinfo for the whole process, so importing this module
+    (as the offline harness does) has no side effects.
+    """
+    host, port = address
+    infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    infos = [r for r in infos if r[0] == socket.AF_INET] or infos
+    err = None
+    for family, socktype, proto, _, sockaddr in infos:
+        sock = socket.socket(family, socktype, proto)
+        try:
+            if timeout is not None:
+                sock.settimeout(timeout)
+            if source_address:
+                sock.bind(source_address)
+            sock.connect(sockaddr)
+            return sock
+        except OSError as e:
+            err = e
+            sock.close()
+    raise err or OSError(f"getaddrinfo returned nothing for {host}")
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections, one per (thread, host).
+
+    urllib's urlopen opens a fresh TCP + TLS connection for every request;
+    with a dozen shards on one host that handshake dominates. http.client
+    connections are not thread-safe, so each worker thread keeps its own.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.requests = 0  # issued, retries included (for reporting)
+
+    def _connections(self) -> dict:
+        if not hasattr(self._local, "conns"):
+            self._local.conns = {}
+        return self._local.conns
+
+    def _drop(self, key):
+        conn = self._connections().pop(key, None)
+        if conn is not None:
+            conn.close()
+
+    def get(self, url: str, timeout: float, headers: dict = None, reader=None,
+            deadline: float = None):
+        """One GET (following redirects) -> (status, headers, body).
+
+        body is the raw bytes, or `reader(response, before_read)` for a 200
+        when a reader is given (for consuming the body as a stream). The
+        reader calls before_read() ahead of each read. That call shrinks the
+        socket timeout to what is left of `deadline`, a time.monotonic()
+        value, and raises TimeoutError once it has passed.
+        """
+        request_headers = dict(BROWSER_HEADERS, **(headers or {}))
+        for _ in range(MAX_REDIRECTS + 1):
+            status, headers, body = self._get_once(url, timeout, request_headers, reader,
+                                                   deadline)
+            location = headers.get("Location")
+            if status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                continue
+            return status, headers, body
+        raise URLError(f"too many redirects: {url}")
+
+    def _get_once(self, url: str, timeout: float, headers: dict, reader=None,
+                  deadline: float = None):
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        conns = self._connections()
+        # A reused connection may have been closed by the server while idle;
+        # that is retried at once on a fresh connection, not backed off.
+        for fresh in ((False, True) if key in conns else (True,)):
+            conn = conns.get(key)
+            if conn is None:
+                cls = (http.client.HTTPSConnection if parts.scheme == "https"
+                       else http.client.HTTPConnection)
+                conn = conns[key] = cls(parts.netloc, timeout=timeout)
+                conn._create_connection = _create_ipv4_connection
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            with self._lock:
+                self.requests += 1
+
+            def before_read(conn=conn):
+                if deadline is None or conn.sock is None:
+                    return
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    raise TimeoutError("deadline exceeded mid-body")
+                conn.sock.settimeout(min(timeout, left))
+
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                if reader is not None and resp.status == 200:
+                    body = reader(resp, before_read)
+                else:
+                    before_read()
+                    body = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError,
+                    BrokenPipeError):
+                self._drop(key)
+                if fresh:
+                    raise
+                continue
+            except Exception:
+                # Includes parse errors mid-stream: the body is half-read,
+                # so the connection can't be reused.
+                self._drop(key)
+                raise
+            if resp.will_close:
+                self._drop(key)
+            return resp.status, resp.headers, body
 
 
-def _ipv4_only_getaddrinfo(*args, **kwargs):
-    res = _orig_getaddrinfo(*args, **kwargs)
-    return [r for r in res if r[0] == socket.AF_INET] or res
+_pool = ConnectionPool()
 
 
-socket.getaddrinfo = _ipv4_only_getaddrinfo
+def fetch(url: str, retries: int = 3, deadline: float = None, headers: dict = None,
+          reader=None):
+    """GET with browser headers and exponential-backoff retry on network errors.
 
+    Returns (status, headers, body). status is 200, or 304 when conditional
+    `headers` were sent. body is bytes, or what `reader` returned for a 200.
 
-def fetch_url(url: str, retries: int = 3) -> str:
-    """GET with browser headers and exponential-backoff retry on network errors."""
+    `deadline` is a time.monotonic() value that caps every timeout and
+    backoff sleep. The backoff only ever blocks the calling thread.
+    """
     last_err = None
     for attempt in range(1, retries + 1):
+        remaining = TIMEOUT if deadline is None else deadline - time.monotonic()
+        if remaining <= 0:
+            raise URLError(f"deadline exceeded: {last_err or 'no attempt left'}")
         try:
-            req = Request(url, headers=BROWSER_HEADERS)
-            with urlopen(req, timeout=TIMEOUT) as resp:
-                return resp.read().decode("utf-8")
-        except (URLError, HTTPError, socket.timeout) as e:
+            status, resp_headers, body = _pool.get(url, min(TIMEOUT, remaining), headers,
+                                                   reader, deadline)
+            if status not in (200, 304):
+                raise HTTPError(url, status, http.client.responses.get(status, ""),
+                                resp_headers, None)
+            return status, resp_headers, body
+        except (URLError, OSError, http.client.HTTPException) as e:
             last_err = e
+            if isinstance(e, HTTPError) and 400 <= e.code < 500 and e.code not in (408, 429):
+                raise  # a missing shard stays missing; don't spend the backoff on it
             if attempt < retries:
-                wait = 2 ** attempt  # 2s, 4s
-                print(f"  retry {attempt}/{retries} after {wait}s ({e})")
-                time.sleep(wait)
+                wait_s = 2 ** attempt  # 2s, 4s
+                if deadline is not None:
+                    wait_s = min(wait_s, max(0.0, deadline - time.monotonic()))
+                print(f"  retry {attempt}/{retries} after {wait_s:.0f}s ({url}: {e})")
+                time.sleep(wait_s)
     raise URLError(f"giving up after {retries} attempts: {last_err}")
 
 
-def fetch_all_zh_slugs() -> set:
+def fetch_url(url: str, retries: int = 3, deadline: float = None) -> str:
+    """Unconditional GET -> decoded body."""
+    return fetch(url, retries, deadline)[2].decode("utf-8")
+
+
+class SitemapCache:
+    """Conditional-GET cache: URL -> ETag / Last-Modified + parsed result.
+
+    The parsed result (sub-sitemap URLs for the index, slug list for a
+    post-sitemap) is stored instead of the raw XML, which keeps the file
+    small and makes a 304 skip parsing as well as the download. Entries
+    for URLs not requested in a run are dropped on save, and entries parsed
+    under another PARSER_VERSION are ignored.
+    """
+
+    def __init__(self, path: Path = None):
+        self.path = path
+        self.entries = {}
+        if path is not None:
+            try:
+                self.entries = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                pass  # first run or unreadable: start empty
+        self._seen = set()
+        self._lock = threading.Lock()
+        self.not_modified = 0
+        self.downloaded = 0
+        self.bytes_saved = 0
+        self.bytes_downloaded = 0
+
+    def get(self, url: str, parse, deadline: float = None):
+        """Fetch `url` (conditionally if cached) and return parse(chunks).
+
+        `parse` consumes an iterable of body chunks as they are received.
+        """
+        with self._lock:
+            self._seen.add(url)
+            entry = self.entries.get(url)
+        if entry and entry.get("parser") != PARSER_VERSION:
+            entry = None  # parsed by older code: refetch unconditionally
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        status, resp_headers, body = fetch(url, deadline=deadline, headers=headers,
+                                           reader=lambda resp, before_read: _read_parsed(
+                                               resp, parse, before_read))
+        if status == 304 and entry:
+            with self._lock:
+                self.not_modified += 1
+                self.bytes_saved += entry["size"]
+            return entry["data"]
+        if status != 200:
+            raise HTTPError(url, status, "unexpected 304 (nothing cached)", resp_headers, None)
+        data, size = body
+        with self._lock:
+            self.downloaded += 1
+            self.bytes_downloaded += size
+            if resp_headers.get("ETag") or resp_headers.get("Last-Modified"):
+                self.entries[url] = {
+                    "etag": resp_headers.get("ETag"),
+                    "last_modified": resp_headers.get("Last-Modified"),
+                    "size": size,
+                    "parser": PARSER_VERSION,
+                    "data": data,
+                }
+            else:
+                self.entries.pop(url, None)  # no validators: nothing to reuse
+        return data
+
+    def save(self):
+        if self.path is None:
+            return
+        # Stragglers may still be writing entries (the pool isn't joined
+        # until interpreter exit).
+        with self._lock:
+            entries = {u: e for u, e in self.entries.items() if u in self._seen}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(entries, sort_keys=True), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError as e:
+            print(f"  WARN: could not save sitemap cache: {e}")
+
+    def report(self) -> str:
+        return (
+            f"{self.not_modified} not modified, {self.downloaded} downloaded "
+            f"({self.bytes_downloaded / 1024:.1f} KB); "
+            f"{self.bytes_saved / 1024:.1f} KB saved"
+        )
+
+
+class _Chunks:
+    """A response body as pieces of up to CHUNK_SIZE, counting bytes received.
+
+    read1 makes at most one socket read per piece, so the timeout that
+    `before_read` sets bounds each piece's wait.
+    """
+
+    def __init__(self, resp, before_read=None):
+        self.resp = resp
+        self.before_read = before_read
+        self.nbytes = 0
+
+    def __iter__(self):
+        while True:
+            if self.before_read is not None:
+                self.before_read()
+            chunk = self.resp.read1(CHUNK_SIZE)
+            if not chunk:
+                # read1 never marks a Content-Length body finished; read()
+                # does, so the keep-alive connection can be reused.
+                self.resp.read()
+                return
+            self.nbytes += len(chunk)
+            yield chunk
+
+
+def _read_parsed(resp, parse, before_read=None):
+    """Stream `resp` through `parse`; drain the rest for keep-alive."""
+    chunks = _Chunks(resp, before_read)
+    data = parse(chunks)
+    for _ in chunks:
+        pass
+    return data, chunks.nbytes
+
+
+def iter_locs(chunks, entry_tag: str):
+    """Yield `<entry_tag><loc>` texts of a sitemap document, streaming.
+
+    Equivalent to findall("sm:<entry>/sm:loc") on the whole tree, but each
+    entry is discarded once read, so memory doesn't grow with the document.
+    `chunks` is an iterable of bytes (or a single str / bytes document).
+    """
+    if isinstance(chunks, (str, bytes)):
+        chunks = (chunks,)
+    entry_tag, loc_tag = SM + entry_tag, SM + "loc"
+    parser = ET.XMLPullParser(events=("start", "end"))
+    root = None
+    depth = 0
+
+    def drain():
+        nonlocal root, depth
+        for event, elem in parser.read_events():
+            if event == "start":
+                depth += 1
+                if root is None:
+                    root = elem
+                continue
+            depth -= 1
+            if depth == 1 and elem.tag == entry_tag:  # direct child of the root
+                for loc in elem.findall(loc_tag):
+                    yield loc.text
+                root.clear()  # drop the finished entry (and any before it)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from drain()
+    parser.close()
+    yield from drain()
+
+
+def parse_post_sitemaps(chunks) -> list:
+    """post-sitemap URLs listed in sitemap_index.xml."""
+    # only post sitemaps (skip page/category/tag/author/mailpoet)
+    return [u for u in iter_locs(chunks, "sitemap") if u and "post-sitemap" in u]
+
+
+def iter_zh_slugs(chunks):
+    """Yield ZH article slugs from one post-sitemap as it is parsed."""
+    for url in iter_locs(chunks, "url"):
+        if not url:
+            continue
+        if "/en/" in url or "/ja/" in url:
+            continue
+        m = ZH_URL.match(url)
+        if m:
+            yield m.group(1)
+
+
+def parse_zh_slugs(chunks) -> list:
+    """ZH article slugs from one post-sitemap document (sorted)."""
+    return sorted(set(iter_zh_slugs(chunks)))
+
+
+def fetch_all_zh_slugs(index_url: str = SITEMAP_INDEX, deadline_s: float = DEADLINE,
+                       workers: int = MAX_WORKERS, cache: SitemapCache = None) -> set:
     """Walk sitemap_index → all post-sitemaps → return set of ZH article slugs.
 
-    ZH = root-level (no `/en/` or `/ja/` prefix).
+    ZH = root-level (no `/en/` or `/ja/` prefix). Post-sitemaps are fetched
+    concurrently; shards still failing at the deadline are skipped with a
+    warning, like any other failed shard. Without a `cache` every document
+    is downloaded in full.
     """
+    cache = cache or SitemapCache()
+    deadline = time.monotonic() + deadline_s
     slugs = set()
     try:
-        idx_xml = fetch_url(SITEMAP_INDEX)
-        idx_root = ET.fromstring(idx_xml)
+        sub_urls = cache.get(index_url, parse_post_sitemaps, deadline)
     except (URLError, HTTPError, ET.ParseError) as e:
         print(f"  ERROR: Could not fetch sitemap index: {e}")
         return slugs
 
-    for sm in idx_root.findall("sm:sitemap/sm:loc", NS):
-        sub_url = sm.text
-        if not sub_url or "post-sitemap" not in sub_url:
-            # only post sitemaps (skip page/category/tag/author/mailpoet)
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    futures = {pool.submit(cache.get, u, parse_zh_slugs, deadline): u for u in sub_urls}
+    done, pending = wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+    for future in pending:
+        future.cancel()
+        print(f"  WARN: skip {futures[future]}: deadline exceeded")
+    # Running stragglers stop by the deadline (their reads are budgeted),
+    # so the join deferred to interpreter exit is bounded too; don't wait
+    # for them here.
+    pool.shutdown(wait=False)
+    for future in futures:
+        if future not in done:
             continue
         try:
-            sub_xml = fetch_url(sub_url)
-            sub_root = ET.fromstring(sub_xml)
+            slugs.update(future.result())
         except (URLError, HTTPError, ET.ParseError) as e:
-            print(f"  WARN: skip {sub_url}: {e}")
-            continue
-
-        for loc in sub_root.findall("sm:url/sm:loc", NS):
-            url = loc.text
-            if not url:
-                continue
-            if "/en/" in url or "/ja/" in url:
-                continue
-            m = re.match(r"https://code-cogito\.com/([^/]+)/?$", url)
-            if m:
-                slugs.add(m.group(1))
+            print(f"  WARN: skip {futures[future]}: {e}")
     return slugs
 
 
@@ -157,8 +514,97 @@ def score_slug(keywords: set, slug: str) -> int:
 MIN_FUZZY_OVERLAP = 3
 
 
-def resolve_slug(article: dict, candidate_slugs: set):
-    """Return the actual published slug, or None if article isn't live."""
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SlugIndex:
+    """Candidate slugs with a trigram index for keyword matching.
+
+    score_slug() counts title keywords that are substrings of a slug, which
+    as a scan is O(slugs x keywords) per article. Keywords are longer than 2
+    characters, so a slug containing `w` contains every trigram of `w`: the
+    index intersects those posting lists and verifies `w in slug` only on
+    what's left. Same scores as score_slug(); claimed slugs are removed with
+    discard() so later articles can't match them.
+    """
+
+    def __init__(self, slugs=()):
+        self._slugs = set()
+        self._grams = defaultdict(set)
+        self._hits = {}  # keyword -> live slugs containing it
+        for slug in slugs:
+            self.add(slug)
+
+    def __contains__(self, slug) -> bool:
+        return slug in self._slugs
+
+    def __len__(self) -> int:
+        return len(self._slugs)
+
+    def __iter__(self):
+        return iter(self._slugs)
+
+    def add(self, slug: str):
+        if slug in self._slugs:
+            return
+        self._slugs.add(slug)
+        low = slug.lower()
+        for gram in _trigrams(low):
+            self._grams[gram].add(slug)
+        for word, hits in self._hits.items():
+            if word in low:
+                hits.add(slug)
+
+    def discard(self, slug: str):
+        if slug not in self._slugs:
+            return
+        self._slugs.discard(slug)
+        for gram in _trigrams(slug.lower()):
+            self._grams[gram].discard(slug)
+        for hits in self._hits.values():
+            hits.discard(slug)
+
+    def containing(self, word: str) -> set:
+        """Slugs that contain `word` (len > 2) as a substring."""
+        hits = self._hits.get(word)
+        if hits is None:
+            postings = sorted((self._grams.get(g, set()) for g in _trigrams(word)), key=len)
+            found = set(postings[0]) if postings else set()
+            for posting in postings[1:]:
+                found &= posting
+                if not found:
+                    break
+            hits = self._hits[word] = {s for s in found if word in s.lower()}
+        return hits
+
+    def best_match(self, keywords: set, min_overlap: int = 1):
+        """(slug, score) with the highest score_slug(), or (None, 0).
+
+        Only slugs sharing at least `min_overlap` keywords are considered;
+        ties go to the alphabetically first slug.
+        """
+        if len(keywords) < min_overlap:
+            return None, 0
+        hit_sets = sorted((self.containing(w) for w in keywords), key=len)
+        # Pigeonhole: a slug in >= min_overlap of the n sets is in one of the
+        # n - min_overlap + 1 smallest, so only those slugs get scored.
+        seeds = set().union(*hit_sets[:len(hit_sets) - max(min_overlap, 1) + 1])
+        best_slug, best_score = None, 0
+        for slug in seeds:
+            score = sum(1 for hits in hit_sets if slug in hits)
+            if score >= min_overlap and (
+                score > best_score or (score == best_score and slug < best_slug)
+            ):
+                best_slug, best_score = slug, score
+        return best_slug, best_score
+
+
+def resolve_slug(article: dict, candidate_slugs):
+    """Return the actual published slug, or None if article isn't live.
+
+    `candidate_slugs` is a SlugIndex (or any set of slugs, indexed here).
+    """
     registry_slug = article["slug"]
     if registry_slug in candidate_slugs:
         return registry_slug
@@ -167,13 +613,9 @@ def resolve_slug(article: dict, candidate_slugs: set):
     kw = title_keywords(article["title"])
     if not kw:
         return None
-    best_score = 0
-    best_slug = None
-    for slug in candidate_slugs:
-        s = score_slug(kw, slug)
-        if s > best_score:
-            best_score = s
-            best_slug = slug
+    if not isinstance(candidate_slugs, SlugIndex):
+        candidate_slugs = SlugIndex(candidate_slugs)
+    best_slug, best_score = candidate_slugs.best_match(kw, MIN_FUZZY_OVERLAP)
     if best_score >= MIN_FUZZY_OVERLAP:
         if best_slug != registry_slug:
             print(
@@ -188,6 +630,64 @@ def resolve_slug(article: dict, candidate_slugs: set):
 # ---------------------------------------------------------------------------
 # README rewriting
 # ---------------------------------------------------------------------------
+# A series table belongs to the nearest `### [Series N: ...](./<series-key>)`
+# heading above it; any other heading ends it.
+SERIES_HEADING = re.compile(r"^#{2,6} \[[^\]]*\]\(\./(?P<key>[^)/]+)/?\)")
+TABLE_ROW = re.compile(r"^\| (?P<num>[^|]+?) \| (?P<title>.*) \| \[[^\]]*\]\([^)]*\) \|$")
+LINKED_URL = re.compile(r"^\[.*\]\((?P<url>[^)]*)\)$")
+
+
+class ReadmeTables:
+    """README text with its series table rows indexed by (series, num).
+
+    The text is kept as its original lines; rows are edited in place and
+    render() joins the lines once, so everything outside the edited rows
+    comes back byte-for-byte.
+    """
+
+    def __init__(self, text: str):
+        self.lines = text.splitlines(keepends=True)
+        self._rows = {}  # (series_key, num) -> line index
+        series = None
+        for i, line in enumerate(self.lines):
+            body = line.rstrip("\r\n")
+            if body.startswith("#"):
+                m = SERIES_HEADING.match(body)
+                series = m.group("key") if m else None
+                continue
+            if series is None:
+                continue
+            m = TABLE_ROW.match(body)
+            if m:
+                self._rows.setdefault((series, m.group("num")), i)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def row(self, series: str, num: str):
+        """The row text (without newline), or None if the table lacks it."""
+        i = self._rows.get((series, num))
+        return None if i is None else self.lines[i].rstrip("\r\n")
+
+    def set_row(self, series: str, num: str, text: str):
+        i = self._rows[(series, num)]
+        line = self.lines[i]
+        self.lines[i] = text + line[len(line.rstrip("\r\n")):]
+
+    def linked_slugs(self) -> set:
+        """Slugs of every row already linked to an article on BASE_URL."""
+        slugs = set()
+        for i in self._rows.values():
+            title = TABLE_ROW.match(self.lines[i].rstrip("\r\n")).group("title")
+            m = LINKED_URL.match(title)
+            if m and m.group("url").startswith(BASE_URL + "/"):
+                slugs.add(m.group("url")[len(BASE_URL) + 1:].strip("/"))
+        return slugs
+
+    def render(self) -> str:
+        return "".join(self.lines)
+
+
 def build_table_row(num: str, article: dict, published_slug):
     title = article["title"]
     code = article["code"]
@@ -200,35 +700,33 @@ def build_table_row(num: str, article: dict, published_slug):
     return f"| {num} | {title_cell} | [{code}]({code_path}) |"
 
 
-def update_readme(registry: dict, all_zh_slugs: set, dry_run: bool = True) -> int:
-    readme = README_PATH.read_text(encoding="utf-8")
+def update_readme(registry: dict, all_zh_slugs: set, dry_run: bool = True,
+                  readme_path: Path = README_PATH) -> int:
+    tables = ReadmeTables(readme_path.read_text(encoding="utf-8"))
     changes = 0
 
     # Mutable working set: once a slug is claimed by article N, remove it so
     # later articles can't fuzzy-match the same slug.
-    candidates = set(all_zh_slugs)
+    candidates = SlugIndex(all_zh_slugs)
     # Pre-claim any slugs already present in linked rows of the README, so a
     # later unlinked article doesn't steal them via fuzzy match.
-    for series_data in registry["series"].values():
-        for article in series_data["articles"].values():
-            if article["slug"] in readme:
-                candidates.discard(article["slug"])
+    for slug in tables.linked_slugs():
+        candidates.discard(slug)
 
     for series_key, series_data in registry["series"].items():
         for num, article in series_data["articles"].items():
             title = article["title"]
-            code = article["code"]
-            code_path = article["code_path"]
+
+            row = tables.row(series_key, num)
+            if row is None:
+                continue  # row not present in README
 
             # Already linked? skip.
-            if f"| {num} | [{title}]" in readme:
+            if row.startswith(f"| {num} | [{title}]"):
                 continue
 
-            unlinked = (
-                f"| {num} | {title} | [{code}]({code_path}) |"
-            )
-            if unlinked not in readme:
-                continue  # row not present in README
+            if row != build_table_row(num, article, None):
+                continue  # row edited by hand; leave it alone
 
             print(f"Checking: {series_key} #{num} '{title}'")
             slug = resolve_slug(article, candidates)
@@ -236,15 +734,14 @@ def update_readme(registry: dict, all_zh_slugs: set, dry_run: bool = True) -> in
                 print("  [NOT YET] not published")
                 continue
 
-            new_row = build_table_row(num, article, slug)
-            readme = readme.replace(unlinked, new_row, 1)
+            tables.set_row(series_key, num, build_table_row(num, article, slug))
             candidates.discard(slug)  # don't let later articles steal it
             changes += 1
             print(f"  [PUBLISHED] -> {BASE_URL}/{slug}/")
 
     if changes > 0 and not dry_run:
-        README_PATH.write_text(readme, encoding="utf-8")
-        print(f"\n{'=' * 60}\nUPDATED: {changes} row(s) in README.md")
+        readme_path.write_text(tables.render(), encoding="utf-8")
+        print(f"\n{'=' * 60}\nUPDATED: {changes} row(s) in {readme_path.name}")
     elif changes > 0:
         print(
             f"\n{'=' * 60}\n"
@@ -260,14 +757,18 @@ def update_readme(registry: dict, all_zh_slugs: set, dry_run: bool = True) -> in
 # ---------------------------------------------------------------------------
 def main() -> int:
     apply = "--apply" in sys.argv
+    use_cache = "--no-cache" not in sys.argv
     print("Code & Cogito - README Link Updater (v2: sitemap-driven)")
     print("=" * 60)
     print(f"Mode: {'APPLY' if apply else 'DRY RUN'}")
     print(f"Sitemap: {SITEMAP_INDEX}\n")
 
     print("Fetching all published ZH slugs from sitemap...")
-    all_zh = fetch_all_zh_slugs()
-    print(f"  found {len(all_zh)} ZH article slug(s)\n")
+    cache = SitemapCache(CACHE_PATH if use_cache else None)
+    all_zh = fetch_all_zh_slugs(cache=cache)
+    cache.save()
+    print(f"  found {len(all_zh)} ZH article slug(s)")
+    print(f"  sitemap cache: {cache.report()}\n")
 
     if not all_zh:
         # Graceful exit: sitemap unreachable today is annoying but not a
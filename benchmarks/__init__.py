@@ -0,0 +1,16 @@
+"""
+Benchmark suite for the simulation kernels behind the article scripts.
+
+Kernels are pulled out of the scripts headlessly (see `loader`) so nothing is
+plotted, then timed at several multiples of the article's default problem
+size. Each case reports its best time after a warm-up, tracemalloc peak
+and a fitted complexity exponent; `baselines.json` holds reference timings
+(with a calibration time, to rescale them to the machine at hand)
+and a run fails when any size is still past the threshold after being
+re-timed.
+
+Usage:
+    python -m benchmarks                    # all cases, 1x / 10x / 100x
+    python -m benchmarks --quick dtw sir    # 1x / 10x, selected cases
+    python -m benchmarks --save-baseline    # refresh baselines.json
+"""
@@ -0,0 +1,449 @@
+"""
+Benchmark cases: one per simulation kernel.
+
+A case's setup function takes a scale factor (1 = the article's default
+problem size) and returns `(size, run)`, where `size` is the problem size
+used for the complexity fit and `run` is a zero-argument callable that does
+the measured work. Setup cost (data generation, seeding) is not timed.
+"""
+
+import numpy as np
+
+from benchmarks.loader import add_script_dir, load_kernels, load_module
+
+S1 = "series-01-renaissance"
+S2 = "series-02-industrial-data-revolution"
+S3 = "series-03-quantum-eastern-philosophy"
+S5 = "series-05-revolution-of-ideas"
+S6 = "series-06-finance-bubbles-crises"
+
+DEFAULT_SCALES = (1, 10, 100)
+QUICK_SCALES = (1, 10)
+
+
+class Case:
+    def __init__(self, name, setup, unit, expected, scales):
+        self.name = name
+        self.setup = setup
+        self.unit = unit
+        self.expected = expected
+        self.scales = scales
+
+
+CASES = {}
+
+
+def case(name: str, unit: str, expected: float, scales=DEFAULT_SCALES):
+    """Register a setup function. `expected` is the theoretical exponent."""
+    def register(setup):
+        CASES[name] = Case(name, setup, unit, expected, scales)
+        return setup
+    return register
+
+
+# ---------------------------------------------------------------------------
+# Series 6
+# ---------------------------------------------------------------------------
+@case("dtw", unit="months per series", expected=2.0)
+def dtw(scale):
+    k = load_kernels(f"{S6}/article-01-tulip-vs-bitcoin/tulip_vs_bitcoin_analysis.py",
+                     "dtw_cost_matrix")
+    n = 36 * scale
+    rng = np.random.default_rng(0)
+    a, b = rng.random(n) * 100, rng.random(n) * 100
+    return n, lambda: k.dtw_cost_matrix(a, b)
+
+
+@case("greater_fool", unit="players", expected=1.0)
+def greater_fool(scale):
+    k = load_kernels(f"{S6}/article-01-tulip-vs-bitcoin/tulip_vs_bitcoin_analysis.py",
+                     "simulate_greater_fool")
+    n = 1000 * scale
+
+    def run():
+        np.random.seed(42)
+        k.simulate_greater_fool(n_players=n, n_chairs=100 * scale, n_rounds=20)
+    return n, run
+
+
+@case("bank_run_step", unit="depositors", expected=1.0)
+def bank_run_step(scale):
+    import random
+    k = load_kernels(f"{S6}/article-03-great-depression-vs-2008/depression_vs_2008_analysis.py",
+                     "BankRunSimulation")
+    n = 200 * scale
+
+    def run():
+        random.seed(42)
+        sim = k.BankRunSimulation(n_depositors=n)
+        for _ in range(20):
+            sim.step()
+    return n, run
+
+
+@case("credit_spiral", unit="scenarios", expected=1.0)
+def credit_spiral(scale):
+    add_script_dir(f"{S6}/article-03-great-depression-vs-2008/spiral.py")
+    import spiral
+    n = 10_000 * scale  # 10^6 scenarios at 100x
+    return n, lambda: spiral.trough_percentiles(spiral.scenarios(n, seed=42))
+
+
+@case("cohort_projection", unit="scenarios", expected=1.0)
+def cohort_projection(scale):
+    add_script_dir(f"{S6}/article-04-japan-lost-decades/cohort.py")
+    import cohort
+    tfr, e0 = np.linspace(0.8, 2.1, 14), np.linspace(81, 93, 12)
+    migration = np.linspace(0, 4.5e5, max(1, scale // 5))  # 3360 scenarios at 100x
+    return len(tfr) * len(e0) * len(migration), \
+        lambda: cohort.project(cohort.JAPAN, tfr, e0, migration, years=100, cache=False)
+
+
+@case("eisenberg_noe", unit="bank-scenarios", expected=1.0)
+def eisenberg_noe(scale):
+    add_script_dir(f"{S6}/article-05-bank-runs/clearing.py")
+    import clearing
+    n, scenarios = 100 * scale, 10 * scale  # 10^4 banks x 10^3 scenarios at 100x
+    L, ext_assets, ext_liab = clearing.interbank_network(n, seed=42)
+    shocked = clearing.shock(ext_assets, scenarios, seed=43)
+    return n * scenarios, lambda: clearing.clear(L, shocked, external_liabilities=ext_liab)
+
+
+@case("bank_runs", unit="bank-levels", expected=1.0)
+def bank_runs(scale):
+    add_script_dir(f"{S6}/article-05-bank-runs/runs.py")
+    import runs
+    banks = runs.balance_sheets(50 * scale, seed=42)  # 5000 banks at 100x
+    panic = np.linspace(0, 1, 1001)
+    return len(banks.deposits) * len(panic), lambda: (runs.run(banks, panic),
+                                                      runs.thresholds(banks))
+
+
+@case("debtrank", unit="counterparties", expected=1.0)
+def debtrank_batch(scale):
+    add_script_dir(f"{S6}/article-06-ftx-collapse/debtrank.py")
+    import debtrank
+    n = 100 * scale  # 10^4 counterparties at 100x
+    X, capital = debtrank.lending_network(n, seed=42)
+    # One batch of 256 single-node shocks; each cascade's reach grows with n.
+    shocked = np.arange(min(n, 256))
+    return n, lambda: debtrank.debtrank(X, capital, shocked=shocked)
+
+
+@case("liquidation_spiral", unit="paths", expected=1.0)
+def liquidation_spiral(scale):
+    add_script_dir(f"{S6}/article-06-ftx-collapse/liquidation.py")
+    import liquidation
+    paths = 1000 * scale  # 10^5 paths at 100x
+    return paths, lambda: liquidation.simulate(paths=paths, days=365, seed=42)
+
+
+# ---------------------------------------------------------------------------
+# Series 5
+# ---------------------------------------------------------------------------
+@case("echo_chamber", unit="agents", expected=2.0)
+def echo_chamber(scale):
+    k = load_kernels(f"{S5}/article-02-printing-vs-social-media/printing_vs_social_analysis.py",
+                     "simulate_echo_chamber")
+    n = 200 * scale
+
+    # 5 steps instead of the article's 80: the per-agent argmin makes a step
+    # O(n^2), and only the agent axis is being scaled here.
+    def run():
+        np.random.seed(42)
+        k.simulate_echo_chamber(n, 5, homophily=0.5, algorithm_boost=1.5)
+    return n, run
+
+
+@case("sir_model", unit="days", expected=1.0)
+def sir_model(scale):
+    k = load_kernels(f"{S5}/article-02-printing-vs-social-media/printing_vs_social_analysis.py",
+                     "sir_model")
+    days = 90 * scale
+    return days, lambda: k.sir_model(100000, beta=0.3, gamma=0.01, days=days)
+
+
+# ---------------------------------------------------------------------------
+# Series 3
+# ---------------------------------------------------------------------------
+@case("epr_correlation", unit="trials per angle", expected=1.0)
+def epr_correlation(scale):
+    k = load_kernels(f"{S3}/article-05-entanglement-indra/entanglement_indra_analysis.py",
+                     "simulate_epr")
+    n = 1000 * scale
+    angles = np.linspace(0, np.pi, 50)
+
+    def run():
+        np.random.seed(42)
+        k.simulate_epr(angles, n)
+    return n, run
+
+
+# ---------------------------------------------------------------------------
+# Series 2
+# ---------------------------------------------------------------------------
+@case("taylorist", unit="workers", expected=1.0)
+def taylorist(scale):
+    k = load_kernels(f"{S2}/article-02-factory-vs-platform/factory_vs_platform_analysis.py",
+                     "taylor_daily_output")
+    n = 50 * scale
+    eff = np.clip(np.random.default_rng(42).normal(1.0, 0.15, n), 0.5, 1.5)
+    times = {'task_A': 3.2, 'task_B': 5.1, 'task_C': 4.7, 'rest': 10.0}
+    tasks, weights = ['task_A', 'task_B', 'task_C'], [0.4, 0.35, 0.25]
+    return n, lambda: k.taylor_daily_output(eff, 10, times, tasks, weights)
+
+
+@case("production_line", unit="workers", expected=1.0)
+def production_line(scale):
+    add_script_dir(f"{S2}/article-02-factory-vs-platform/production_line.py")
+    import production_line as pl
+    line = pl.taylorist_line(30 * scale)
+    return sum(st.workers for st in line), lambda: pl.simulate(line, days=2, seed=42)
+
+
+@case("uber", unit="drivers", expected=1.0)
+def uber(scale):
+    k = load_kernels(f"{S2}/article-02-factory-vs-platform/factory_vs_platform_analysis.py",
+                     "uber_daily_gross")
+    n = 50 * scale
+    ratings = np.clip(np.random.default_rng(42).normal(4.7, 0.2, n), 4.0, 5.0)
+    bonus = ratings - 4.0
+
+    def run():
+        np.random.seed(42)
+        k.uber_daily_gross(bonus, 2.5, 10, 12.0)
+    return n, run
+
+
+@case("ride_hailing", unit="drivers", expected=1.0)
+def ride_hailing(scale):
+    add_script_dir(f"{S2}/article-02-factory-vs-platform/ride_hailing.py")
+    import ride_hailing as rh
+    market = rh.Market(drivers=100 * scale, requests_per_day=2500 * scale)
+    return market.drivers, lambda: rh.simulate(market, seed=42)
+
+
+@case("ride_hailing_city", unit="trips", expected=1.0, scales=(1, 10))
+def ride_hailing_city(scale):
+    add_script_dir(f"{S2}/article-02-factory-vs-platform/ride_hailing.py")
+    import ride_hailing as rh
+    # The CLI's city-scale day at x10: 55k drivers, about 10^6 completed trips.
+    market = rh.Market(drivers=5500 * scale, requests_per_day=140_000 * scale)
+    return 100_000 * scale, lambda: rh.simulate(market, seed=42)
+
+
+@case("bass_fit", unit="observations", expected=1.0)
+def bass_fit(scale):
+    k = load_kernels(f"{S2}/article-01-steam-vs-cloud/steam_vs_cloud_analysis.py",
+                     "bass_model", "fit_bass")
+    n = 10 * scale
+    t = np.linspace(0, 90, n)
+    rng = np.random.default_rng(0)
+    counts = k.bass_model(t, 0.01, 0.25, 50000) * rng.normal(1.0, 0.03, n)
+    return n, lambda: k.fit_bass(t, counts)
+
+
+@case("bass_fit_many", unit="series", expected=1.0)
+def bass_fit_many(scale):
+    add_script_dir(f"{S2}/article-01-steam-vs-cloud/bass.py")
+    import bass
+    K = 10 * scale  # technologies x regions
+    t = np.arange(40, dtype=float)
+    rng = np.random.default_rng(0)
+    p = rng.uniform(0.002, 0.03, K)[:, None]
+    q = rng.uniform(0.1, 0.7, K)[:, None]
+    m = 10 ** rng.uniform(2, 6, K)[:, None]
+    counts = bass.bass_cdf(t, p, q, m) * rng.normal(1.0, 0.02, (K, len(t)))
+    counts[rng.random(counts.shape) < 0.05] = np.nan  # ragged series
+    return K, lambda: bass.fit_many(t, counts)
+
+
+def synthetic_panel(n_entities, n_years=1000, seed=0):
+    """Long-format rows like the Maddison Project: ~60% of years observed."""
+    import pandas as pd
+    rng = np.random.default_rng(seed)
+    years = np.arange(2021 - n_years, 2021)
+    growth = rng.normal(0.005, 0.01, (n_entities, n_years))
+    gdppc = 600 * np.exp(np.cumsum(growth, axis=1))
+    gdppc[rng.random(gdppc.shape) < 0.4] = np.nan
+    e, t = np.nonzero(~np.isnan(gdppc))
+    frame = pd.DataFrame({"countrycode": [f"C{i:04d}" for i in e], "year": years[t],
+                          "gdppc": gdppc[e, t], "pop": rng.random(len(e))})
+    return years, gdppc, frame
+
+
+@case("panel_read", unit="entity-years", expected=1.0)
+def panel_read(scale):
+    import os
+    import tempfile
+    add_script_dir(f"{S2}/article-04-data-archaeology/panel.py")
+    import panel
+    _, _, frame = synthetic_panel(5 * scale)  # 500 countries x 1000 years at 100x
+    path = os.path.join(tempfile.gettempdir(), f"cogito-panel-x{scale}.csv")
+    frame.to_csv(path, index=False)
+    return len(frame), lambda: panel.read(path, "countrycode", "year", ["gdppc", "pop"])
+
+
+@case("panel_growth", unit="entity-years", expected=1.0)
+def panel_growth(scale):
+    add_script_dir(f"{S2}/article-04-data-archaeology/panel.py")
+    import panel
+    years, gdppc, _ = synthetic_panel(5 * scale)
+
+    def run():
+        panel.interval_growth(gdppc, years)
+        panel.cagr(gdppc, years, 1820, 1913)
+        panel.rolling_growth(gdppc, years, window=30)
+        panel.structural_break(gdppc, years)
+    return gdppc.size, run
+
+
+# ---------------------------------------------------------------------------
+# Series 1
+# ---------------------------------------------------------------------------
+@case("betweenness_sampled", unit="nodes", expected=1.0)
+def betweenness_sampled(scale):
+    import networkx as nx
+    add_script_dir(f"{S1}/article-01-florence/centrality.py")
+    import centrality
+    n = 1000 * scale  # 10^5 nodes at 100x
+    graph = centrality.to_csr(nx.barabasi_albert_graph(n, 3, seed=42))
+    # Fixed pivot count: cost per pivot is one BFS plus two triangular solves, O(m).
+    return n, lambda: centrality.betweenness_sample(graph, k=10, seed=42)
+
+
+@case("temporal_snapshot", unit="history events", expected=0.0)
+def temporal_snapshot(scale):
+    add_script_dir(f"{S1}/article-02-medici/temporal.py")
+    import temporal
+    # History grows with scale at a constant event rate; the measured window
+    # (the last 50 years, forward then back) does not.
+    years = 70 * scale
+    tg = temporal.synthetic_dynasty(50 * scale, (1200, 1200 + years), seed=42)
+    window = range(1200 + years - 50, 1200 + years)
+    tg.at(window[0] - 1)
+
+    def run():
+        for _ in tg.snapshots(window):
+            pass
+        tg.at(window[0] - 1)
+    return tg.history, run
+
+
+@case("darwin_selection", unit="population", expected=1.0)
+def darwin_selection(scale):
+    k = load_kernels(f"{S1}/article-11-darwin/darwin_analysis.py", "natural_selection")
+    n = 100 * scale
+
+    def run():
+        np.random.seed(42)
+        k.natural_selection(50, n, 0.6)
+    return n, run
+
+
+@case("centralities", unit="cities", expected=2.0)
+def centralities(scale):
+    import networkx as nx
+    n = 8 * scale
+    # Same mean degree as the 8-city Florence network (12 routes).
+    G = nx.gnm_random_graph(n, int(n * 1.5), seed=42)
+    rng = np.random.default_rng(42)
+    for u, v in G.edges():
+        G[u][v]["weight"] = int(rng.integers(4, 10))
+
+    def run():
+        nx.degree_centrality(G)
+        nx.betweenness_centrality(G)
+        nx.closeness_centrality(G)
+    return n, run
+
+
+# ---------------------------------------------------------------------------
+# README updater (.github/update_readme.py)
+# ---------------------------------------------------------------------------
+def synthetic_post_sitemap(n_posts: int, seed: int = 0) -> bytes:
+    """A Yoast-style post-sitemap: each post in ZH, /en/ and /ja/, with images."""
+    rng = np.random.default_rng(seed)
+    words = ["bank", "run", "medici", "florence", "steam", "cloud", "tulip",
+             "network", "revolution", "quantum", "printing", "darwin"]
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n'
+             '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+             'xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">']
+    for i in range(n_posts):
+        slug = "-".join(rng.choice(words, 4)) + f"-{i}"
+        for prefix in ("", "en/", "ja/"):
+            parts.append(
+                f"<url><loc>https://code-cogito.com/{prefix}{slug}/</loc>"
+                f"<lastmod>2025-01-01T00:00:00+00:00</lastmod>"
+                f"<image:image><image:loc>https://code-cogito.com/wp-content/"
+                f"uploads/{slug}.png</image:loc></image:image></url>"
+            )
+    parts.append("</urlset>")
+    return "".join(parts).encode("utf-8")
+
+
+@case("sitemap_parse", unit="sitemap URLs", expected=1.0)
+def sitemap_parse(scale):
+    updater = load_module(".github/update_readme.py")
+    n_posts = 334 * scale  # x3 locales: ~100k URLs at 100x
+    doc = synthetic_post_sitemap(n_posts)
+    chunk = updater.CHUNK_SIZE
+
+    def run():
+        chunks = (doc[i:i + chunk] for i in range(0, len(doc), chunk))
+        slugs = updater.parse_zh_slugs(chunks)
+        assert len(slugs) == n_posts
+    return 3 * n_posts, run
+
+
+@case("slug_match", unit="sitemap slugs", expected=1.0)
+def slug_match(scale):
+    import contextlib
+    import io
+    updater = load_module(".github/update_readme.py")
+    n_slugs, n_articles = 100 * scale, 5 * scale  # 10k slugs x 500 articles at 100x
+    rng = np.random.default_rng(0)
+    syllables = ["ba", "ko", "ri", "me", "tu", "la", "ven", "qua", "dro", "si",
+                 "pan", "te", "mu", "shi", "ro", "ca", "ni", "do", "gle", "fa"]
+    vocab = sorted({"".join(rng.choice(syllables, k)) for k in (2, 3, 3) for _ in range(700)})
+    slugs = ["-".join(rng.choice(vocab, 5)) + f"-{i}" for i in range(n_slugs)]
+    # Half the articles drifted from a real slug, half were never published.
+    articles = []
+    for i in range(n_articles):
+        words = slugs[i].split("-")[:4] if i % 2 else list(rng.choice(vocab, 4))
+        articles.append({"title": " ".join(words).title(), "slug": f"draft-{i}"})
+
+    def run():
+        candidates = updater.SlugIndex(slugs)
+        with contextlib.redirect_stdout(io.StringIO()):  # [DRIFT] notices
+            for article in articles:
+                slug = updater.resolve_slug(article, candidates)
+                if slug:
+                    candidates.discard(slug)
+    return n_slugs, run
+
+
+# ---------------------------------------------------------------------------
+# Shared tooling (cogito/)
+# ---------------------------------------------------------------------------
+@case("spring_layout_bh", unit="nodes", expected=1.0)
+def spring_layout_bh(scale):
+    import networkx as nx
+    from cogito import layout
+    n = 1000 * scale  # 10^5 nodes at 100x; networkx's O(n^2) gives up long before
+    G = nx.barabasi_albert_graph(n, 2, seed=42)
+    return n, lambda: layout.spring_layout(G, iterations=10, seed=42,
+                                           method="barnes_hut", cache=False)
+
+
+@case("edge_density", unit="edges", expected=1.0)
+def edge_density(scale):
+    from cogito import netdraw
+    # Random chords of a 3000-node circle, 10^5 edges per scale step: below
+    # ~10^5 edges the raster's fixed setup cost hides the per-edge work.
+    n, m = 3000, 100_000 * scale
+    rng = np.random.default_rng(0)
+    u = rng.integers(0, n, m)
+    v = (u + rng.integers(1, n, m)) % n
+    xy = netdraw.circle_positions(n)
+    return m, lambda: netdraw.edge_density(xy, u, v)
@@ -0,0 +1,83 @@
+"""
+Headless kernel loading from article scripts.
+
+The article scripts run their models at import time, so importing one would
+plot (and save) every figure. `load_kernels` instead parses the script and
+executes only its top-level imports plus the named function / class
+definitions, giving a module-like namespace with just the kernels.
+Import-safe sibling modules are imported normally once `add_script_dir`
+has put their directory on sys.path.
+"""
+
+import ast
+import importlib.util
+import os
+import sys
+import types
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_cache = {}
+
+
+def add_script_dir(script: str) -> Path:
+    """Put the directory of `script` (relative to the repo root) on sys.path.
+
+    Sibling modules then import as when the script is run with
+    `python script.py` from its own directory. Returns the directory.
+    """
+    directory = (REPO_ROOT / script).parent
+    if str(directory) not in sys.path:
+        sys.path.insert(0, str(directory))
+    return directory
+
+
+def load_kernels(script: str, *names: str) -> types.ModuleType:
+    """Return a namespace holding `names` defined at top level of `script`.
+
+    `script` is relative to the repository root. Raises LookupError if any
+    name is not a top-level `def` / `class` in the script.
+    """
+    key = (script, names)
+    if key in _cache:
+        return _cache[key]
+
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    path = REPO_ROOT / script
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+
+    wanted = set(names)
+    body = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            body.append(node)
+        elif isinstance(node, (ast.FunctionDef, ast.ClassDef)) and node.name in wanted:
+            body.append(node)
+            wanted.discard(node.name)
+    if wanted:
+        raise LookupError(f"{script}: no top-level definition of {sorted(wanted)}")
+
+    add_script_dir(script)  # the script's own sibling imports
+
+    module = types.ModuleType(f"kernels.{path.stem}")
+    module.__file__ = str(path)
+    code = compile(ast.Module(body=body, type_ignores=[]), str(path), "exec")
+    exec(code, module.__dict__)
+    _cache[key] = module
+    return module
+
+
+def load_module(script: str) -> types.ModuleType:
+    """Import an import-safe script (one that guards its entry point).
+
+    `script` is relative to the repository root; the module is cached.
+    """
+    if script in _cache:
+        return _cache[script]
+    path = REPO_ROOT / script
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _cache[script] = module
+    return module
@@ -0,0 +1,298 @@
+"""
+End-to-end harness for .github/update_readme.py against a local sitemap server.
+
+Generates a synthetic site -- registry, README tables and a Yoast-style
+sitemap tree (sitemap_index.xml + post-sitemapN.xml, every post in ZH, /en/
+and /ja/) -- serves it from an `http.server` thread on 127.0.0.1 and runs the
+updater's fetch -> match -> rewrite pipeline against it, offline.
+
+The server does HTTP/1.1 keep-alive and ETag / If-None-Match, and can inject
+latency, failures and missing shards. Each run reports wall time per phase,
+requests and connections seen by the server, bytes sent, 304s, and whether
+the README ended up linking exactly the articles that are live.
+
+Usage:
+    python -m benchmarks.readme_updater                          # 2,000 posts
+    python -m benchmarks.readme_updater --posts 50000 --articles 500
+    python -m benchmarks.readme_updater --latency 0.2 --slow 0.1 --fail-rate 0.05
+    python -m benchmarks.readme_updater --missing 2 --runs 3     # cache on runs 2+
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from benchmarks.loader import load_module
+
+UPDATER = ".github/update_readme.py"
+SITE = "https://code-cogito.com"
+URLS_PER_SHARD = 1000  # Yoast's default sitemap page size
+SYLLABLES = ("ba", "ko", "ri", "me", "tu", "la", "ven", "qua", "dro", "si",
+             "pan", "te", "mu", "shi", "ro", "ca", "ni", "do", "gle", "fa")
+
+
+# ---------------------------------------------------------------------------
+# Synthetic site
+# ---------------------------------------------------------------------------
+class Site:
+    """Posts, registry and README for one scenario (deterministic per seed)."""
+
+    def __init__(self, posts, articles, drift, unpublished, seed=0):
+        rng = random.Random(seed)
+        vocab = sorted({"".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+                        for _ in range(4000)})
+        vocab = [w for w in vocab if len(w) > 2]
+
+        def title_words():
+            return rng.sample(vocab, 5)
+
+        self.registry = {"base_url": SITE, "series": {}}
+        self.live = {}      # (series, num) -> slug actually published
+        self.slugs = []     # every published ZH slug, registry or not
+        per_series = 12
+        for i in range(articles):
+            series = f"series-{i // per_series + 1:02d}-synthetic"
+            num = f"{i % per_series + 1:02d}"
+            words = title_words()
+            slug = "-".join(words)
+            self.registry["series"].setdefault(series, {"articles": {}})
+            self.registry["series"][series]["articles"][num] = {
+                "title": " ".join(w.title() for w in words),
+                "slug": slug,
+                "code": f"article_{i}_analysis.py",
+                "code_path": f"./{series}/article-{num}/article_{i}_analysis.py",
+            }
+            roll = rng.random()
+            if roll < unpublished:
+                continue
+            if roll < unpublished + drift:
+                # Published under a slug decided at publish time.
+                slug = "-".join(rng.sample(words, 4)) + "-2"
+            self.live[(series, num)] = slug
+            self.slugs.append(slug)
+        while len(self.slugs) < posts:
+            self.slugs.append("-".join(title_words()) + f"-{len(self.slugs)}")
+        rng.shuffle(self.slugs)
+
+    def readme(self) -> str:
+        lines = ["# Synthetic README\n", "\n", "## Series\n", "\n"]
+        for key, data in self.registry["series"].items():
+            lines += [f"### [{key}](./{key})\n", "Intro paragraph.\n", "\n",
+                      "| # | Article | Code |\n", "|---|---------|------|\n"]
+            for num, a in data["articles"].items():
+                lines.append(f"| {num} | {a['title']} | [{a['code']}]({a['code_path']}) |\n")
+            lines.append("\n")
+        lines.append("## Footer\n")
+        return "".join(lines)
+
+    def shards(self) -> list:
+        """One sitemap document (bytes) per post-sitemap shard."""
+        entries = [f"{SITE}/{prefix}{slug}/" for slug in self.slugs
+                   for prefix in ("", "en/", "ja/")]
+        docs = []
+        for start in range(0, len(entries), URLS_PER_SHARD):
+            urls = "".join(f"<url><loc>{u}</loc><lastmod>2026-01-01T00:00:00+00:00</lastmod></url>"
+                           for u in entries[start:start + URLS_PER_SHARD])
+            docs.append(('<?xml version="1.0" encoding="UTF-8"?>\n'
+                         '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                         f"{urls}</urlset>").encode("utf-8"))
+        return docs
+
+
+# ---------------------------------------------------------------------------
+# Stand-in server
+# ---------------------------------------------------------------------------
+class SitemapServer:
+    """Serves a Site's sitemaps on 127.0.0.1 with injected faults."""
+
+    def __init__(self, site, latency=0.0, slow=0.0, fail_rate=0.0, missing=0, seed=0):
+        self.docs = {f"/post-sitemap{i + 1}.xml": doc for i, doc in enumerate(site.shards())}
+        rng = random.Random(seed)
+        shard_paths = sorted(self.docs)
+        self.missing = set(rng.sample(shard_paths, min(missing, len(shard_paths))))
+        self.slow = {p for p in shard_paths if rng.random() < slow}
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self._rng = rng
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+        harness = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                harness._handle(self)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.index_url = f"http://127.0.0.1:{self.httpd.server_port}/sitemap_index.xml"
+        self.docs["/sitemap_index.xml"] = self._index(shard_paths)
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def _index(self, shard_paths) -> bytes:
+        base = self.index_url.rsplit("/", 1)[0]
+        locs = [f"{base}/page-sitemap.xml"] + [base + p for p in shard_paths]
+        body = "".join(f"<sitemap><loc>{u}</loc></sitemap>" for u in locs)
+        return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                f"{body}</sitemapindex>").encode("utf-8")
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {"requests": 0, "not_modified": 0, "errors": 0, "bytes": 0,
+                          "connections": set()}
+
+    def _handle(self, req):
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["connections"].add(req.client_address)
+            fail = self._rng.random() < self.fail_rate
+        delay = self.latency * (10 if req.path in self.slow else 1)
+        if delay:
+            time.sleep(delay)
+        body = self.docs.get(req.path)
+        if body is None or req.path in self.missing or fail:
+            status = 500 if fail else 404
+            with self._lock:
+                self.stats["errors"] += 1
+            req.send_response(status)
+            req.send_header("Content-Length", "0")
+            req.end_headers()
+            return
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+        if req.headers.get("If-None-Match") == etag:
+            with self._lock:
+                self.stats["not_modified"] += 1
+            req.send_response(304)
+            req.send_header("ETag", etag)
+            req.send_header("Content-Length", "0")
+            req.end_headers()
+            return
+        req.send_response(200)
+        req.send_header("Content-Type", "application/xml; charset=UTF-8")
+        req.send_header("Content-Length", str(len(body)))
+        req.send_header("ETag", etag)
+        req.end_headers()
+        req.wfile.write(body)
+        with self._lock:
+            self.stats["bytes"] += len(body)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+# ---------------------------------------------------------------------------
+# Runs
+# ---------------------------------------------------------------------------
+def run_once(updater, site, server, workdir: Path, use_cache: bool, workers: int,
+             deadline: float, verbose: bool) -> dict:
+    readme_path = workdir / "README.md"
+    readme_path.write_text(site.readme(), encoding="utf-8")
+    cache = updater.SitemapCache(workdir / "sitemaps.json" if use_cache else None)
+    updater._pool = updater.ConnectionPool()  # a fresh process, as in the workflow
+    server.reset_stats()
+
+    log = io.StringIO()
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stdout if verbose else log):
+        slugs = updater.fetch_all_zh_slugs(server.index_url, deadline_s=deadline,
+                                           workers=workers, cache=cache)
+        cache.save()
+        t1 = time.perf_counter()
+        changes = updater.update_readme(site.registry, slugs, dry_run=False,
+                                        readme_path=readme_path)
+    t2 = time.perf_counter()
+
+    tables = updater.ReadmeTables(readme_path.read_text(encoding="utf-8"))
+    linked = {}
+    for key, data in site.registry["series"].items():
+        for num in data["articles"]:
+            m = updater.LINKED_URL.match(
+                updater.TABLE_ROW.match(tables.row(key, num)).group("title"))
+            if m:
+                linked[(key, num)] = m.group("url")[len(SITE) + 1:].strip("/")
+    stats = server.stats
+    return {
+        "fetch_s": t1 - t0,
+        "update_s": t2 - t1,
+        "slugs": len(slugs),
+        "changes": changes,
+        "correct": sum(1 for k, s in linked.items() if site.live.get(k) == s),
+        "wrong": sum(1 for k, s in linked.items() if site.live.get(k) != s),
+        "requests": stats["requests"],
+        "connections": len(stats["connections"]),
+        "not_modified": stats["not_modified"],
+        "errors": stats["errors"],
+        "bytes": stats["bytes"],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.readme_updater")
+    parser.add_argument("--posts", type=int, default=2000, help="published ZH posts")
+    parser.add_argument("--articles", type=int, default=120, help="registry articles")
+    parser.add_argument("--drift", type=float, default=0.2,
+                        help="share of articles published under a different slug")
+    parser.add_argument("--unpublished", type=float, default=0.3,
+                        help="share of registry articles not live yet")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds per response")
+    parser.add_argument("--slow", type=float, default=0.0,
+                        help="share of shards answering 10x slower")
+    parser.add_argument("--fail-rate", type=float, default=0.0,
+                        help="probability of a 500 per request")
+    parser.add_argument("--missing", type=int, default=0, help="shards answering 404")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="concurrent shard fetches (default: the updater's)")
+    parser.add_argument("--deadline", type=float, default=None,
+                        help="seconds for the sitemap walk (default: the updater's)")
+    parser.add_argument("--runs", type=int, default=2,
+                        help="runs sharing one cache (run 2+ are conditional)")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-v", "--verbose", action="store_true", help="show updater output")
+    args = parser.parse_args(argv)
+
+    updater = load_module(UPDATER)
+    workers = args.workers or updater.MAX_WORKERS
+    deadline = args.deadline or updater.DEADLINE
+    t = time.perf_counter()
+    site = Site(args.posts, args.articles, args.drift, args.unpublished, args.seed)
+    n_live = len(site.live)
+    with SitemapServer(site, args.latency, args.slow, args.fail_rate, args.missing,
+                       args.seed) as server:
+        print(f"site: {args.posts:,} posts in {len(server.docs) - 1} shards, "
+              f"{args.articles} registry articles ({n_live} live), "
+              f"generated in {time.perf_counter() - t:.2f}s")
+        print(f"{'run':>3} {'fetch':>8} {'update':>8} {'requests':>9} {'conns':>6} "
+              f"{'304':>5} {'errors':>7} {'KB sent':>9} {'slugs':>7} {'linked':>7} {'wrong':>6}")
+        with tempfile.TemporaryDirectory(prefix="cogito-readme-") as tmp:
+            for run in range(1, args.runs + 1):
+                r = run_once(updater, site, server, Path(tmp), not args.no_cache,
+                             workers, deadline, args.verbose)
+                print(f"{run:>3} {r['fetch_s']:7.2f}s {r['update_s']:7.2f}s "
+                      f"{r['requests']:>9} {r['connections']:>6} {r['not_modified']:>5} "
+                      f"{r['errors']:>7} {r['bytes'] / 1024:9.1f} {r['slugs']:>7,} "
+                      f"{r['correct']:>3}/{n_live:<3} {r['wrong']:>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Wall-time comparison of the render profiles over every article script.
+
+Each script runs in a fresh interpreter, once per profile, with its output
+redirected to a temporary directory so committed PNGs are left untouched.
+
+Usage:
+    python -m benchmarks.render_profiles                  # all scripts
+    python -m benchmarks.render_profiles "series-06-*"    # glob on script path
+"""
+
+import argparse
+import fnmatch
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PROFILES = ("production", "draft")
+
+
+def article_scripts():
+    return sorted(REPO_ROOT.glob("series-*/article-*/*_analysis.py"))
+
+
+def time_script(script: Path, profile: str, out_dir: str) -> tuple:
+    env = dict(os.environ, COGITO_RENDER=profile, COGITO_OUTPUT_DIR=out_dir,
+               MPLBACKEND="Agg")
+    t = time.perf_counter()
+    proc = subprocess.run([sys.executable, script.name], cwd=script.parent, env=env,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - t
+    if proc.returncode != 0:
+        print(proc.stderr[-2000:], file=sys.stderr)
+    return elapsed, proc.returncode == 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.render_profiles")
+    parser.add_argument("patterns", nargs="*", help="globs on the script's repo path")
+    args = parser.parse_args(argv)
+
+    scripts = [s for s in article_scripts()
+               if not args.patterns or any(
+                   fnmatch.fnmatch(s.relative_to(REPO_ROOT).as_posix(), p)
+                   for p in args.patterns)]
+    totals = dict.fromkeys(PROFILES, 0.0)
+    failed = []
+    print(f"{'script':<48} {'production':>11} {'draft':>8} {'speedup':>8}")
+    with tempfile.TemporaryDirectory(prefix="cogito-render-") as tmp:
+        for script in scripts:
+            row = {}
+            for profile in PROFILES:
+                row[profile], ok = time_script(script, profile, tmp)
+                totals[profile] += row[profile]
+                if not ok:
+                    failed.append(f"{script.name} ({profile})")
+            speedup = row["production"] / row["draft"] if row["draft"] else float("nan")
+            print(f"{script.name[:48]:<48} {row['production']:10.2f}s "
+                  f"{row['draft']:7.2f}s {speedup:7.1f}x", flush=True)
+    speedup = totals["production"] / totals["draft"] if totals["draft"] else float("nan")
+    print("-" * 78)
+    print(f"{'TOTAL (' + str(len(scripts)) + ' scripts)':<48} {totals['production']:10.2f}s "
+          f"{totals['draft']:7.2f}s {speedup:7.1f}x")
+    if failed:
+        print(f"\nFAILED: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
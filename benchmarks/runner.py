@@ -0,0 +1,269 @@
+"""
+Benchmark runner: timing, memory, complexity fit and baseline comparison.
+
+Baselines are only comparable on the machine that recorded them, so every
+run also times a fixed calibration kernel, before each case, and keeps the
+best of those times. The baseline file stores it alongside the case
+timings, and a comparison first rescales the baseline by the ratio of the
+two calibrations. A machine twice as slow overall then shows no
+regression; one kernel getting slower still does.
+
+Timings are the best of several runs after a warm-up run, which is far
+steadier than the mean or median on a shared machine.
+"""
+
+import argparse
+import fnmatch
+import heapq
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.cases import CASES, QUICK_SCALES
+
+BASELINE_PATH = Path(__file__).parent / "baselines.json"
+MIN_REPEATS = 3     # timed runs of a size after the warm-up, at least...
+MIN_TIME = 2.0      # ...and more until this much time is spent (outlasting a busy spell)...
+MAX_REPEATS = 50    # ...or this many runs are done
+SLOW = 5.0          # seconds; a first run this long is the timing (it amortises its warm-up)
+RECHECKS = 4        # apparent regressions are re-timed this many times before they count
+NOISE_FLOOR = 0.02  # seconds; smaller absolute slowdowns never count (timer and
+                    # scheduler jitter on a ms-scale case easily exceeds 25%)
+
+
+def time_it(run) -> float:
+    """Best wall time of `run` over repeats that follow one warm-up run."""
+    t = time.perf_counter()
+    run()  # warm-up: lazily-initialised code paths, caches, page faults
+    warm = time.perf_counter() - t
+    if warm >= SLOW:
+        return warm
+    samples = []
+    spent = 0.0
+    while len(samples) < MIN_REPEATS or (spent < MIN_TIME and len(samples) < MAX_REPEATS):
+        t = time.perf_counter()
+        run()
+        dt = time.perf_counter() - t
+        samples.append(dt)
+        spent += dt
+    return min(samples)
+
+
+def peak_memory(run) -> int:
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def calibrate(repeats: int = 15) -> float:
+    """Best time of a fixed mix of interpreter-bound and NumPy work.
+
+    The kernels are a blend of the two (event loops and dict/heap updates
+    next to vectorised array passes), so the ratio between two machines'
+    calibrations is a fair first-order scale for their timings. The best
+    of several runs is far steadier than the median on a busy machine.
+    """
+    a = np.random.default_rng(0).random(1 << 18)
+
+    def run():
+        heap = []
+        for i in range(20_000):
+            heapq.heappush(heap, (i * 7919) % 10_007)
+        while heap:
+            heapq.heappop(heap)
+        np.sort(a)
+        np.sqrt(a * a + 1.0).sum()
+
+    run()  # warm-up
+    best = float("inf")
+    for _ in range(repeats):
+        t = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def fit_exponent(sizes, values):
+    """Slope of log(value) vs log(size): the empirical complexity exponent."""
+    pts = [(s, v) for s, v in zip(sizes, values) if v and v > 0]
+    if len(pts) < 2:
+        return None
+    x = np.log([p[0] for p in pts])
+    y = np.log([p[1] for p in pts])
+    return float(np.polyfit(x, y, 1)[0])
+
+
+def run_case(c, scales, memory: bool) -> dict:
+    rows = []
+    for scale in scales:
+        size, run = c.setup(scale)
+        seconds = time_it(run)
+        row = {"scale": scale, "size": size, "seconds": seconds}
+        if memory:
+            size, run = c.setup(scale)
+            row["peak_mem_bytes"] = peak_memory(run)
+        rows.append(row)
+        print(f"  {c.name:<18} x{scale:<4} {c.unit:<18} {size:>9,}  "
+              f"{seconds * 1e3:10.2f} ms"
+              + (f"  {row['peak_mem_bytes'] / 1e6:8.2f} MB" if memory else ""),
+              flush=True)
+    sizes = [r["size"] for r in rows]
+    result = {
+        "unit": c.unit,
+        "expected_exponent": c.expected,
+        "time_exponent": fit_exponent(sizes, [r["seconds"] for r in rows]),
+        "sizes": rows,
+    }
+    if memory:
+        result["memory_exponent"] = fit_exponent(sizes, [r["peak_mem_bytes"] for r in rows])
+    return result
+
+
+def speed_ratio(baseline: dict, calibration: float) -> float:
+    """This machine's calibration time over the baseline's (1.0 if unknown)."""
+    old = baseline.get("calibration")
+    return calibration / old if old else 1.0
+
+
+def compare(results: dict, baseline: dict, threshold: float, ratio: float = 1.0) -> list:
+    """Return (case, scale, old, new) for every size slower than allowed.
+
+    `old` is the baseline timing rescaled to this machine by `ratio`.
+    """
+    regressions = []
+    for name, res in results.items():
+        base_case = baseline.get("cases", {}).get(name, {})
+        for row in res["sizes"]:
+            old = base_case.get(str(row["scale"]))
+            new = row["seconds"]
+            if old is None:
+                continue
+            old *= ratio
+            if new > old * (1 + threshold) and new - old > NOISE_FLOOR:
+                regressions.append((name, row["scale"], old, new))
+    return regressions
+
+
+def recheck(results: dict, regressions: list) -> None:
+    """Re-time the regressed sizes, keeping each one's best time so far.
+
+    A busy spell on a shared machine can outlast all the repeats of a size;
+    a genuine slowdown is still there when the size is timed again.
+    """
+    for name, scale, _, _ in regressions:
+        row = next(r for r in results[name]["sizes"] if r["scale"] == scale)
+        _, run = CASES[name].setup(scale)
+        row["seconds"] = min(row["seconds"], time_it(run))
+
+
+def baseline_from(results: dict, previous: dict, calibration: float) -> dict:
+    # Cases kept from the previous file are rescaled to this run's calibration.
+    ratio = speed_ratio(previous, calibration)
+    cases = {name: {scale: round(t * ratio, 6) for scale, t in sizes.items()}
+             for name, sizes in previous.get("cases", {}).items()}
+    for name, res in results.items():
+        cases[name] = {str(r["scale"]): round(r["seconds"], 6) for r in res["sizes"]}
+    return {
+        "machine": platform.platform(),
+        "python": platform.python_version(),
+        "calibration": round(calibration, 6),
+        "cases": dict(sorted(cases.items())),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Benchmark the article simulation kernels.")
+    parser.add_argument("patterns", nargs="*",
+                        help="case names or globs (default: all); see --list")
+    parser.add_argument("--list", action="store_true", help="list cases and exit")
+    parser.add_argument("--quick", action="store_true",
+                        help=f"only scales {QUICK_SCALES} (skips the 100x sizes)")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc pass")
+    parser.add_argument("--out", help="write full results JSON here")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH),
+                        help="baseline file (default: benchmarks/baselines.json)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="merge this run's timings into the baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown vs baseline before failing (default 0.25)")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for c in CASES.values():
+            print(f"{c.name:<18} scales {c.scales}  ({c.unit}, expected n^{c.expected:g})")
+        return 0
+
+    patterns = args.patterns or ["*"]
+    selected = [c for c in CASES.values()
+                if any(fnmatch.fnmatch(c.name, p) for p in patterns)]
+    if not selected:
+        print(f"No case matches {patterns}; see --list", file=sys.stderr)
+        return 2
+
+    print(f"Benchmarking {len(selected)} kernel(s) on Python {platform.python_version()}")
+    calibration = float("inf")
+    results = {}
+    for c in selected:
+        calibration = min(calibration, calibrate())
+        scales = [s for s in c.scales if s in QUICK_SCALES] if args.quick else c.scales
+        results[c.name] = run_case(c, scales, memory=not args.no_memory)
+
+    print(f"\n{'case':<18} {'time exp':>9} {'expected':>9} {'mem exp':>8}")
+    for name, res in results.items():
+        te, me = res["time_exponent"], res.get("memory_exponent")
+        print(f"{name:<18} {te if te is not None else float('nan'):9.2f} "
+              f"{res['expected_exponent']:9.2f} "
+              f"{me if me is not None else float('nan'):8.2f}")
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    baseline = {}
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+
+    if args.save_baseline:
+        baseline_path.write_text(
+            json.dumps(baseline_from(results, baseline, calibration), indent=2) + "\n",
+            encoding="utf-8")
+        print(f"\nBaseline written: {baseline_path}")
+        return 0
+
+    if not baseline:
+        print("\nNo baseline yet; run with --save-baseline to create one.")
+        return 0
+    ratio = speed_ratio(baseline, calibration)
+    if "calibration" in baseline:
+        print(f"\nCalibration {calibration * 1e3:.2f} ms vs {baseline['calibration'] * 1e3:.2f} ms "
+              f"in the baseline: baseline timings scaled x{ratio:.2f}")
+    else:
+        print("\nBaseline has no calibration; comparing absolute timings "
+              "(re-save it with --save-baseline).")
+    regressions = compare(results, baseline, args.threshold, ratio)
+    for attempt in range(RECHECKS):
+        if not regressions:
+            break
+        print(f"\nRe-timing {len(regressions)} apparent regression(s) "
+              f"({attempt + 1}/{RECHECKS})...", flush=True)
+        recheck(results, regressions)
+        calibration = min(calibration, calibrate())
+        ratio = speed_ratio(baseline, calibration)
+        regressions = compare(results, baseline, args.threshold, ratio)
+    if regressions:
+        print(f"\nREGRESSIONS (> {args.threshold:.0%} slower than baseline):")
+        for name, scale, old, new in regressions:
+            print(f"  {name} x{scale}: {old * 1e3:.2f} ms (scaled) -> {new * 1e3:.2f} ms "
+                  f"({(new - old) / old:+.0%})")
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:.0%} vs {baseline_path.name}.")
+    return 0
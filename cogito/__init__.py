@@ -0,0 +1,15 @@
+"""
+Shared tooling for the Code & Cogito article scripts.
+
+Article scripts import what they need after putting the repository root on
+`sys.path`; the rest is opt-in tooling for running and profiling them.
+
+Modules:
+    cache       -- shared on-disk cache locations and input hashing
+    instrument  -- per-model timing / memory / cProfile reports
+    layout      -- cached spring layouts, Barnes-Hut for large graphs
+    netdraw     -- dense-graph edges as one LineCollection or a density raster
+    render      -- draft vs production render profiles (COGITO_RENDER)
+    output      -- background PNG / WebP encoding (COGITO_ASYNC_SAVE)
+    style       -- shared font bootstrap with a cached CJK font resolution
+"""
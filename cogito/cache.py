@@ -0,0 +1,51 @@
+"""
+On-disk cache locations and input hashing shared by the tooling.
+
+Caches are derived data only: deleting the directory is always safe.
+
+Environment:
+    COGITO_CACHE_DIR   -- root for every cache
+                          (default $XDG_CACHE_HOME/code-cogito or ~/.cache/code-cogito)
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+
+
+def cache_root() -> Path:
+    env = os.environ.get("COGITO_CACHE_DIR")
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "code-cogito"
+
+
+def cache_dir(name: str) -> Path:
+    """`<cache root>/<name>`, created on first use."""
+    path = cache_root() / name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def input_key(*parts) -> str:
+    """Stable hex digest of arrays, strings and plain values.
+
+    Arrays hash their dtype, shape and values in C order. A different dtype
+    (a float32 copy of a float64 array) or shape gets a different key; a
+    Fortran-ordered or strided copy of the same values gets the same one.
+    """
+    h = hashlib.sha1()
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            part = np.ascontiguousarray(part)
+            h.update(f"ndarray:{part.dtype.str}:{part.shape}:".encode())
+            h.update(part.tobytes())
+        elif isinstance(part, bytes):
+            h.update(b"bytes:" + part)
+        else:
+            h.update(f"{type(part).__name__}:{part!r}".encode())
+        h.update(b"\0")
+    return h.hexdigest()
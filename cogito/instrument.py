@@ -0,0 +1,472 @@
+"""
+Opt-in per-model instrumentation for the article scripts.
+
+Every article script is a sequence of MODEL blocks that each end in exactly
+one `savefig`. This module runs a script unmodified, splits its wall time at
+those savefig calls and attributes each block's time to three phases:
+
+    compute -- everything that isn't layout or render (the model math)
+    layout  -- graph layouts (`nx.*_layout`) and figure layout (`tight_layout`)
+    render  -- `Figure.savefig` (Agg rasterisation + PNG encoding)
+
+Peak memory per block comes from `tracemalloc`; `--cprofile` additionally
+wraps every block in its own `cProfile.Profile`. The result is a JSON report
+with a stable layout so two runs (e.g. two commits) can be diffed.
+
+Usage:
+    python -m cogito.instrument run path/to/script.py
+    python -m cogito.instrument run --cprofile --out before.json script.py
+    python -m cogito.instrument diff before.json after.json
+"""
+
+import argparse
+import cProfile
+import json
+import os
+import platform
+import pstats
+import runpy
+import subprocess
+import sys
+import time
+import tracemalloc
+import traceback
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+REPORT_VERSION = 1
+
+# networkx layout functions that get attributed to the layout phase. Both the
+# top-level alias (`nx.spring_layout`) and the defining module are patched so
+# `nx.draw(G)` without `pos=` is caught too.
+NX_LAYOUTS = (
+    "spring_layout", "fruchterman_reingold_layout", "kamada_kawai_layout",
+    "circular_layout", "shell_layout", "spectral_layout", "random_layout",
+    "planar_layout", "spiral_layout",
+)
+
+_active = None
+
+
+def active():
+    """Return the installed Instrument, or None when profiling is off."""
+    return _active
+
+
+# ---------------------------------------------------------------------------
+# Blocks
+# ---------------------------------------------------------------------------
+class Block:
+    """Timing record for one MODEL block (start of model → its savefig)."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.start = time.perf_counter()
+        self.layout = 0.0
+        self.render = 0.0
+        self.layout_detail = {}
+        self.profiler = None
+
+    def add(self, phase: str, label: str, elapsed: float):
+        if phase == "layout":
+            self.layout += elapsed
+            self.layout_detail[label] = self.layout_detail.get(label, 0.0) + elapsed
+        else:
+            self.render += elapsed
+
+
+class Instrument:
+    """Patches matplotlib / networkx entry points and records MODEL blocks."""
+
+    def __init__(self, cprofile: bool = False, trace_memory: bool = True,
+                 top: int = 15, cprofile_dir=None):
+        self.cprofile = cprofile
+        self.trace_memory = trace_memory
+        self.top = top
+        self.cprofile_dir = Path(cprofile_dir) if cprofile_dir else None
+        self.blocks = []
+        self._block = None
+        self._depth = 0
+        self._patches = []
+        self._t0 = None
+
+    # -- patching ----------------------------------------------------------
+    def _timed(self, phase: str, label: str, func):
+        def wrapper(*args, **kwargs):
+            # Only the outermost timed call counts: savefig(bbox_inches=
+            # 'tight') triggers layout internally and must not be counted twice.
+            if self._depth or self._block is None:
+                return func(*args, **kwargs)
+            self._depth += 1
+            t = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._depth -= 1
+                self._block.add(phase, label, time.perf_counter() - t)
+        wrapper.__wrapped__ = func
+        wrapper.__name__ = getattr(func, "__name__", label)
+        wrapper.__doc__ = getattr(func, "__doc__", None)
+        return wrapper
+
+    def _patch(self, owner, attr: str, replacement):
+        self._patches.append((owner, attr, getattr(owner, attr)))
+        setattr(owner, attr, replacement)
+
+    def install(self):
+        global _active
+        from matplotlib.figure import Figure
+
+        orig_savefig = Figure.savefig
+        timed_savefig = self._timed("render", "savefig", orig_savefig)
+
+        def savefig(fig, fname, *args, **kwargs):
+            result = timed_savefig(fig, fname, *args, **kwargs)
+            if not self._depth:
+                self.end_block(_figure_name(fname))
+            return result
+
+        self._patch(Figure, "savefig", savefig)
+        self._patch(Figure, "tight_layout",
+                    self._timed("layout", "tight_layout", Figure.tight_layout))
+
+        try:
+            import networkx as nx
+            from networkx.drawing import layout as nx_layout
+        except ImportError:
+            nx = None
+        if nx is not None:
+            for name in NX_LAYOUTS:
+                orig = getattr(nx_layout, name, None)
+                if orig is None:
+                    continue
+                timed = self._timed("layout", name, orig)
+                for owner in (nx, nx.drawing, nx_layout):
+                    if getattr(owner, name, None) is orig:
+                        self._patch(owner, name, timed)
+
+        # Cached layouts count as layout time too, hit or miss.
+        from cogito import layout as cogito_layout
+        self._patch(cogito_layout, "spring_layout",
+                    self._timed("layout", "cogito.spring_layout", cogito_layout.spring_layout))
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._t0 = time.perf_counter()
+        _active = self
+        self._start_block()
+
+    def uninstall(self):
+        global _active
+        for owner, attr, orig in reversed(self._patches):
+            setattr(owner, attr, orig)
+        self._patches.clear()
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        _active = None
+
+    # -- blocks ------------------------------------------------------------
+    def _start_block(self):
+        self._block = Block(len(self.blocks) + 1)
+        # reset_peak() is 3.9+; on 3.8 peaks are cumulative across blocks.
+        if self.trace_memory and hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        if self.cprofile:
+            self._block.profiler = cProfile.Profile()
+            self._block.profiler.enable()
+
+    def end_block(self, name: str):
+        """Close the current block under `name` and start the next one."""
+        block = self._block
+        if block is None:
+            return
+        end = time.perf_counter()
+        if block.profiler is not None:
+            block.profiler.disable()
+        wall = end - block.start
+        record = {
+            "index": block.index,
+            "name": self._unique_name(name),
+            "wall_s": wall,
+            "compute_s": max(wall - block.layout - block.render, 0.0),
+            "layout_s": block.layout,
+            "render_s": block.render,
+            "layout_detail": dict(sorted(block.layout_detail.items())),
+        }
+        if self.trace_memory and tracemalloc.is_tracing():
+            record["peak_mem_bytes"] = tracemalloc.get_traced_memory()[1]
+        if block.profiler is not None:
+            record["profile"] = _top_functions(block.profiler, self.top)
+            if self.cprofile_dir is not None:
+                self.cprofile_dir.mkdir(parents=True, exist_ok=True)
+                stem = f"{block.index:02d}_{Path(record['name']).stem}"
+                block.profiler.dump_stats(str(self.cprofile_dir / f"{stem}.prof"))
+        self.blocks.append(record)
+        self._start_block()
+
+    def finish(self):
+        """Close the trailing block (code after the last savefig)."""
+        self.end_block("(tail)")
+        if self._block is not None and self._block.profiler is not None:
+            self._block.profiler.disable()
+        self._block = None
+
+    def _unique_name(self, name: str) -> str:
+        taken = {b["name"] for b in self.blocks}
+        if name not in taken:
+            return name
+        n = 2
+        while f"{name}#{n}" in taken:
+            n += 1
+        return f"{name}#{n}"
+
+    def report(self, script) -> dict:
+        total = time.perf_counter() - self._t0 if self._t0 else 0.0
+        return {
+            "version": REPORT_VERSION,
+            "script": _display_path(Path(script)),
+            "commit": _git_commit(),
+            "environment": _environment(),
+            "trace_memory": self.trace_memory,
+            "cprofile": self.cprofile,
+            "total_s": total,
+            "phases_s": {
+                phase: sum(b[f"{phase}_s"] for b in self.blocks)
+                for phase in ("compute", "layout", "render")
+            },
+            "blocks": self.blocks,
+        }
+
+
+def _figure_name(fname) -> str:
+    # File objects (including cogito.output's RGBA sink) carry their target
+    # in `.name`.
+    fname = getattr(fname, "name", fname)
+    try:
+        return Path(os.fspath(fname)).name
+    except TypeError:
+        return f"<{type(fname).__name__}>"
+
+
+def _display_path(path: Path) -> str:
+    path = path.resolve()
+    try:
+        return path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _short_filename(filename: str) -> str:
+    # Keep profile keys machine-independent so reports diff cleanly.
+    marker = "site-packages" + os.sep
+    if marker in filename:
+        return filename.split(marker, 1)[1]
+    if filename.startswith("~") or filename.startswith("<"):
+        return filename
+    return _display_path(Path(filename))
+
+
+def _is_harness_frame(filename: str, func: str) -> bool:
+    # runpy / exec / the script's own <module> frame wrap every block and
+    # would otherwise fill the top of a cumulative-time listing.
+    return (filename == __file__ or filename.startswith("<frozen runpy")
+            or func in ("<module>", "<built-in method builtins.exec>"))
+
+
+def _top_functions(profiler: cProfile.Profile, n: int) -> list:
+    stats = pstats.Stats(profiler).stats
+    rows = [kv for kv in stats.items() if not _is_harness_frame(kv[0][0], kv[0][2])]
+    rows = sorted(rows, key=lambda kv: kv[1][3], reverse=True)[:n]
+    out = []
+    for (filename, line, func), (cc, nc, tt, ct, _) in rows:
+        out.append({
+            "function": f"{_short_filename(filename)}:{line}({func})",
+            "ncalls": nc,
+            "tottime_s": tt,
+            "cumtime_s": ct,
+        })
+    return out
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+            capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _environment() -> dict:
+    env = {"python": platform.python_version(), "platform": platform.platform()}
+    for mod in ("numpy", "matplotlib", "networkx", "scipy"):
+        m = sys.modules.get(mod)
+        if m is not None:
+            env[mod] = getattr(m, "__version__", "?")
+    return env
+
+
+def _rounded(obj, digits: int = 4):
+    if isinstance(obj, float):
+        return round(obj, digits)
+    if isinstance(obj, dict):
+        return {k: _rounded(v, digits) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_rounded(v, digits) for v in obj]
+    return obj
+
+
+def write_report(report: dict, path: Path):
+    path.write_text(json.dumps(_rounded(report), indent=2) + "\n", encoding="utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Running a script
+# ---------------------------------------------------------------------------
+def run_script(script, argv=(), instrument=None) -> tuple:
+    """Execute `script` as __main__ under `instrument`.
+
+    The script runs from its own directory (as the article READMEs instruct),
+    so its PNGs land next to it. Returns (report, exit_code).
+    """
+    script = Path(script).resolve()
+    instrument = instrument or Instrument()
+    os.environ.setdefault("MPLBACKEND", "Agg")
+
+    old_cwd, old_argv, old_path = os.getcwd(), sys.argv, list(sys.path)
+    os.chdir(script.parent)
+    sys.argv = [str(script), *argv]
+    sys.path.insert(0, str(script.parent))
+    code = 0
+    error = None
+    instrument.install()
+    try:
+        runpy.run_path(str(script), run_name="__main__")
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        error = traceback.format_exc()
+        code = 1
+    finally:
+        output = sys.modules.get("cogito.output")
+        if output is not None:
+            try:
+                output.flush()  # background writes belong to the tail block
+            except Exception:
+                error = error or traceback.format_exc()
+                code = code or 1
+        instrument.finish()
+        instrument.uninstall()
+        os.chdir(old_cwd)
+        sys.argv = old_argv
+        sys.path[:] = old_path
+
+    report = instrument.report(script)
+    report["exit_code"] = code
+    if error:
+        report["error"] = error
+    return report, code
+
+
+# ---------------------------------------------------------------------------
+# Diffing two reports
+# ---------------------------------------------------------------------------
+def _pct(old: float, new: float) -> str:
+    if not old:
+        return "   n/a"
+    return f"{(new - old) / old * 100:+6.1f}%"
+
+
+def diff_reports(old: dict, new: dict) -> str:
+    """Per-block wall/phase deltas between two reports, as a text table."""
+    lines = [f"{old.get('script')}  {old.get('commit')} -> {new.get('commit')}"]
+    header = f"{'block':<36} {'wall old':>9} {'wall new':>9} {'delta':>7}  " \
+             f"{'compute':>8} {'layout':>8} {'render':>8} {'peak MB':>8}"
+    lines.append(header)
+    lines.append("-" * len(header))
+    old_blocks = {b["name"]: b for b in old.get("blocks", [])}
+    for b in new.get("blocks", []):
+        o = old_blocks.pop(b["name"], None)
+        ow = o["wall_s"] if o else 0.0
+        phases = "".join(
+            f" {b[f'{p}_s'] - (o[f'{p}_s'] if o else 0.0):+8.3f}"
+            for p in ("compute", "layout", "render")
+        )
+        mem = b.get("peak_mem_bytes")
+        mem_s = f"{mem / 1e6:8.1f}" if mem is not None else f"{'-':>8}"
+        lines.append(f"{b['name'][:36]:<36} {ow:9.3f} {b['wall_s']:9.3f} "
+                     f"{_pct(ow, b['wall_s'])} {phases} {mem_s}")
+    for name, o in old_blocks.items():
+        lines.append(f"{name[:36]:<36} {o['wall_s']:9.3f} {'(gone)':>9}")
+    lines.append("-" * len(header))
+    lines.append(f"{'TOTAL':<36} {old['total_s']:9.3f} {new['total_s']:9.3f} "
+                 f"{_pct(old['total_s'], new['total_s'])}")
+    return "\n".join(lines)
+
+
+def summary(report: dict) -> str:
+    lines = [f"{'block':<36} {'wall':>8} {'compute':>8} {'layout':>8} {'render':>8} {'peak MB':>8}"]
+    for b in report["blocks"]:
+        mem = b.get("peak_mem_bytes")
+        mem_s = f"{mem / 1e6:8.1f}" if mem is not None else f"{'-':>8}"
+        lines.append(f"{b['name'][:36]:<36} {b['wall_s']:8.3f} {b['compute_s']:8.3f} "
+                     f"{b['layout_s']:8.3f} {b['render_s']:8.3f} {mem_s}")
+    p = report["phases_s"]
+    lines.append(f"{'TOTAL':<36} {report['total_s']:8.3f} {p['compute']:8.3f} "
+                 f"{p['layout']:8.3f} {p['render']:8.3f}")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m cogito.instrument",
+        description="Per-model timing, memory and cProfile reports for article scripts.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="run a script under instrumentation")
+    run_p.add_argument("script")
+    run_p.add_argument("script_args", nargs=argparse.REMAINDER)
+    run_p.add_argument("--out", help="report path (default: <script>.profile.json)")
+    run_p.add_argument("--cprofile", action="store_true",
+                       help="wrap every block in cProfile and keep its top functions")
+    run_p.add_argument("--cprofile-dir", help="also dump per-block .prof files here")
+    run_p.add_argument("--top", type=int, default=15,
+                       help="functions kept per block with --cprofile (default 15)")
+    run_p.add_argument("--no-memory", action="store_true",
+                       help="skip tracemalloc (it slows allocation-heavy code)")
+
+    diff_p = sub.add_parser("diff", help="compare two reports block by block")
+    diff_p.add_argument("old")
+    diff_p.add_argument("new")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "diff":
+        old = json.loads(Path(args.old).read_text(encoding="utf-8"))
+        new = json.loads(Path(args.new).read_text(encoding="utf-8"))
+        print(diff_reports(old, new))
+        return 0
+
+    out = Path(args.out) if args.out else Path(f"{Path(args.script).stem}.profile.json")
+    out = out.resolve()
+    instrument = Instrument(cprofile=args.cprofile, trace_memory=not args.no_memory,
+                            top=args.top, cprofile_dir=args.cprofile_dir and
+                            Path(args.cprofile_dir).resolve())
+    report, code = run_script(args.script, args.script_args, instrument)
+    write_report(report, out)
+    print("\n" + "=" * 60, file=sys.stderr)
+    print(summary(report), file=sys.stderr)
+    print(f"Report: {out}", file=sys.stderr)
+    if report.get("error"):
+        print(report["error"], file=sys.stderr)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Pipelined figure output: rasterise on the main thread, encode in the background.
+
+`plt.savefig(..., 'x.png')` spends most of its time in two steps: Agg
+rasterisation (must stay on the main thread, it walks the artist tree) and
+PNG deflate (doesn't touch the figure at all). The output stage does the
+first step, copies the RGBA buffer, and hands it to a thread pool that
+encodes and writes the file (PIL releases the GIL while compressing), so
+the script can move on to its next model.
+
+Enabled through `render.savefig` by the environment:
+    COGITO_ASYNC_SAVE=1     -- encode/write in background threads
+    COGITO_SAVE_WORKERS=N   -- pool size (default: min(4, CPU count))
+    COGITO_WEBP=1           -- also write <name>.webp next to each PNG
+    COGITO_WEBP_QUALITY=Q   -- WebP quality 1-100 (default 80)
+
+`flush()` is the barrier: it waits for every pending write and re-raises
+the first failure. It runs automatically at interpreter exit.
+"""
+
+import atexit
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+RASTER_SUFFIXES = {".png"}
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class _RGBASink(io.RawIOBase):
+    """Write target for format='rgba' that keeps the Agg buffer as an array.
+
+    Agg hands `write()` its (H, W, 4) memoryview, so the copy keeps the
+    frame shape -- no need to re-derive the size bbox_inches='tight' chose.
+    """
+
+    def __init__(self, name: str):
+        super().__init__()
+        self.name = name  # what instrument reports as the block name
+        self.frame = None
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.frame = np.array(b, dtype=np.uint8, copy=True)
+        return self.frame.nbytes
+
+
+def rasterize(fig, name: str, dpi=None, **kwargs):
+    """Render `fig` with Agg exactly as savefig would; return (H, W, 4) uint8."""
+    dpi = fig.dpi if dpi in (None, "figure") else dpi
+    sink = _RGBASink(name)
+    fig.savefig(sink, format="rgba", dpi=dpi, **kwargs)
+    if sink.frame is None or sink.frame.ndim != 3:
+        raise ValueError(f"{name}: backend did not return an RGBA frame")
+    return sink.frame, dpi
+
+
+def encode(rgba, path: Path, dpi, webp_quality=None):
+    """Write `rgba` as PNG (byte-compatible with matplotlib's own writer)."""
+    import matplotlib.image as mimage
+    mimage.imsave(path, rgba, format="png", origin="upper", dpi=dpi)
+    if webp_quality is not None:
+        from PIL import Image
+        Image.fromarray(rgba, "RGBA").save(path.with_suffix(".webp"), "WEBP",
+                                           quality=webp_quality, method=4)
+
+
+class OutputStage:
+    """Thread pool of PNG/WebP writers with bounded in-flight buffers."""
+
+    def __init__(self, workers=None, webp_quality=None, asynchronous=True):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.webp_quality = webp_quality
+        self.asynchronous = asynchronous
+        # A 300-dpi 22x7in figure is ~55 MB of RGBA; cap what's queued.
+        self._slots = threading.BoundedSemaphore(self.workers * 2)
+        self._pool = None
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def submit(self, fig, fname, **savefig_kwargs):
+        path = Path(fname)
+        if path.suffix.lower() not in RASTER_SUFFIXES:
+            fig.savefig(path, **savefig_kwargs)
+            return
+        try:
+            rgba, dpi = rasterize(fig, str(path), **savefig_kwargs)
+        except ValueError:
+            fig.savefig(path, **savefig_kwargs)  # non-Agg canvas: plain path
+            return
+        if not self.asynchronous:
+            encode(rgba, path, dpi, self.webp_quality)
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="cogito-save")
+        self._slots.acquire()
+        future = self._pool.submit(encode, rgba, path, dpi, self.webp_quality)
+        future.add_done_callback(lambda _: self._slots.release())
+        with self._lock:
+            self._pending.append(future)
+
+    def flush(self):
+        """Block until every queued figure is on disk; raise the first error."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        errors = [f.exception() for f in pending]
+        errors = [e for e in errors if e is not None]
+        if errors:
+            raise errors[0]
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+
+_stage = None
+
+
+def configured() -> bool:
+    """True when the environment asks for the output stage."""
+    return _env_flag("COGITO_ASYNC_SAVE") or _env_flag("COGITO_WEBP")
+
+
+def stage() -> OutputStage:
+    """The process-wide stage, built from the environment on first use."""
+    global _stage
+    if _stage is None:
+        workers = int(os.environ.get("COGITO_SAVE_WORKERS", "0")) or None
+        quality = None
+        if _env_flag("COGITO_WEBP"):
+            quality = int(os.environ.get("COGITO_WEBP_QUALITY", "80"))
+        _stage = OutputStage(workers=workers, webp_quality=quality,
+                             asynchronous=_env_flag("COGITO_ASYNC_SAVE"))
+        atexit.register(_stage.close)
+    return _stage
+
+
+def flush():
+    """Barrier for the process-wide stage (no-op if it was never used)."""
+    if _stage is not None:
+        _stage.flush()
@@ -0,0 +1,88 @@
+"""
+Render profiles: full-resolution production output vs fast draft previews.
+
+Every article script saves through `render.savefig(...)` with its production
+settings spelled out (`dpi=300, bbox_inches='tight'` etc.). The profile is
+picked once per process from the environment:
+
+    COGITO_RENDER=production   (default) -- exactly the script's own arguments
+    COGITO_RENDER=draft        -- 72 dpi, no bbox_inches='tight' pass, no
+                                  line/patch antialiasing, aggressive path
+                                  simplification; written under _draft/ so the
+                                  committed PNGs are never overwritten
+
+COGITO_OUTPUT_DIR redirects output for either profile (used by the timing
+harness in benchmarks/render_profiles.py). COGITO_ASYNC_SAVE / COGITO_WEBP
+route PNGs through the background output stage in `cogito.output`.
+"""
+
+import os
+from pathlib import Path
+
+import matplotlib
+import matplotlib.pyplot as plt
+
+from cogito import output
+
+PROFILES = {
+    "production": {
+        "savefig": {},
+        "drop": (),
+        "rc": {},
+        "output_dir": None,
+    },
+    "draft": {
+        "savefig": {"dpi": 72},
+        # bbox_inches='tight' renders the figure twice (once to measure).
+        "drop": ("bbox_inches", "pad_inches"),
+        "rc": {
+            "figure.dpi": 72,
+            "lines.antialiased": False,
+            "patch.antialiased": False,
+            "path.simplify": True,
+            "path.simplify_threshold": 1.0,
+            "agg.path.chunksize": 10000,
+        },
+        "output_dir": "_draft",
+    },
+}
+
+PROFILE = os.environ.get("COGITO_RENDER", "production").strip().lower() or "production"
+if PROFILE not in PROFILES:
+    raise ValueError(
+        f"COGITO_RENDER={PROFILE!r}: expected one of {', '.join(sorted(PROFILES))}"
+    )
+
+_settings = PROFILES[PROFILE]
+matplotlib.rcParams.update(_settings["rc"])
+
+
+def output_path(fname) -> Path:
+    """Where `fname` is written under the active profile."""
+    path = Path(fname)
+    out_dir = os.environ.get("COGITO_OUTPUT_DIR") or _settings["output_dir"]
+    if out_dir and not path.is_absolute():
+        path = Path(out_dir) / path
+        path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def savefig(fname, fig=None, **kwargs):
+    """`plt.savefig` with the active profile's overrides applied.
+
+    `kwargs` are the script's production settings; the draft profile
+    replaces dpi and drops the tight-bbox pass.
+    """
+    for key in _settings["drop"]:
+        kwargs.pop(key, None)
+    kwargs.update(_settings["savefig"])
+    fig = fig or plt.gcf()
+    if output.configured():
+        output.stage().submit(fig, output_path(fname), **kwargs)
+    else:
+        fig.savefig(output_path(fname), **kwargs)
+
+
+def flush():
+    """Wait for background PNG/WebP writes (see cogito.output)."""
+    output.flush()
@@ -0,0 +1,152 @@
+"""
+Shared matplotlib style bootstrap: one resolved CJK-capable font for all scripts.
+
+The scripts used to each list fonts like ['Arial Unicode MS', 'Microsoft
+YaHei', 'SimHei', 'DejaVu Sans']. On Linux render hosts none of the first
+three exist, so every text artist walked the fallback chain and CJK titles
+emitted a missing-glyph warning per character. `apply()` instead resolves
+the first installed font that really has CJK glyphs, remembers the answer on
+disk, and sets a fixed list: [that font, 'DejaVu Sans'].
+
+The disk cache is keyed by the matplotlib version and the set of installed
+font files, so installing a font invalidates it.
+
+Environment:
+    COGITO_CJK_FONT    -- force a family name (skips resolution)
+    COGITO_FONT_CACHE  -- cache file (default <COGITO_CACHE_DIR>/fonts.json,
+                          i.e. ~/.cache/code-cogito/fonts.json)
+"""
+
+import hashlib
+import json
+import os
+import re
+import warnings
+from pathlib import Path
+
+import matplotlib
+from matplotlib import font_manager
+
+from cogito.cache import cache_root
+
+# Preference order: the fonts the scripts already asked for, then the CJK
+# families commonly packaged on Linux (fonts-noto-cjk, fonts-wqy-*).
+CJK_CANDIDATES = (
+    "Arial Unicode MS", "Microsoft JhengHei", "Microsoft YaHei", "SimHei",
+    "PingFang TC", "Heiti TC",
+    "Noto Sans CJK TC", "Noto Sans CJK SC", "Noto Sans CJK JP",
+    "Noto Sans TC", "Noto Sans SC", "Source Han Sans TC", "Source Han Sans SC",
+    "WenQuanYi Zen Hei", "WenQuanYi Micro Hei", "AR PL UMing TW",
+)
+FALLBACK = "DejaVu Sans"
+PROBE_CHARS = "中文字"
+GLYPH_WARNING = re.compile(r"Glyph \d+ .*missing from")
+
+_resolved = False
+_family = None
+
+
+def _cache_path() -> Path:
+    env = os.environ.get("COGITO_FONT_CACHE")
+    if env:
+        return Path(env)
+    return cache_root() / "fonts.json"
+
+
+def _font_set_key() -> str:
+    files = sorted({f.fname for f in font_manager.fontManager.ttflist})
+    digest = hashlib.sha1("\n".join(files).encode("utf-8")).hexdigest()
+    return f"{matplotlib.__version__}:{digest}"
+
+
+def _has_cjk_glyphs(path: str) -> bool:
+    from matplotlib.ft2font import FT2Font
+    try:
+        font = FT2Font(path)
+    except (OSError, RuntimeError, ValueError):
+        return False
+    return all(font.get_char_index(ord(ch)) for ch in PROBE_CHARS)
+
+
+def find_cjk_font():
+    """Scan installed fonts; return the first CJK-capable candidate family."""
+    by_name = {}
+    for entry in font_manager.fontManager.ttflist:
+        by_name.setdefault(entry.name, []).append(entry.fname)
+    for name in CJK_CANDIDATES:
+        if any(_has_cjk_glyphs(path) for path in by_name.get(name, ())):
+            return name
+    return None
+
+
+def resolve_cjk_font():
+    """CJK-capable family name (or None), resolved once and cached on disk."""
+    global _resolved, _family
+    if _resolved:
+        return _family
+
+    forced = os.environ.get("COGITO_CJK_FONT")
+    if forced:
+        _resolved, _family = True, forced
+        return _family
+
+    key = _font_set_key()
+    path = _cache_path()
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+        if cached.get("key") == key:
+            _resolved, _family = True, cached.get("family")
+            return _family
+    except (OSError, ValueError):
+        pass
+
+    _family = find_cjk_font()
+    _resolved = True
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"key": key, "family": _family}) + "\n",
+                        encoding="utf-8")
+    except OSError:
+        pass  # read-only home: resolve again next run
+    return _family
+
+
+def font_list() -> list:
+    family = resolve_cjk_font()
+    return [family, FALLBACK] if family and family != FALLBACK else [FALLBACK]
+
+
+def _collapse_glyph_warnings():
+    # Without a CJK font every CJK character of every artist warns. Show a
+    # single actionable notice the first time instead (and nothing for
+    # scripts that never draw CJK text).
+    original = warnings.showwarning
+    shown = []
+
+    def showwarning(message, category, filename, lineno, file=None, line=None):
+        if GLYPH_WARNING.search(str(message)):
+            if not shown:
+                shown.append(True)
+                original("no CJK-capable font installed (e.g. fonts-noto-cjk); "
+                         "CJK text renders as boxes", UserWarning, __file__, 0, file)
+            return
+        original(message, category, filename, lineno, file, line)
+
+    showwarning._cogito = True
+    warnings.showwarning = showwarning
+
+
+def apply():
+    """Set the shared font list; call once after importing pyplot."""
+    family = resolve_cjk_font()
+    matplotlib.rcParams["font.family"] = "sans-serif"
+    matplotlib.rcParams["font.sans-serif"] = font_list()
+    matplotlib.rcParams["axes.unicode_minus"] = False
+    if family is None and not getattr(warnings.showwarning, "_cogito", False):
+        _collapse_glyph_warnings()
+
+
+if __name__ == "__main__":
+    print(f"cache:  {_cache_path()}")
+    print(f"font:   {resolve_cjk_font()}")
+    print(f"list:   {font_list()}")
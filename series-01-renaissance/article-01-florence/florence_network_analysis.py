@@ -6,6 +6,16 @@ Article 01: Florence Network Analysis - Why Florence became the cradle of the Re
 import networkx as nx
 import matplotlib.pyplot as plt
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import layout, render, style
+
+import centrality
+
+style.apply()
+
 # === 8-City Italian Trade Network (15th Century) ===
 
 cities = {
@@ -49,9 +59,9 @@ print(f"\nNodes (cities): {G.number_of_nodes()}")
 print(f"Edges (trade routes): {G.number_of_edges()}")
 print(f"Network density: {nx.density(G):.3f}")
 
-degree_centrality = nx.degree_centrality(G)
-betweenness_centrality = nx.betweenness_centrality(G)
-closeness_centrality = nx.closeness_centrality(G)
+degree_centrality = centrality.degree_centrality(G)
+betweenness_centrality = centrality.betweenness_centrality(G)
+closeness_centrality = centrality.closeness_centrality(G)
 
 print("\n[Betweenness Centrality Ranking]")
 print("Measures: how many shortest paths pass through a city\n")
@@ -76,7 +86,7 @@ plt.figure(figsize=(12, 9))
 
 node_sizes = [cities[city]['population'] / 80 for city in G.nodes()]
 node_colors = [betweenness_centrality[city] for city in G.nodes()]
-pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+pos = layout.spring_layout(G, k=2, iterations=50, seed=42)
 
 nx.draw_networkx_nodes(G, pos, node_size=node_sizes, node_color=node_colors,
                        cmap=plt.cm.YlOrRd, alpha=0.9, edgecolors='black', linewidths=2)
@@ -91,6 +101,6 @@ plt.title('15th Century Italian Trade Network\nNode color = betweenness centrali
           fontsize=14, fontweight='bold')
 plt.axis('off')
 plt.tight_layout()
-plt.savefig('florence_network_basic.png', dpi=150, bbox_inches='tight')
+render.savefig('florence_network_basic.png', dpi=150, bbox_inches='tight')
 plt.show()
 print("\nChart saved: florence_network_basic.png")
@@ -7,6 +7,14 @@ import networkx as nx
 import matplotlib.pyplot as plt
 import numpy as np
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
+
 # === Medici Bank Branch Data (1397-1494) ===
 
 branches = {
@@ -77,6 +85,6 @@ legend_elements = [
 ax.legend(handles=legend_elements, loc='lower left', fontsize=10)
 
 plt.tight_layout()
-plt.savefig('medici_bank_network_basic.png', dpi=150, bbox_inches='tight')
+render.savefig('medici_bank_network_basic.png', dpi=150, bbox_inches='tight')
 plt.show()
 print("\nChart saved: medici_bank_network_basic.png")
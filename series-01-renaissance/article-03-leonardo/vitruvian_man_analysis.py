@@ -7,6 +7,14 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Circle, Rectangle
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
+
 # === Body Proportions (head-length = 1 unit) ===
 
 PHI = (1 + np.sqrt(5)) / 2  # Golden ratio ~ 1.618
@@ -123,6 +131,6 @@ ax2.axis('off')
 fig.suptitle("Da Vinci's Vitruvian Man: Body as Universe",
              fontsize=16, fontweight='bold', y=0.98)
 plt.tight_layout()
-plt.savefig('vitruvian_man_basic.png', dpi=150, bbox_inches='tight')
+render.savefig('vitruvian_man_basic.png', dpi=150, bbox_inches='tight')
 plt.show()
 print("\nChart saved: vitruvian_man_basic.png")
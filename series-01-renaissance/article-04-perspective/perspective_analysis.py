@@ -7,6 +7,14 @@ Series: The Digital Rebirth of the Renaissance | Code & Cogito
 import numpy as np
 import matplotlib.pyplot as plt
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
+
 # --- 1. Perspective Projection: 3D Cube -> 2D ---
 
 focal_length = 5.0
@@ -37,7 +45,7 @@ ax.set_aspect('equal')
 ax.legend()
 ax.grid(True, alpha=0.3)
 plt.tight_layout()
-plt.savefig('perspective_cube_projection.png', dpi=150)
+render.savefig('perspective_cube_projection.png', dpi=150)
 plt.show()
 
 # --- 2. One-Point Perspective: Converging Lines ---
@@ -67,7 +75,7 @@ ax.set_title('One-Point Perspective: All Lines Converge', fontsize=14)
 ax.legend()
 ax.set_aspect('equal')
 plt.tight_layout()
-plt.savefig('one_point_perspective.png', dpi=150)
+render.savefig('one_point_perspective.png', dpi=150)
 plt.show()
 
 # --- 3. Depth Perception: Medieval vs Renaissance ---
@@ -95,7 +103,7 @@ ax.set_xticklabels(data['Work'])
 ax.legend()
 ax.grid(axis='y', alpha=0.3)
 plt.tight_layout()
-plt.savefig('depth_comparison.png', dpi=150)
+render.savefig('depth_comparison.png', dpi=150)
 plt.show()
 
 print("\n=== Perspective Analysis Summary ===")
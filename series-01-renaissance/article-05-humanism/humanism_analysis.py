@@ -7,6 +7,14 @@ Series: The Digital Rebirth of the Renaissance | Code & Cogito
 import numpy as np
 import matplotlib.pyplot as plt
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
+
 # --- 1. Humanist Network: Key Thinkers ---
 
 thinkers = {
@@ -36,7 +44,7 @@ ax.set_title('Renaissance Humanist Network: Influence Over Time', fontsize=14)
 ax.grid(True, alpha=0.3)
 plt.colorbar(scatter, label='Influence')
 plt.tight_layout()
-plt.savefig('humanist_network.png', dpi=150)
+render.savefig('humanist_network.png', dpi=150)
 plt.show()
 
 # --- 2. Paradigm Shift: God-Centered vs Human-Centered ---
@@ -62,7 +70,7 @@ ax.set_ylim(0, 100)
 ax.set_title('Paradigm Shift: God-Centered → Human-Centered', fontsize=14, pad=20)
 ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1))
 plt.tight_layout()
-plt.savefig('paradigm_shift_radar.png', dpi=150)
+render.savefig('paradigm_shift_radar.png', dpi=150)
 plt.show()
 
 # --- 3. Key Text Discovery Timeline ---
@@ -93,7 +101,7 @@ ax.set_yticks([])
 ax.set_xlabel('Year', fontsize=12)
 ax.set_title('Key Text Discoveries That Fueled Humanism', fontsize=14)
 plt.tight_layout()
-plt.savefig('text_discovery_timeline.png', dpi=150)
+render.savefig('text_discovery_timeline.png', dpi=150)
 plt.show()
 
 print("\n=== Humanism Analysis Summary ===")
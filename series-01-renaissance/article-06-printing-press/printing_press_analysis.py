@@ -7,6 +7,14 @@ Series: The Digital Rebirth of the Renaissance | Code & Cogito
 import numpy as np
 import matplotlib.pyplot as plt
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
+
 # --- 1. Printing Press Spread Across Europe ---
 
 cities = {
@@ -38,7 +46,7 @@ ax.set_title('Spread of Printing Press Across Europe (1450-1480)', fontsize=14)
 plt.colorbar(scatter, label='Year Established')
 ax.grid(True, alpha=0.3)
 plt.tight_layout()
-plt.savefig('print_spread_map.png', dpi=150)
+render.savefig('print_spread_map.png', dpi=150)
 plt.show()
 
 # --- 2. Book Production: Before vs After Gutenberg ---
@@ -62,7 +70,7 @@ ax.legend()
 ax.set_yscale('symlog', linthresh=10)
 ax.grid(axis='y', alpha=0.3)
 plt.tight_layout()
-plt.savefig('book_production.png', dpi=150)
+render.savefig('book_production.png', dpi=150)
 plt.show()
 
 # --- 3. Cost of Books Over Time ---
@@ -81,7 +89,7 @@ ax.set_ylabel('Relative Cost (1400 = 100)', fontsize=12)
 ax.set_title('Cost of a Book: 98% Drop in 50 Years', fontsize=14)
 ax.grid(True, alpha=0.3)
 plt.tight_layout()
-plt.savefig('book_cost_decline.png', dpi=150)
+render.savefig('book_cost_decline.png', dpi=150)
 plt.show()
 
 print("\n=== Printing Press Analysis Summary ===")
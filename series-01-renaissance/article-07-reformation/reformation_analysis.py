@@ -7,6 +7,14 @@ Series: The Digital Rebirth of the Renaissance | Code & Cogito
 import numpy as np
 import matplotlib.pyplot as plt
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
+
 # --- 1. Protestant Spread Timeline ---
 
 events = [
@@ -38,7 +46,7 @@ ax.set_ylim(0, 2)
 ax.set_yticks([])
 ax.set_title('The Reformation: From 95 Theses to Westphalia (1517-1648)', fontsize=14)
 plt.tight_layout()
-plt.savefig('reformation_timeline.png', dpi=150)
+render.savefig('reformation_timeline.png', dpi=150)
 plt.show()
 
 # --- 2. Authority Structure: Before vs After ---
@@ -64,7 +72,7 @@ ax.set_ylim(0, 100)
 ax.set_title('Authority Before & After Reformation', fontsize=14, pad=20)
 ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1))
 plt.tight_layout()
-plt.savefig('authority_radar.png', dpi=150)
+render.savefig('authority_radar.png', dpi=150)
 plt.show()
 
 # --- 3. Religious Wars: Death Toll ---
@@ -83,7 +91,7 @@ ax.set_xlabel('Estimated Deaths', fontsize=12)
 ax.set_title('The Price of Religious Reform: Major Conflicts', fontsize=14)
 ax.grid(axis='x', alpha=0.3)
 plt.tight_layout()
-plt.savefig('religious_wars_deaths.png', dpi=150)
+render.savefig('religious_wars_deaths.png', dpi=150)
 plt.show()
 
 print("\n=== Reformation Analysis Summary ===")
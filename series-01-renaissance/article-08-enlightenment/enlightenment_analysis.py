@@ -7,6 +7,14 @@ Series: The Digital Rebirth of the Renaissance | Code & Cogito
 import numpy as np
 import matplotlib.pyplot as plt
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
+
 # --- 1. Enlightenment Thinker Influence Network ---
 
 thinkers = {
@@ -41,7 +49,7 @@ ax.set_title('Enlightenment Thinkers: Influence by Domain', fontsize=14)
 ax.legend(title='Domain')
 ax.grid(True, alpha=0.3)
 plt.tight_layout()
-plt.savefig('enlightenment_thinkers.png', dpi=150)
+render.savefig('enlightenment_thinkers.png', dpi=150)
 plt.show()
 
 # --- 2. Reason vs Tradition: The Shift ---
@@ -66,7 +74,7 @@ ax.set_title('The Great Shift: Reason Overtakes Tradition', fontsize=14)
 ax.legend(fontsize=11)
 ax.grid(True, alpha=0.3)
 plt.tight_layout()
-plt.savefig('reason_vs_tradition.png', dpi=150)
+render.savefig('reason_vs_tradition.png', dpi=150)
 plt.show()
 
 # --- 3. Enlightenment Ideas -> Revolutions ---
@@ -98,7 +106,7 @@ ax.set_xticklabels(labels, fontsize=9)
 ax.legend()
 ax.grid(axis='y', alpha=0.3)
 plt.tight_layout()
-plt.savefig('ideas_to_revolutions.png', dpi=150)
+render.savefig('ideas_to_revolutions.png', dpi=150)
 plt.show()
 
 print("\n=== Enlightenment Analysis Summary ===")
@@ -7,6 +7,14 @@ Series: The Digital Rebirth of the Renaissance | Code & Cogito
 import numpy as np
 import matplotlib.pyplot as plt
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
+
 # --- 1. Romanticism vs Enlightenment Values ---
 
 values = ['Emotion', 'Nature', 'Individualism', 'Imagination', 'Tradition']
@@ -27,7 +35,7 @@ ax.set_xticklabels(values, fontsize=11)
 ax.legend(fontsize=11)
 ax.grid(axis='y', alpha=0.3)
 plt.tight_layout()
-plt.savefig('enlightenment_vs_romanticism.png', dpi=150)
+render.savefig('enlightenment_vs_romanticism.png', dpi=150)
 plt.show()
 
 # --- 2. Key Romantic Works Timeline ---
@@ -66,7 +74,7 @@ ax.set_yticks([])
 ax.set_title('Key Romantic Works Across Art Forms', fontsize=14)
 ax.legend(loc='upper left')
 plt.tight_layout()
-plt.savefig('romantic_works_timeline.png', dpi=150)
+render.savefig('romantic_works_timeline.png', dpi=150)
 plt.show()
 
 # --- 3. Nature vs City: Romantic Theme ---
@@ -86,7 +94,7 @@ ax.set_title('Dominant Themes in Romantic Literature & Art', fontsize=14)
 ax.set_ylim(0, 105)
 ax.grid(axis='y', alpha=0.3)
 plt.tight_layout()
-plt.savefig('romantic_themes.png', dpi=150)
+render.savefig('romantic_themes.png', dpi=150)
 plt.show()
 
 print("\n=== Romanticism Analysis Summary ===")
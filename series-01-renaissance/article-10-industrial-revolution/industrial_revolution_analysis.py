@@ -7,6 +7,14 @@ Series: The Digital Rebirth of the Renaissance | Code & Cogito
 import numpy as np
 import matplotlib.pyplot as plt
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
+
 # --- 1. GDP Per Capita: Britain's Industrial Leap ---
 # Data based on Maddison Project estimates (1990 international dollars)
 
@@ -27,7 +35,7 @@ ax.set_title('Britain\'s Industrial Leap: GDP Per Capita Over 900 Years', fontsi
 ax.legend(fontsize=11)
 ax.grid(True, alpha=0.3)
 plt.tight_layout()
-plt.savefig('gdp_hockey_stick.png', dpi=150)
+render.savefig('gdp_hockey_stick.png', dpi=150)
 plt.show()
 
 # --- 2. Urbanization Rate ---
@@ -48,7 +56,7 @@ ax.set_title('Britain: From Rural to Urban Society', fontsize=14)
 ax.legend(loc='center right', fontsize=11)
 ax.grid(axis='y', alpha=0.3)
 plt.tight_layout()
-plt.savefig('urbanization.png', dpi=150)
+render.savefig('urbanization.png', dpi=150)
 plt.show()
 
 # --- 3. Working Conditions: The Human Cost ---
@@ -73,7 +81,7 @@ ax.set_xticklabels(metrics, fontsize=9)
 ax.legend()
 ax.grid(axis='y', alpha=0.3)
 plt.tight_layout()
-plt.savefig('working_conditions.png', dpi=150)
+render.savefig('working_conditions.png', dpi=150)
 plt.show()
 
 print("\n=== Industrial Revolution Summary ===")
@@ -7,20 +7,34 @@ Series: The Digital Rebirth of the Renaissance | Code & Cogito
 import numpy as np
 import matplotlib.pyplot as plt
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
+
 # --- 1. Simple Natural Selection Simulation ---
 
+def natural_selection(generations, pop_size, selection_pressure,
+                      start_mean=50.0, start_std=15.0):
+    """Truncation selection: each generation only the top share survives."""
+    trait_mean = [start_mean]  # starting average trait value
+    trait_std = [start_std]
+    for gen in range(generations):
+        population = np.random.normal(trait_mean[-1], trait_std[-1], pop_size)
+        survivors = np.sort(population)[int(pop_size * (1 - selection_pressure)):]
+        trait_mean.append(np.mean(survivors))
+        trait_std.append(np.std(survivors) * 1.05)  # mutation adds variance
+    return trait_mean, trait_std
+
+
 np.random.seed(42)
 generations = 50
 pop_size = 100
-trait_mean = [50.0]  # starting average trait value
-trait_std = [15.0]
 selection_pressure = 0.6  # top 60% survive
-
-for gen in range(generations):
-    population = np.random.normal(trait_mean[-1], trait_std[-1], pop_size)
-    survivors = np.sort(population)[int(pop_size * (1 - selection_pressure)):]
-    trait_mean.append(np.mean(survivors))
-    trait_std.append(np.std(survivors) * 1.05)  # mutation adds variance
+trait_mean, trait_std = natural_selection(generations, pop_size, selection_pressure)
 
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
 
@@ -41,7 +55,7 @@ ax2.set_title('Population Distribution Shift', fontsize=13)
 ax2.legend()
 
 plt.tight_layout()
-plt.savefig('natural_selection_sim.png', dpi=150)
+render.savefig('natural_selection_sim.png', dpi=150)
 plt.show()
 
 # --- 2. Philosophical Impact of Evolution ---
@@ -67,7 +81,7 @@ ax.set_ylim(0, 100)
 ax.set_title("Human 'Specialness' Before & After Darwin", fontsize=14, pad=20)
 ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1))
 plt.tight_layout()
-plt.savefig('darwin_impact_radar.png', dpi=150)
+render.savefig('darwin_impact_radar.png', dpi=150)
 plt.show()
 
 # --- 3. Evidence Timeline ---
@@ -97,7 +111,7 @@ ax.set_ylim(0, 2)
 ax.set_yticks([])
 ax.set_title("Darwin's Journey: From Observation to Revolution", fontsize=14)
 plt.tight_layout()
-plt.savefig('darwin_timeline.png', dpi=150)
+render.savefig('darwin_timeline.png', dpi=150)
 plt.show()
 
 print("\n=== Darwin Analysis Summary ===")
@@ -7,6 +7,14 @@ Series: The Digital Rebirth of the Renaissance | Code & Cogito
 import numpy as np
 import matplotlib.pyplot as plt
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
+
 # --- 1. The Grand Narrative: 12 Articles Connected ---
 
 articles = [
@@ -43,7 +51,7 @@ ax.set_xlabel('Influenced By →', fontsize=11)
 ax.set_ylabel('← Influences', fontsize=11)
 plt.colorbar(im, label='Influence Strength (0-10)')
 plt.tight_layout()
-plt.savefig('influence_matrix.png', dpi=150)
+render.savefig('influence_matrix.png', dpi=150)
 plt.show()
 
 # --- 2. Legacy Pillars ---
@@ -68,7 +76,7 @@ ax.set_xticklabels(pillars, fontsize=10)
 ax.legend(fontsize=11)
 ax.grid(axis='y', alpha=0.3)
 plt.tight_layout()
-plt.savefig('legacy_pillars.png', dpi=150)
+render.savefig('legacy_pillars.png', dpi=150)
 plt.show()
 
 # --- 3. The 500-Year Arc ---
@@ -89,7 +97,7 @@ ax.set_title('The 500-Year Arc: How Renaissance Ideas Grew', fontsize=14)
 ax.legend(fontsize=11)
 ax.grid(True, alpha=0.3)
 plt.tight_layout()
-plt.savefig('500_year_arc.png', dpi=150)
+render.savefig('500_year_arc.png', dpi=150)
 plt.show()
 
 print("\n=== Legacy Analysis Summary ===")
@@ -0,0 +1,293 @@
+"""
+Bass diffusion fitting: one series or hundreds at once.
+
+    N(t) = m * (1 - e^{-(p+q)t}) / (1 + (q/p) e^{-(p+q)t})
+
+p is the innovation coefficient, q imitation, m the market potential.
+
+- `jacobian` is the closed-form dN/d(p, q, m), so the solver never
+  differences the model numerically.
+- `initial_guess` comes from the data: the discrete Bass regression
+  dN/dt = a + bN + cN^2 (Bass 1969), falling back to a plain guess when
+  the series hasn't bent yet.
+- `fit_many` fits K series together: one vectorised Levenberg-Marquardt
+  iteration updates every series (batched 3x3 normal equations, residuals
+  scaled per series), with scipy's trf as the fallback for any series that
+  stalls. `workers=N` fits series independently in a process pool instead.
+  NaN marks missing observations, so ragged series share one (K, n) array.
+  A series with fewer than MIN_OBS observations can't pin down three
+  parameters; it gets NaN params and converged=False, and the rest of the
+  batch is fitted as usual.
+- Results carry the parameter covariance s^2 (J^T J)^-1, as curve_fit
+  reports it, and can be cached on disk keyed by a hash of the inputs.
+
+Usage:
+    # importers need the repo root on sys.path, for cogito/ (e.g. PYTHONPATH=../..)
+    import bass
+    p, q, m = bass.fit(t, counts).params
+    fits = bass.fit_many(t, counts_matrix, cache=True)   # fits.p, fits.cov, ...
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+from scipy.optimize import least_squares
+
+from cogito.cache import cache_dir, input_key
+
+# Parameter order everywhere: (p, q, m).
+DEFAULT_BOUNDS = ((1e-6, 1e-6, 0.0), (1.0, 5.0, np.inf))
+MIN_OBS = 3   # observations needed to fit (p, q, m)
+_VERSION = 1  # bump when fitting changes, to invalidate cached results
+
+
+class BassFit(NamedTuple):
+    """Fitted parameters; scalars for `fit`, length-K arrays for `fit_many`."""
+    p: np.ndarray
+    q: np.ndarray
+    m: np.ndarray
+    cov: np.ndarray        # (3, 3) or (K, 3, 3), order (p, q, m)
+    rss: np.ndarray        # residual sum of squares, in data units
+    converged: np.ndarray
+
+    @property
+    def params(self) -> np.ndarray:
+        """(p, q, m) as a (3,) or (K, 3) array."""
+        return np.stack([self.p, self.q, self.m], axis=-1)
+
+    @property
+    def stderr(self) -> np.ndarray:
+        return np.sqrt(np.diagonal(self.cov, axis1=-2, axis2=-1))
+
+
+# ---------------------------------------------------------------------------
+# Model
+# ---------------------------------------------------------------------------
+def bass_cdf(t, p, q, m):
+    """Cumulative adopters N(t)."""
+    e = np.exp(-(p + q) * t)
+    return m * (1 - e) / (1 + (q / p) * e)
+
+
+def jacobian(t, p, q, m):
+    """dN/d(p, q, m) stacked on a last axis of size 3."""
+    e = np.exp(-(p + q) * t)
+    r = q / p
+    d = (1 + r * e) ** 2
+    dF_ds = (1 + r) * t * e / d          # s = p + q
+    dF_dr = -(1 - e) * e / d             # r = q / p
+    F = (1 - e) / (1 + r * e)
+    dN_dp = m * (dF_ds - dF_dr * q / p ** 2)
+    dN_dq = m * (dF_ds + dF_dr / p)
+    return np.stack(np.broadcast_arrays(dN_dp, dN_dq, F), axis=-1)
+
+
+def initial_guess(t, counts, bounds=DEFAULT_BOUNDS) -> np.ndarray:
+    """Data-driven (p, q, m) starting point, clipped into `bounds`."""
+    ok = ~np.isnan(counts)
+    t, counts = np.asarray(t, float)[ok], np.asarray(counts, float)[ok]
+    top = counts.max() if counts.size else 1.0
+    guess = None
+    if counts.size >= 4:
+        # Discrete Bass regression on interval rates at interval midpoints.
+        rate = np.diff(counts) / np.diff(t)
+        level = (counts[1:] + counts[:-1]) / 2
+        a, b, c = np.linalg.lstsq(np.column_stack([np.ones_like(level), level, level ** 2]),
+                                  rate, rcond=None)[0]
+        disc = b * b - 4 * a * c
+        if c < 0 and disc > 0:
+            m = (-b - np.sqrt(disc)) / (2 * c)
+            if m > top and a > 0:
+                guess = np.array([a / m, -c * m, m])
+    if guess is None:
+        # Still accelerating (no saturation visible): assume m well above the data.
+        guess = np.array([0.01, 0.3, 2.0 * top])
+    lo, hi = np.asarray(bounds[0], float), np.asarray(bounds[1], float)
+    # Strictly inside the box: trf requires a feasible interior start.
+    span = np.where(np.isfinite(hi - lo), hi - lo, np.abs(guess) + 1.0)
+    return np.clip(guess, lo + 1e-9 * span, hi - 1e-9 * span)
+
+
+# ---------------------------------------------------------------------------
+# Fitting
+# ---------------------------------------------------------------------------
+def _covariance(J, resid, n_obs):
+    """s^2 (J^T J)^-1, inverted on unit-norm columns (p and m differ by ~10^6)."""
+    dof = n_obs - 3
+    s2 = (resid @ resid) / dof if dof > 0 else np.inf
+    norm = np.linalg.norm(J, axis=0)
+    norm[norm == 0] = 1.0
+    Js = J / norm
+    return s2 * np.linalg.pinv(Js.T @ Js) / np.outer(norm, norm)
+
+
+def _unfitted(K=None) -> BassFit:
+    """NaN parameters, not converged: a series with too few observations."""
+    if K is None:
+        return BassFit(np.nan, np.nan, np.nan, np.full((3, 3), np.nan), np.nan, False)
+    return BassFit(np.full(K, np.nan), np.full(K, np.nan), np.full(K, np.nan),
+                   np.full((K, 3, 3), np.nan), np.full(K, np.nan), np.zeros(K, bool))
+
+
+def fit(t, counts, p0=None, bounds=DEFAULT_BOUNDS) -> BassFit:
+    """Least-squares (p, q, m) for one series (NaN = missing observation).
+
+    Fewer than MIN_OBS observations give NaN params and converged=False.
+    """
+    t = np.broadcast_to(np.asarray(t, float), np.shape(counts))
+    counts = np.asarray(counts, float)
+    ok = ~np.isnan(counts)
+    t, counts = t[ok], counts[ok]
+    if len(counts) < MIN_OBS:
+        return _unfitted()
+    # m is solved as m / max(counts) so all three unknowns are O(1).
+    scale = max(np.abs(counts).max(), 1e-12)
+    x0 = initial_guess(t, counts, bounds) if p0 is None else np.array(p0, float)
+    unit = np.array([1.0, 1.0, scale])
+    lo, hi = np.asarray(bounds[0], float) / unit, np.asarray(bounds[1], float) / unit
+    x0 = np.clip(x0 / unit, lo, hi)
+
+    def residuals(x):
+        return (bass_cdf(t, *(x * unit)) - counts) / scale
+
+    def jac(x):
+        return jacobian(t, *(x * unit)) * unit / scale
+
+    res = least_squares(residuals, x0, jac=jac, bounds=(lo, hi), method="trf")
+    p, q, m = res.x * unit
+    resid = bass_cdf(t, p, q, m) - counts
+    return BassFit(p, q, m, _covariance(jacobian(t, p, q, m), resid, len(t)),
+                   float(resid @ resid), res.status > 0)
+
+
+def _cost(x, idx, t, c, w, scale, unit):
+    """Scaled residuals and cost of series `idx` at parameters x (len(idx), 3)."""
+    P = (x * unit[idx])[:, :, None]
+    r = w[idx] * (bass_cdf(t[idx], P[:, 0], P[:, 1], P[:, 2]) - c[idx]) / scale[idx]
+    return r, np.einsum("kn,kn->k", r, r)
+
+
+def _fit_batched(t, counts, p0, bounds, max_iter=200, ftol=1e-10):
+    """Levenberg-Marquardt on all K series at once (3x3 solves, vectorised).
+
+    Bounds use an active set: a parameter sitting on a bound with the
+    gradient pushing outward is frozen for that step. Returns the fits and
+    a mask of series that didn't converge within `max_iter`.
+    """
+    K, n = counts.shape
+    mask = ~np.isnan(counts)
+    w = mask.astype(float)
+    c = np.where(mask, counts, 0.0)
+    scale = np.maximum(np.nanmax(np.abs(counts), axis=1), 1e-12)[:, None]
+    unit = np.ones((K, 3))
+    unit[:, 2] = scale[:, 0]
+    lo = np.asarray(bounds[0], float) / unit
+    hi = np.asarray(bounds[1], float) / unit
+    if p0 is None:
+        x = np.array([initial_guess(t[k], counts[k], bounds) for k in range(K)])
+    else:
+        x = np.broadcast_to(np.asarray(p0, float), (K, 3)).copy()
+    x = np.clip(x / unit, lo, hi)
+
+    r, cost = _cost(x, np.arange(K), t, c, w, scale, unit)
+    lam = np.full(K, 1e-3)
+    live = np.ones(K, bool)
+    eye = np.eye(3)
+    for _ in range(max_iter):
+        if not live.any():
+            break
+        idx = np.flatnonzero(live)
+        P = (x[idx] * unit[idx])[:, :, None]
+        J = jacobian(t[idx], P[:, 0], P[:, 1], P[:, 2]) * (unit[idx] / scale[idx])[:, None, :]
+        J *= w[idx][:, :, None]
+        g = np.einsum("kni,kn->ki", J, r[idx])
+        A = np.einsum("kni,knj->kij", J, J)
+        xi, gap = x[idx], 1e-12 * (1 + np.abs(x[idx]))
+        active = ((xi <= lo[idx] + gap) & (g > 0)) | ((xi >= hi[idx] - gap) & (g < 0))
+        diag = np.einsum("kii->ki", A)
+        A = A + (lam[idx][:, None] * np.maximum(diag, 1e-12))[:, :, None] * eye
+        free = ~active
+        A = A * free[:, :, None] * free[:, None, :] + active[:, :, None] * eye
+        step = np.linalg.solve(A, -(g * free)[..., None])[..., 0]
+        x_try = np.clip(xi + step, lo[idx], hi[idx])
+        r_try, cost_try = _cost(x_try, idx, t, c, w, scale, unit)
+        better = cost_try < cost[idx]
+        done = better & (cost[idx] - cost_try <= ftol * np.maximum(cost[idx], 1e-30))
+        # Also done when nothing can move: every parameter pinned or step ~ 0.
+        done |= np.all(np.abs(x_try - xi) <= 1e-12 * (1 + np.abs(xi)), axis=1)
+        acc = idx[better]
+        x[acc], r[acc], cost[acc] = x_try[better], r_try[better], cost_try[better]
+        lam[idx] = np.where(better, lam[idx] * 0.3, lam[idx] * 10.0)
+        live[idx[done]] = False
+        live[idx[lam[idx] > 1e12]] = False  # stuck: leave it to the fallback
+    stuck = live | (lam > 1e12)
+    return x * unit, stuck
+
+
+def _collect(t, counts, P, converged) -> BassFit:
+    K = len(counts)
+    cov = np.empty((K, 3, 3))
+    rss = np.empty(K)
+    for k in range(K):
+        ok = ~np.isnan(counts[k])
+        Jk = jacobian(t[k][ok], *P[k])
+        rk = bass_cdf(t[k][ok], *P[k]) - counts[k][ok]
+        cov[k] = _covariance(Jk, rk, ok.sum())
+        rss[k] = rk @ rk
+    return BassFit(P[:, 0].copy(), P[:, 1].copy(), P[:, 2].copy(), cov, rss, converged)
+
+
+def _fit_one(args):
+    return fit(*args)
+
+
+def _cache_file(t, counts, p0, bounds):
+    key = input_key(_VERSION, t, counts, None if p0 is None else np.asarray(p0, float),
+                    np.asarray(bounds, float))
+    return cache_dir("bass") / f"{key}.npz"
+
+
+def fit_many(t, counts, p0=None, bounds=DEFAULT_BOUNDS, workers=None,
+             cache=False) -> BassFit:
+    """Fit K series at once.
+
+    t: (n,) shared time grid or (K, n); counts: (K, n) with NaN for gaps.
+    Rows with fewer than MIN_OBS observations come back as NaN with
+    converged=False. workers=None runs the batched solver; workers=N fits series independently
+    in N processes (worth it for very long series). cache=True
+    reuses a previous result for byte-identical inputs.
+    """
+    counts = np.atleast_2d(np.asarray(counts, float))
+    t = np.broadcast_to(np.asarray(t, float), counts.shape)
+    path = _cache_file(t, counts, p0, bounds) if cache else None
+    if path is not None and path.exists():
+        with np.load(path) as z:
+            return BassFit(*(z[f] for f in BassFit._fields))
+
+    usable = np.flatnonzero((~np.isnan(counts)).sum(axis=1) >= MIN_OBS)
+    fits = _unfitted(len(counts))
+    if len(usable):
+        tu, cu = t[usable], counts[usable]
+        if workers and workers > 1:
+            jobs = [(tu[k], cu[k], p0, bounds) for k in range(len(cu))]
+            with ProcessPoolExecutor(workers) as pool:
+                parts = list(pool.map(_fit_one, jobs,
+                                      chunksize=max(1, len(jobs) // (4 * workers))))
+            P = np.array([f.params for f in parts])
+            converged = np.array([f.converged for f in parts])
+        else:
+            P, stuck = _fit_batched(tu, cu, p0, bounds)
+            converged = ~stuck
+            for k in np.flatnonzero(stuck):  # rare: hand the stragglers to scipy
+                f = fit(tu[k], cu[k], p0, bounds)
+                P[k], converged[k] = f.params, f.converged
+        part = _collect(tu, cu, P, converged)
+        for full, values in zip(fits, part):
+            full[usable] = values
+
+    if path is not None:
+        tmp = path.with_suffix(".tmp.npz")
+        np.savez(tmp, **fits._asdict())
+        tmp.replace(path)
+    return fits
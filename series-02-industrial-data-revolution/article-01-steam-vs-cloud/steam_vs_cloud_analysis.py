@@ -19,10 +19,16 @@ pip install numpy pandas matplotlib scipy
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit
 
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'Microsoft JhengHei', 'SimHei']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+import bass
+
+style.apply()
 
 print("=" * 70)
 print("Steam vs Cloud Computing - Free Version")
@@ -34,14 +40,21 @@ print()
 # Visualization 1: Bass Diffusion S-Curve (Basic)
 # ============================================================================
 
+def bass_model(t, p, q, m):
+    """Cumulative Bass adopters N(t) for innovation p, imitation q, market m."""
+    return m * (1 - np.exp(-(p+q)*t)) / (1 + (q/p) * np.exp(-(p+q)*t))
+
+
+def fit_bass(t, counts):
+    """Least-squares (p, q, m) for one adoption series (see bass.py)."""
+    return bass.fit(t, counts, bounds=([0.001, 0.05, 10000], [0.05, 1.0, 100000])).params
+
+
 def bass_diffusion_basic():
     """Basic Bass diffusion model for steam engine adoption"""
     print("\n[Visualization 1] Steam Engine Adoption S-Curve")
     print("-" * 70)
 
-    def bass_model(t, p, q, m):
-        return m * (1 - np.exp(-(p+q)*t)) / (1 + (q/p) * np.exp(-(p+q)*t))
-
     steam_data = {
         'year': [1760, 1770, 1780, 1790, 1800, 1810, 1820, 1830, 1840, 1850],
         'count': [100, 280, 520, 1100, 2200, 4500, 8500, 15000, 25000, 38000]
@@ -50,9 +63,7 @@ def bass_diffusion_basic():
     df_steam = pd.DataFrame(steam_data)
     df_steam['t'] = df_steam['year'] - 1760
 
-    popt, _ = curve_fit(bass_model, df_steam['t'].values, df_steam['count'].values,
-                        p0=[0.01, 0.3, 50000],
-                        bounds=([0.001, 0.05, 10000], [0.05, 1.0, 100000]))
+    popt = fit_bass(df_steam['t'].values, df_steam['count'].values)
 
     t_predict = np.linspace(0, 100, 500)
     count_predict = bass_model(t_predict, *popt)
@@ -70,7 +81,7 @@ def bass_diffusion_basic():
     plt.grid(True, alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig('s3_08_bass_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('s3_08_bass_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     p, q, m = popt
@@ -108,7 +119,7 @@ def cost_comparison_simple():
     plt.grid(True, alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig('s3_08_cost_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('s3_08_cost_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     steam_drop = (1 - steam_cost[-1]/steam_cost[0]) * 100
@@ -136,7 +147,7 @@ def market_share_basic():
               fontsize=14, fontweight='bold')
 
     plt.tight_layout()
-    plt.savefig('s3_08_market_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('s3_08_market_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     hhi = sum([s**2 for s in market.values()])
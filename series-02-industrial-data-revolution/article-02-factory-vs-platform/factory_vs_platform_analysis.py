@@ -20,8 +20,13 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'Microsoft JhengHei', 'SimHei']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 print("=" * 70)
 print("Factory vs Algorithm - Free Version")
@@ -33,6 +38,19 @@ print()
 # Visualization 1: TayloristFactory Output Distribution (Basic)
 # ============================================================================
 
+def taylor_daily_output(worker_efficiency, work_hours, standard_times, tasks, weights):
+    """Units per worker per day under fixed standard task times and hourly fatigue.
+
+    The day's output separates into efficiency x (sum of hourly fatigue) x
+    units per unit-efficiency hour, so workers are handled in one multiply.
+    """
+    fatigue = np.maximum(1.0 - 0.03 * np.arange(work_hours), 0.4)
+    hour_minutes = 60 - standard_times['rest']
+    units_per_hour = sum(hour_minutes * w / standard_times[task]
+                         for task, w in zip(tasks, weights))
+    return np.asarray(worker_efficiency, dtype=float) * (fatigue.sum() * units_per_hour)
+
+
 def taylorist_basic():
     """Basic Taylor factory worker output distribution."""
     print("\n[Visualization 1] Taylor Factory Worker Output")
@@ -50,16 +68,8 @@ def taylorist_basic():
     tasks = ['task_A', 'task_B', 'task_C']
     weights = [0.4, 0.35, 0.25]
 
-    daily_output = np.zeros(n_workers)
-    for i in range(n_workers):
-        output = 0
-        for hour in range(work_hours):
-            fatigue = max(1.0 - 0.03 * hour, 0.4)
-            hour_minutes = 60 - standard_times['rest']
-            for task, w in zip(tasks, weights):
-                task_time = standard_times[task] / (worker_efficiency[i] * fatigue)
-                output += (hour_minutes * w) / task_time
-        daily_output[i] = output
+    daily_output = taylor_daily_output(worker_efficiency, work_hours, standard_times,
+                                       tasks, weights)
 
     plt.figure(figsize=(12, 7))
     plt.hist(daily_output, bins=15, color='#2E86AB', edgecolor='white', alpha=0.85)
@@ -73,7 +83,7 @@ def taylorist_basic():
     plt.grid(axis='y', alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig('s3_art09_free_taylor_output.png', dpi=150, bbox_inches='tight')
+    render.savefig('s3_art09_free_taylor_output.png', dpi=150, bbox_inches='tight')
     plt.show()
 
     print(f"  Mean output: {np.mean(daily_output):.1f} units/worker/day")
@@ -84,6 +94,16 @@ def taylorist_basic():
 # Visualization 2: Uber Earnings Distribution (Basic)
 # ============================================================================
 
+def uber_daily_gross(rating_bonus, trips_per_hour, work_hours, base_fare):
+    """Gross fares per driver: rating-scaled trip rate with daily noise.
+
+    A demand-driven version (dispatch, surge, idle time) is in ride_hailing.py.
+    """
+    trip_rate = trips_per_hour * (0.7 + 0.3 * np.asarray(rating_bonus, dtype=float))
+    variation = np.random.normal(1.0, 0.15, len(trip_rate))
+    return trip_rate * work_hours * base_fare * variation
+
+
 def uber_basic():
     """Basic Uber driver daily earnings distribution."""
     print("\n[Visualization 2] Uber Driver Earnings")
@@ -100,12 +120,7 @@ def uber_basic():
     trips_per_hour = 2.5
 
     rating_bonus = (driver_ratings - 4.0) / 1.0
-    daily_gross = np.zeros(n_drivers)
-    for i in range(n_drivers):
-        trip_rate = trips_per_hour * (0.7 + 0.3 * rating_bonus[i])
-        total_trips = trip_rate * work_hours
-        variation = np.random.normal(1.0, 0.15)
-        daily_gross[i] = total_trips * base_fare * variation
+    daily_gross = uber_daily_gross(rating_bonus, trips_per_hour, work_hours, base_fare)
 
     daily_net = daily_gross * (1 - platform_commission)
 
@@ -123,7 +138,7 @@ def uber_basic():
     plt.grid(axis='y', alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig('s3_art09_free_uber_earnings.png', dpi=150, bbox_inches='tight')
+    render.savefig('s3_art09_free_uber_earnings.png', dpi=150, bbox_inches='tight')
     plt.show()
 
     print(f"  Mean daily net: ${np.mean(daily_net):.2f}")
@@ -170,7 +185,7 @@ def basic_comparison():
     plt.grid(axis='y', alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig('s3_art09_free_comparison.png', dpi=150, bbox_inches='tight')
+    render.savefig('s3_art09_free_comparison.png', dpi=150, bbox_inches='tight')
     plt.show()
 
     print("  Taylor: high visibility, low autonomy, high transparency")
@@ -0,0 +1,373 @@
+"""
+Ride-hailing dispatch simulator: demand-driven driver earnings.
+
+`uber_daily_gross` in the article script gives every driver a fixed trip
+rate plus noise. Here trips actually happen. Riders request rides across a
+square city, with demand following a daily profile and concentrated
+downtown. Drivers work shifts, and the platform matches requests to
+drivers, prices them and takes its commission.
+
+Each simulated minute:
+- New requests arrive (Poisson). A rider quoted surge s books with
+  probability s^-elasticity, and requests that have waited longer than
+  `patience` minutes are cancelled.
+- Surge is priced per zone (a coarse grid) from open requests per idle
+  driver, both counted over the zone and its neighbours, since pickups
+  cross zone borders. It is recomputed every minute and rounded to 0.1
+  as apps display it.
+- Matching is batched. A KD-tree (scipy's cKDTree) over the idle drivers
+  gives each request its k nearest candidates within `max_pickup_km`.
+  Requests then propose to candidates in order of a dispatch score:
+  distance, inflated for low-rated drivers, which is how the platform's
+  rating discipline acts. Each driver takes the closest proposer, and
+  losers move to their next candidate. At most k rounds are needed, each
+  vectorised over the whole batch. Requests left without a driver are
+  re-queried against the drivers still free (`match_passes`), because in
+  a dense market a downtown batch exhausts its k nearest at once.
+- A matched driver is busy for pickup + trip time and reappears at the
+  drop-off point. Drop-offs past the city limits reflect back inside.
+
+Per-driver fares, trips, busy minutes and online minutes are numpy
+arrays updated with fancy indexing, because a driver gets at most one
+trip per minute. There are no per-trip Python objects. The default CLI
+run is a city-scale day: 55,000 drivers and 1.4M requests complete
+about 10^6 trips (a quarter of riders decline the surge quote) in
+under a minute.
+
+Shifts starting late in the evening wrap past midnight, and their
+morning part is worked at the start of the day. Utilization by shift
+start hour then differs only through demand: overnight shifts see less
+of it. With `hourly_demand` flat (`--flat-demand`) it should be level.
+
+Usage:
+    import ride_hailing as rh
+    day = rh.simulate(rh.Market(drivers=55_000, requests_per_day=1_400_000), seed=42)
+    day.net, day.net_per_hour, day.utilization, day.report()
+
+    python ride_hailing.py --drivers 55000 --requests 1400000
+    python ride_hailing.py --flat-demand   # utilization should not vary by shift start
+"""
+
+import time
+from typing import NamedTuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+# Share of daily requests starting in each hour: overnight lull, morning and
+# evening peaks, a late-night bump.
+HOURLY_DEMAND = np.array([
+    1.6, 1.0, 0.7, 0.5, 0.5, 0.9, 2.2, 4.6, 6.4, 5.2, 4.2, 4.3,
+    4.8, 4.5, 4.3, 4.7, 5.6, 7.0, 7.4, 6.3, 5.4, 5.0, 4.5, 3.0,
+])
+HOURLY_DEMAND = HOURLY_DEMAND / HOURLY_DEMAND.sum()
+
+
+class Market(NamedTuple):
+    """City, fleet, demand and pricing parameters."""
+    drivers: int = 1000
+    requests_per_day: int = 25_000     # before surge declines and cancellations
+    city_km: float = 20.0              # side of the square city
+    downtown_share: float = 0.5        # requests starting near the centre
+    downtown_sd_km: float = 2.5
+    trip_km_median: float = 4.0        # lognormal trip length (straight line)
+    detour: float = 1.3                # road km per straight-line km
+    speed_kmh: float = 25.0
+    shift_hours: float = 10.0
+    rating_mean: float = 4.7
+    rating_sd: float = 0.2
+    rating_penalty: float = 0.5        # score = km * (1 + penalty * (5 - rating))
+    max_pickup_km: float = 5.0
+    candidates: int = 8                # nearest idle drivers considered per request
+    match_passes: int = 4              # re-queries for requests that lost every candidate
+    patience: int = 5                  # minutes before an unmatched request cancels
+    surge_zones: int = 8               # zones per side
+    surge_slope: float = 0.5
+    surge_cap: float = 3.0
+    surge_elasticity: float = 0.8      # P(book | surge s) = s ** -elasticity
+    base_fare: float = 2.5
+    per_km: float = 1.2
+    per_min: float = 0.3
+    min_fare: float = 6.0
+    commission: float = 0.22
+    hourly_demand: tuple = None        # 24 weights; None: HOURLY_DEMAND
+
+
+class DayStats(NamedTuple):
+    """Outcome of one simulated day; per-driver arrays have length `drivers`."""
+    market: Market
+    rating: np.ndarray
+    gross: np.ndarray              # fares collected, surge included
+    trips: np.ndarray
+    busy_minutes: np.ndarray       # en route to pickup or carrying a rider
+    online_minutes: np.ndarray     # scheduled shift plus overtime on a last trip
+    shift_start: np.ndarray        # minute of the day the shift begins
+    requested: int
+    priced_out: int                # declined the surge quote
+    cancelled: int                 # booked but never matched
+    wait_minutes: np.ndarray       # request -> pickup, per completed trip
+    surge: np.ndarray              # multiplier per completed trip
+    wall_seconds: float
+
+    @property
+    def net(self) -> np.ndarray:
+        return self.gross * (1 - self.market.commission)
+
+    @property
+    def net_per_hour(self) -> np.ndarray:
+        return self.net / np.maximum(self.online_minutes / 60, 1e-9)
+
+    @property
+    def utilization(self) -> np.ndarray:
+        return self.busy_minutes / np.maximum(self.online_minutes, 1)
+
+    def by_start_hour(self, values) -> np.ndarray:
+        """Mean of a per-driver array per shift start hour (nan: no shift starts then)."""
+        hour = self.shift_start // 60
+        count = np.bincount(hour, minlength=24)
+        with np.errstate(invalid="ignore"):
+            return np.bincount(hour, weights=values, minlength=24) / count
+
+    def report(self) -> str:
+        done = int(self.trips.sum())
+        net = self.net
+        # Shifts wrapping past midnight must work their morning part too:
+        # utilisation should not drift with the start hour.
+        util_by_start = self.by_start_hour(self.utilization)
+        return "\n".join([
+            f"{self.market.drivers:,} drivers, {self.requested:,} requests, "
+            f"{done:,} trips, {self.priced_out:,} priced out, "
+            f"{self.cancelled:,} cancelled ({self.cancelled / max(self.requested, 1):.1%})",
+            f"  net/driver    mean ${net.mean():.2f}  median ${np.median(net):.2f}  "
+            f"p10 ${np.percentile(net, 10):.2f}  p90 ${np.percentile(net, 90):.2f}",
+            f"  net/hour      median ${np.median(self.net_per_hour):.2f}",
+            f"  utilization   mean {self.utilization.mean():.1%}, "
+            f"{np.nanmin(util_by_start):.1%}-{np.nanmax(util_by_start):.1%} by shift start hour",
+            f"  wait          median {np.median(self.wait_minutes):.1f} min",
+            f"  surge         mean x{self.surge.mean():.2f}, "
+            f"{(self.surge > 1).mean():.1%} of trips surged",
+            f"  platform take ${self.gross.sum() * self.market.commission:,.0f}",
+            f"{self.wall_seconds:.2f} s ({done / max(self.wall_seconds, 1e-9):,.0f} trips/s)",
+        ])
+
+
+def _sample_points(rng, n, mk):
+    """Request origins: a downtown cluster mixed with uniform background."""
+    centre = mk.city_km / 2
+    pts = rng.uniform(0, mk.city_km, (n, 2))
+    downtown = rng.random(n) < mk.downtown_share
+    pts[downtown] = rng.normal(centre, mk.downtown_sd_km, (int(downtown.sum()), 2))
+    return np.clip(pts, 0, mk.city_km)
+
+
+def _destinations(rng, origins, mk):
+    n = len(origins)
+    km = rng.lognormal(np.log(mk.trip_km_median), 0.6, n)
+    angle = rng.uniform(0, 2 * np.pi, n)
+    dest = origins + km[:, None] * np.column_stack([np.cos(angle), np.sin(angle)])
+    # Reflect off the city limits rather than clip to them: clipping parks
+    # every long trip's driver on the edge, and idle drivers pile up there.
+    L = mk.city_km
+    dest = np.abs(dest)
+    dest = np.where(dest > L, 2 * L - dest, dest)
+    return np.clip(dest, 0, L)
+
+
+def _zone(pts, mk):
+    cell = np.minimum((pts / mk.city_km * mk.surge_zones).astype(int), mk.surge_zones - 1)
+    return cell[:, 0] * mk.surge_zones + cell[:, 1]
+
+
+def _neighbourhood(counts, mk):
+    """Per-zone totals over the zone and its eight neighbours.
+
+    Pickups reach across zone borders, so surge compares demand and supply
+    over a 3x3 block. Priced zone by zone, a busy small zone with no idle
+    driver of its own would hit the cap even with drivers next door.
+    """
+    z = mk.surge_zones
+    padded = np.pad(counts.reshape(z, z), 1)
+    return sum(padded[i:i + z, j:j + z] for i in range(3) for j in range(3)).ravel()
+
+
+def match(cand, score, n_drivers):
+    """Resolve batched proposals; returns the chosen column per request or -1.
+
+    `cand` and `score` are (requests, k) from a KD-tree query over
+    `n_drivers` points, with missing candidates marked by cand == n_drivers
+    (cKDTree's convention) and score == inf.
+    Each round every unmatched request proposes to its best remaining
+    candidate; each driver keeps the lowest-score proposal.
+    """
+    n_req, k = cand.shape
+    order = np.argsort(score, axis=1, kind="stable")
+    cand = np.take_along_axis(cand, order, axis=1)
+    score = np.take_along_axis(score, order, axis=1)
+    taken = np.zeros(n_drivers + 1, dtype=bool)
+    taken[-1] = True                         # sentinel column: "no candidate"
+    choice = np.full(n_req, -1)
+    ptr = np.zeros(n_req, dtype=int)
+    active = np.arange(n_req)
+    for _ in range(k):
+        drivers = cand[active, ptr[active]]
+        free = ~taken[drivers]
+        bidders, drivers = active[free], drivers[free]
+        if len(bidders):
+            s = score[bidders, ptr[bidders]]
+            first = np.lexsort((s, drivers))
+            winners = first[np.r_[True, drivers[first][1:] != drivers[first][:-1]]]
+            choice[bidders[winners]] = order[bidders[winners], ptr[bidders[winners]]]
+            taken[drivers[winners]] = True
+        ptr[active] += 1
+        active = active[(choice[active] < 0) & (ptr[active] < k)]
+        if not len(active):
+            break
+    return choice                            # a column of the caller's unsorted arrays
+
+
+def dispatch(pos, idle, req_pos, penalty, mk):
+    """Match open requests to idle drivers; returns (requests, drivers, pickup km).
+
+    Each pass queries the k nearest still-free drivers of each still-open
+    request and resolves the proposals with `match`. Dense markets need
+    the later passes: downtown, every request's k nearest are the same
+    few drivers, while more idle drivers sit within pickup range.
+    """
+    open_req = np.arange(len(req_pos))
+    free = idle
+    hits, drivers, km = [], [], []
+    for _ in range(mk.match_passes):
+        if not len(open_req) or not len(free):
+            break
+        k = min(mk.candidates, len(free))
+        dist, cand = cKDTree(pos[free]).query(req_pos[open_req], k=k,
+                                               distance_upper_bound=mk.max_pickup_km)
+        dist, cand = dist.reshape(len(open_req), k), cand.reshape(len(open_req), k)
+        score = np.where(np.isfinite(dist), dist * penalty[free[np.minimum(cand, len(free) - 1)]],
+                         np.inf)
+        col = match(cand, score, len(free))
+        hit = np.flatnonzero(col >= 0)
+        if not len(hit):
+            break
+        taken = cand[hit, col[hit]]
+        hits.append(open_req[hit])
+        drivers.append(free[taken])
+        km.append(dist[hit, col[hit]])
+        open_req = np.delete(open_req, hit)
+        free = np.delete(free, taken)
+    if not hits:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int), np.empty(0)
+    return np.concatenate(hits), np.concatenate(drivers), np.concatenate(km)
+
+
+def simulate(market=Market(), seed=0) -> DayStats:
+    """Simulate one day (1440 one-minute dispatch rounds)."""
+    mk = market
+    rng = np.random.default_rng(seed)
+    demand = HOURLY_DEMAND if mk.hourly_demand is None else np.asarray(mk.hourly_demand, float)
+    demand = demand / demand.sum()
+    n = mk.drivers
+    km_per_min = mk.speed_kmh / 60
+
+    pos = _sample_points(rng, n, mk)
+    rating = np.clip(rng.normal(mk.rating_mean, mk.rating_sd, n), 4.0, 5.0)
+    penalty = 1 + mk.rating_penalty * (5 - rating)
+    # Shifts start with the demand they chase: sample start hours from the
+    # demand profile shifted back by half a shift.
+    lead = int(round(mk.shift_hours / 2))
+    start = (rng.choice(24, n, p=np.roll(demand, -lead)) * 60
+             + rng.integers(0, 60, n))
+    end = start + int(mk.shift_hours * 60)
+    # Shifts wrapping past midnight are on the road from minute 0.
+    free_at = np.where(end > 1440, 0.0, start)
+
+    gross = np.zeros(n)
+    trips = np.zeros(n, dtype=np.int64)
+    busy = np.zeros(n)
+    overtime = np.zeros(n)
+    per_minute = rng.poisson(mk.requests_per_day * np.repeat(demand, 60) / 60)
+
+    zones = mk.surge_zones ** 2
+    req_pos = np.empty((0, 2))
+    req_t = np.empty(0, dtype=int)
+    surge = np.ones(zones)
+    priced_out = cancelled = 0
+    waits, surges = [], []
+
+    t0 = time.perf_counter()
+    for t in range(1440):
+        # Late shifts wrap past midnight; the day keeps their first part.
+        online = ((start <= t) & (t < end)) | (t < end - 1440)
+        if per_minute[t]:
+            new = _sample_points(rng, per_minute[t], mk)
+            quote = surge[_zone(new, mk)]
+            book = rng.random(len(new)) < quote ** -mk.surge_elasticity
+            priced_out += len(new) - int(book.sum())
+            req_pos = np.concatenate([req_pos, new[book]])
+            req_t = np.concatenate([req_t, np.full(int(book.sum()), t)])
+        expired = t - req_t > mk.patience
+        if expired.any():
+            cancelled += int(expired.sum())
+            req_pos, req_t = req_pos[~expired], req_t[~expired]
+        idle = np.flatnonzero(online & (free_at <= t))
+        # Reprice every minute, even one with nothing to match, so a zone
+        # that has cleared stops quoting the last busy minute's surge.
+        req_zone = _zone(req_pos, mk)
+        open_requests = _neighbourhood(np.bincount(req_zone, minlength=zones), mk)
+        idle_drivers = _neighbourhood(np.bincount(_zone(pos[idle], mk), minlength=zones), mk)
+        pressure = open_requests / np.maximum(idle_drivers, 1)
+        surge = np.round(np.clip(1 + mk.surge_slope * (pressure - 1), 1, mk.surge_cap), 1)
+        if not len(req_t) or not len(idle):
+            continue
+
+        hit, d, pickup_km = dispatch(pos, idle, req_pos, penalty, mk)
+        if len(hit):
+            pickup_min = pickup_km * mk.detour / km_per_min
+            origin = req_pos[hit]
+            dest = _destinations(rng, origin, mk)
+            trip_km = np.hypot(*(dest - origin).T) * mk.detour
+            trip_min = trip_km / km_per_min
+            mult = surge[req_zone[hit]]
+            fare = np.maximum(mk.base_fare + mk.per_km * trip_km + mk.per_min * trip_min,
+                              mk.min_fare) * mult
+            # Each driver appears at most once in `d`, so plain fancy-index
+            # updates are safe (no np.add.at needed).
+            gross[d] += fare
+            trips[d] += 1
+            busy[d] += pickup_min + trip_min
+            free_at[d] = t + pickup_min + trip_min
+            # A trip accepted near shift end runs over; that time is online
+            # too, so utilisation stays a share of time actually worked.
+            shift_end = np.where(t < end[d] - 1440, end[d] - 1440, end[d])
+            overtime[d] += np.maximum(free_at[d] - shift_end, 0.0)
+            pos[d] = dest
+            waits.append(t - req_t[hit] + pickup_min)
+            surges.append(mult)
+            keep = np.ones(len(req_t), dtype=bool)
+            keep[hit] = False
+            req_pos, req_t = req_pos[keep], req_t[keep]
+    wall = time.perf_counter() - t0
+
+    online_minutes = (np.minimum(end, 1440) - start + np.maximum(end - 1440, 0)) + overtime
+    return DayStats(mk, rating, gross, trips, busy, online_minutes, start,
+                    int(per_minute.sum()), priced_out, cancelled + len(req_t),
+                    np.concatenate(waits) if waits else np.empty(0),
+                    np.concatenate(surges) if surges else np.empty(0), wall)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--drivers", type=int, default=55_000)
+    parser.add_argument("--requests", type=int, default=1_400_000,
+                        help="ride requests per day (about 10^6 complete)")
+    parser.add_argument("--flat-demand", action="store_true",
+                        help="same demand every hour: a check that every shift start "
+                             "hour gets the same utilization")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    market = Market(drivers=args.drivers, requests_per_day=args.requests,
+                    hourly_demand=(1.0,) * 24 if args.flat_demand else None)
+    print(simulate(market, seed=args.seed).report())
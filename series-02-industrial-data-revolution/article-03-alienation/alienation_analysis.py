@@ -21,8 +21,13 @@ pip install numpy matplotlib
 import numpy as np
 import matplotlib.pyplot as plt
 
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'Microsoft JhengHei', 'SimHei']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 print("=" * 70)
 print("Alienation Mathematics - Free Sample Version")
@@ -86,7 +91,7 @@ def alienation_era_comparison():
         cell.set_edgecolor('white')
 
     plt.subplots_adjust(bottom=0.30)
-    plt.savefig('s3_a10_free_alienation_comparison.png', dpi=150, bbox_inches='tight')
+    render.savefig('s3_a10_free_alienation_comparison.png', dpi=150, bbox_inches='tight')
     plt.show()
 
     print(f"  ✓ Artisan alienation: 0.20 (pre-industrial baseline)")
@@ -140,7 +145,7 @@ def historical_alienation_trend():
     ax.grid(alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig('s3_a10_free_alienation_trend.png', dpi=150, bbox_inches='tight')
+    render.savefig('s3_a10_free_alienation_trend.png', dpi=150, bbox_inches='tight')
     plt.show()
 
     print(f"  ✓ Lowest alienation: 1750 (0.15) - artisan workshop era")
@@ -221,7 +226,7 @@ def apparent_vs_actual_autonomy():
             bbox=dict(boxstyle='round,pad=0.5', facecolor='#fff3cd', alpha=0.9))
 
     plt.tight_layout()
-    plt.savefig('s3_a10_free_autonomy_gap.png', dpi=150, bbox_inches='tight')
+    render.savefig('s3_a10_free_autonomy_gap.png', dpi=150, bbox_inches='tight')
     plt.show()
 
     print(f"  ✓ Average perception gap: {avg_gap:.0f}% across all dimensions")
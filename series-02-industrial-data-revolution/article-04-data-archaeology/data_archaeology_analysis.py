@@ -20,8 +20,15 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'Microsoft JhengHei', 'SimHei']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+import panel
+
+style.apply()
 
 print("=" * 70)
 print("Data Archaeology: Britain's Economic Transformation - Free Version")
@@ -42,13 +49,8 @@ def gdp_growth_basic():
     years = np.array([1760, 1770, 1780, 1790, 1800, 1810, 1820, 1830, 1840, 1850])
     gdp_index = np.array([100, 108, 115, 128, 145, 165, 190, 225, 270, 330])
 
-    # Calculate decade growth rates
-    growth_rates = []
-    for i in range(1, len(gdp_index)):
-        decade_span = (years[i] - years[i-1])
-        annual_rate = ((gdp_index[i] / gdp_index[i-1]) ** (1.0 / decade_span) - 1) * 100
-        growth_rates.append(annual_rate)
-    growth_rates = np.array(growth_rates)
+    # Calculate decade growth rates (annualised, %/yr)
+    growth_rates = panel.interval_growth(gdp_index, years)[1:] * 100
     growth_years = (years[:-1] + years[1:]) / 2
 
     # Pre/post averages
@@ -81,7 +83,7 @@ def gdp_growth_basic():
     plt.grid(True, alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig('s3_11_gdp_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('s3_11_gdp_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print(f"\n  GDP grew {gdp_index[-1]/gdp_index[0]:.1f}x from 1760 to 1850")
@@ -130,7 +132,7 @@ def urbanization_basic():
     plt.grid(True, alpha=0.3, axis='y')
 
     plt.tight_layout()
-    plt.savefig('s3_11_urbanization_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('s3_11_urbanization_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print("\n  Population growth (1750 → 1850):")
@@ -166,7 +168,7 @@ def economic_structure_basic():
                  fontsize=16, fontweight='bold', y=1.02)
 
     plt.tight_layout()
-    plt.savefig('s3_11_structure_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('s3_11_structure_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print(f"\n  1760: Agriculture {data_1760[0]}%, Industry {data_1760[1]}%, Services {data_1760[2]}%")
@@ -0,0 +1,357 @@
+"""
+Long-run economic panels: chunked CSV ingestion, a memory-mapped cache and
+vectorised growth analytics.
+
+The article script works on ten hand-typed points. The same analyses on a
+Maddison Project or Bank of England "millennium" style panel (hundreds of
+countries, centuries of years, several indicators) need two things: a load
+that doesn't re-parse a large CSV every run, and growth computations that
+cover every country at once.
+
+- `load` reads a long-format CSV (one row per entity-year: e.g.
+  countrycode, year, gdppc, pop) in chunks with fixed dtypes. Entity codes
+  are factorised chunk by chunk, and values are scattered into dense
+  (entities, years) float arrays, so missing years are NaN.
+- The arrays are then written to `<cache root>/panels/<key>/` as plain
+  .npy files. The key is a hash of the source path, size, mtime and the
+  requested columns. Later runs memory-map them (`np.load(mmap_mode="r")`)
+  and start in milliseconds, without touching the CSV.
+- A `.parquet` source is read with pandas when pyarrow is installed, and
+  `Panel.to_parquet` writes the long format back out.
+- `interval_growth`, `cagr`, `rolling_growth` and `structural_break` take
+  (entities, years) arrays (or a 1-D series) and work along the last axis.
+  NaN gaps are handled by annualising over the actual span between
+  observations.
+
+Usage:
+    # importers need the repo root on sys.path, for cogito/ (e.g. PYTHONPATH=../..)
+    import panel
+    p = panel.load("mpd2020.csv", entity="countrycode", year="year",
+                   columns=["gdppc", "pop"])
+    gdppc = p["gdppc"]                                   # (countries, years) memmap
+    panel.cagr(gdppc, p.years, 1820, 1913)               # per country
+    panel.rolling_growth(gdppc, p.years, window=30)
+    brk = panel.structural_break(gdppc, p.years)         # brk.year, brk.pre, brk.post
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+if __name__ == "__main__":  # importers set up their own path, as for bass.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito.cache import cache_dir, input_key
+
+CHUNK_ROWS = 1 << 18
+_VERSION = 1  # bump when the cache layout changes
+
+
+class Panel:
+    """Dense (entities, years) arrays for each indicator, sharing one index."""
+
+    def __init__(self, entities, years, values):
+        self.entities = np.asarray(entities)
+        self.years = np.asarray(years)
+        self.values = dict(values)
+        self._row = {e: i for i, e in enumerate(self.entities.tolist())}
+
+    def __getitem__(self, column) -> np.ndarray:
+        return self.values[column]
+
+    @property
+    def columns(self):
+        return list(self.values)
+
+    def row(self, entity) -> int:
+        return self._row[entity]
+
+    def series(self, entity, column) -> np.ndarray:
+        return self.values[column][self._row[entity]]
+
+    def save(self, directory):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "entities.npy", self.entities)
+        np.save(directory / "years.npy", self.years)
+        for i, (name, arr) in enumerate(self.values.items()):
+            np.save(directory / f"col{i}.npy", arr)
+        # meta.json last: a directory without it is an interrupted write.
+        (directory / "meta.json").write_text(
+            json.dumps({"version": _VERSION, "columns": self.columns}), encoding="utf-8")
+
+    @classmethod
+    def open(cls, directory, mmap=True):
+        directory = Path(directory)
+        meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("version") != _VERSION:
+            raise ValueError(f"{directory}: cache version {meta.get('version')}")
+        mode = "r" if mmap else None
+        values = {name: np.load(directory / f"col{i}.npy", mmap_mode=mode)
+                  for i, name in enumerate(meta["columns"])}
+        return cls(np.load(directory / "entities.npy"), np.load(directory / "years.npy"),
+                   values)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Long format again, dropping all-missing rows."""
+        e, t = np.meshgrid(np.arange(len(self.entities)), np.arange(len(self.years)),
+                           indexing="ij")
+        frame = pd.DataFrame({"entity": self.entities[e.ravel()],
+                              "year": self.years[t.ravel()]})
+        for name, arr in self.values.items():
+            frame[name] = np.asarray(arr).ravel()
+        return frame.dropna(subset=self.columns, how="all").reset_index(drop=True)
+
+    def to_parquet(self, path):
+        self.to_frame().to_parquet(path)  # needs pyarrow or fastparquet
+
+
+def _cache_key(path, entity, year, columns):
+    st = os.stat(path)
+    return input_key(str(Path(path).resolve()), st.st_size, st.st_mtime_ns,
+                     entity, year, tuple(columns), _VERSION)
+
+
+def _read_chunks(path, entity, year, columns, chunk_rows):
+    if str(path).endswith(".parquet"):
+        frame = pd.read_parquet(path, columns=[entity, year, *columns])
+        for lo in range(0, len(frame), chunk_rows):
+            yield frame.iloc[lo:lo + chunk_rows]
+        return
+    dtypes = {entity: str, year: "Int64", **{c: "float64" for c in columns}}
+    yield from pd.read_csv(path, usecols=[entity, year, *columns], dtype=dtypes,
+                           chunksize=chunk_rows)
+
+
+def read(path, entity="entity", year="year", columns=("value",),
+         chunk_rows=CHUNK_ROWS) -> Panel:
+    """Parse a long-format table into a Panel (no caching)."""
+    columns = list(columns)
+    codes = {}
+    parts = {"entity": [], "year": [], **{c: [] for c in columns}}
+    for chunk in _read_chunks(path, entity, year, columns, chunk_rows):
+        chunk = chunk[chunk[year].notna() & chunk[entity].notna()]
+        keys = chunk[entity].to_numpy()
+        local, uniques = pd.factorize(keys)
+        remap = np.array([codes.setdefault(u, len(codes)) for u in uniques], dtype=np.int32)
+        parts["entity"].append(remap[local] if len(local) else local.astype(np.int32))
+        parts["year"].append(chunk[year].to_numpy(dtype=np.int64))
+        for c in columns:
+            parts[c].append(chunk[c].to_numpy(dtype=np.float64))
+
+    ent = np.concatenate(parts["entity"]) if parts["entity"] else np.empty(0, np.int32)
+    yr = np.concatenate(parts["year"]) if parts["year"] else np.empty(0, np.int64)
+    names = np.array(sorted(codes, key=codes.get), dtype=str)
+    years = np.arange(yr.min(), yr.max() + 1) if len(yr) else np.empty(0, np.int64)
+    values = {}
+    for c in columns:
+        dense = np.full((len(names), len(years)), np.nan)
+        v = np.concatenate(parts[c])
+        ok = ~np.isnan(v)
+        # Duplicate entity-years: the last row read wins, as in a dict update.
+        dense[ent[ok], yr[ok] - years[0]] = v[ok]
+        values[c] = dense
+    # Entities sorted by name, so the cache is independent of row order.
+    order = np.argsort(names, kind="stable")
+    return Panel(names[order], years, {c: a[order] for c, a in values.items()})
+
+
+def load(path, entity="entity", year="year", columns=("value",), cache=True,
+         chunk_rows=CHUNK_ROWS) -> Panel:
+    """A Panel for `path`, memory-mapped from the cache when it is current."""
+    if not cache:
+        return read(path, entity, year, columns, chunk_rows)
+    directory = cache_dir("panels") / _cache_key(path, entity, year, columns)
+    if (directory / "meta.json").exists():
+        try:
+            return Panel.open(directory)
+        except (OSError, ValueError):
+            pass  # stale or damaged: rebuild below
+    panel = read(path, entity, year, columns, chunk_rows)
+    panel.save(directory)
+    return Panel.open(directory)
+
+
+# ---------------------------------------------------------------------------
+# Growth analytics; all work along the last axis.
+# ---------------------------------------------------------------------------
+def _last_valid(values):
+    """Index of the latest non-NaN observation at or before each position (-1 if none)."""
+    idx = np.where(np.isnan(values), -1, np.arange(values.shape[-1]))
+    return np.maximum.accumulate(idx, axis=-1)
+
+
+def interval_growth(values, years):
+    """Annualised growth (fraction) from each observation to the previous one.
+
+    Returns an array shaped like `values`. Position t holds
+    (v_t / v_prev) ** (1 / (year_t - year_prev)) - 1, where v_prev is the
+    previous non-missing value, and NaN where either end is missing.
+    """
+    values = np.asarray(values, dtype=float)
+    years = np.asarray(years, dtype=float)
+    prev = np.concatenate([np.full(values.shape[:-1] + (1,), -1),
+                           _last_valid(values)[..., :-1]], axis=-1)
+    has = (prev >= 0) & ~np.isnan(values)
+    safe = np.where(has, prev, 0)
+    span = years - years[safe]
+    base = np.take_along_axis(values, safe, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = (values / base) ** (1.0 / span) - 1
+    return np.where(has, out, np.nan)
+
+
+def cagr(values, years, start=None, end=None):
+    """Compound annual growth between the observations nearest inside [start, end].
+
+    Per series: the first and last non-missing values within the window.
+    Series with fewer than two observations there (or an empty window)
+    give NaN.
+    """
+    values = np.asarray(values, dtype=float)
+    years = np.asarray(years)
+    window = np.ones(len(years), dtype=bool)
+    if start is not None:
+        window &= years >= start
+    if end is not None:
+        window &= years <= end
+    v = values[..., window]
+    y = years[window].astype(float)
+    if not len(y):
+        return np.full(values.shape[:-1], np.nan)
+    ok = ~np.isnan(v)
+    first = np.argmax(ok, axis=-1)
+    last = v.shape[-1] - 1 - np.argmax(ok[..., ::-1], axis=-1)
+    v0 = np.take_along_axis(v, first[..., None], axis=-1)[..., 0]
+    v1 = np.take_along_axis(v, last[..., None], axis=-1)[..., 0]
+    span = y[last] - y[first]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = (v1 / v0) ** (1.0 / span) - 1
+    return np.where(ok.any(axis=-1) & (span > 0), out, np.nan)
+
+
+def rolling_growth(values, years, window=10):
+    """Trailing `window`-year annualised log growth, on the panel's year grid.
+
+    Position t holds (log v_t - log v_{t-window}) / window, which needs
+    both endpoints present. `years` must be evenly spaced (annual panels
+    are); the window is given in years.
+    """
+    values = np.asarray(values, dtype=float)
+    years = np.asarray(years)
+    step = years[1] - years[0] if len(years) > 1 else 1
+    lag = int(round(window / step))
+    out = np.full(values.shape, np.nan)
+    if 0 < lag < values.shape[-1]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            logv = np.log(values)
+        out[..., lag:] = (logv[..., lag:] - logv[..., :-lag]) / window
+    return out
+
+
+class Break(NamedTuple):
+    """Best single break in a log-linear trend, per series."""
+    year: np.ndarray        # first year of the second regime (NaN if none)
+    pre: np.ndarray         # annual growth before the break (exp(slope) - 1)
+    post: np.ndarray        # annual growth from the break on
+    f_stat: np.ndarray      # Chow F statistic at the chosen break
+    ssr_ratio: np.ndarray   # two-segment SSR / one-trend SSR
+
+
+def _segment_ssr(n, sx, sy, sxx, sxy, syy):
+    """OLS residual sum of squares and slope from sufficient statistics."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vxx = sxx - sx * sx / n
+        vxy = sxy - sx * sy / n
+        vyy = syy - sy * sy / n
+        slope = vxy / vxx
+        ssr = vyy - slope * vxy
+    return ssr, slope
+
+
+def structural_break(values, years, min_size=3):
+    """Chow-style search for one break in log(values) ~ a + b * year.
+
+    For every candidate split, both segments are fitted by OLS from prefix
+    sums of (n, x, y, x^2, xy, y^2). That makes the whole search O(years)
+    per series and vectorised across series, instead of refitting at each
+    candidate. Each segment needs at least `min_size` observations, and
+    missing years simply drop out of the sums.
+    """
+    values = np.asarray(values, dtype=float)
+    years = np.asarray(years, dtype=float)
+    squeeze = values.ndim == 1
+    v = np.atleast_2d(values).reshape(-1, values.shape[-1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y = np.log(v)
+    w = np.isfinite(y).astype(float)
+    y = np.where(w > 0, y, 0.0)
+    x = np.broadcast_to(years - years.mean(), y.shape) * w   # centred: better conditioned
+
+    stats = [w, x, y, x * x, x * y, y * y]
+    prefix = [np.concatenate([np.zeros((len(y), 1)), np.cumsum(s, axis=-1)], axis=-1)
+              for s in stats]
+    total = [p[:, -1:] for p in prefix]
+    left = [p[:, 1:-1] for p in prefix]             # split after position k
+    right = [t - l for t, l in zip(total, left)]
+
+    ssr_full, _ = _segment_ssr(*[t[:, 0] for t in total])
+    ssr_l, slope_l = _segment_ssr(*left)
+    ssr_r, slope_r = _segment_ssr(*right)
+    ssr_two = ssr_l + ssr_r
+    valid = (left[0] >= min_size) & (right[0] >= min_size)
+    ssr_two = np.where(valid, ssr_two, np.inf)
+
+    k = np.argmin(ssr_two, axis=-1)
+    rows = np.arange(len(y))
+    best = ssr_two[rows, k]
+    found = np.isfinite(best)
+    n = total[0][:, 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Two extra parameters (intercept, slope) for the second segment.
+        f_stat = ((ssr_full - best) / 2) / (best / (n - 4))
+        ratio = best / ssr_full
+    # Splits inside a gap tie; report the first observed year after the split.
+    idx = np.where(w > 0, np.arange(w.shape[-1]), w.shape[-1] - 1)
+    next_obs = np.minimum.accumulate(idx[:, ::-1], axis=-1)[:, ::-1]
+    first_after = next_obs[rows, np.minimum(k + 1, w.shape[-1] - 1)]
+    nan = np.full(len(y), np.nan)
+    result = Break(
+        year=np.where(found, years[first_after], nan),
+        pre=np.where(found, np.expm1(slope_l[rows, k]), nan),
+        post=np.where(found, np.expm1(slope_r[rows, k]), nan),
+        f_stat=np.where(found, f_stat, nan),
+        ssr_ratio=np.where(found, ratio, nan),
+    )
+    if squeeze:
+        return Break(*(a[0] for a in result))
+    return Break(*(a.reshape(values.shape[:-1]) for a in result))
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("csv", help="long-format CSV (entity, year, indicators...)")
+    parser.add_argument("--entity", default="countrycode")
+    parser.add_argument("--year", default="year")
+    parser.add_argument("--columns", default="gdppc", help="comma-separated")
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    p = load(args.csv, args.entity, args.year, args.columns.split(","),
+             cache=not args.no_cache)
+    print(f"loaded {len(p.entities)} entities x {len(p.years)} years x "
+          f"{len(p.columns)} columns in {(time.perf_counter() - t0) * 1e3:.1f} ms")
+    first = p.columns[0]
+    g = cagr(p[first], p.years)
+    brk = structural_break(p[first], p.years)
+    for i in np.argsort(-np.nan_to_num(brk.f_stat))[:10]:
+        print(f"  {p.entities[i]:<8} CAGR {g[i]:7.2%}  break {brk.year[i]:6.0f}  "
+              f"{brk.pre[i]:6.2%} -> {brk.post[i]:6.2%}  F {brk.f_stat[i]:8.1f}")
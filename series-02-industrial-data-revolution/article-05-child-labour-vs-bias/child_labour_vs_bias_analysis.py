@@ -19,8 +19,13 @@ pip install numpy matplotlib
 import numpy as np
 import matplotlib.pyplot as plt
 
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'Microsoft JhengHei', 'SimHei']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 print("=" * 70)
 print("Child Labor vs AI Bias - Free Version")
@@ -82,7 +87,7 @@ def child_labor_basic():
                  fontsize=12, fontweight='bold', color='red')
 
     plt.tight_layout()
-    plt.savefig('s3_12_child_labor_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('s3_12_child_labor_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print(f"\n  Peak child labor: {years[peak_idx]} ({total[peak_idx]:.0f}% combined)")
@@ -132,7 +137,7 @@ def facial_recognition_basic():
     plt.grid(True, alpha=0.3, axis='y')
 
     plt.tight_layout()
-    plt.savefig('s3_12_facial_recognition_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('s3_12_facial_recognition_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     disparity = error_rates[3] / error_rates[0]
@@ -201,7 +206,7 @@ def historical_comparison_basic():
                  fontsize=11, fontweight='bold', color='orange')
 
     plt.tight_layout()
-    plt.savefig('s3_12_comparison_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('s3_12_comparison_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print(f"\n  Key pattern: exploitation thrives when invisible")
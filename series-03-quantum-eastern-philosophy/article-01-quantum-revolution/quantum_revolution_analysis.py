@@ -18,11 +18,16 @@ import numpy as np
 import matplotlib.pyplot as plt
 from scipy.constants import h, c, k
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
 # ---------------------------------------------------------------------------
 # Font configuration
 # ---------------------------------------------------------------------------
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica']
-plt.rcParams['axes.unicode_minus'] = False
+style.apply()
 
 print("=" * 70)
 print("The Eve of the Quantum Revolution")
@@ -102,7 +107,7 @@ def visualize_blackbody_radiation():
             fontsize=11, bbox=dict(boxstyle='round', facecolor='blue', alpha=0.3))
 
     plt.subplots_adjust(left=0.10, right=0.95, top=0.90, bottom=0.10)
-    plt.savefig('blackbody_radiation.png', dpi=300, bbox_inches='tight')
+    render.savefig('blackbody_radiation.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     # Verify with Wien's displacement law and Stefan-Boltzmann law
@@ -221,7 +226,7 @@ def photoelectric_effect_simulation():
              bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.7))
 
     plt.subplots_adjust(left=0.07, right=0.97, top=0.88, bottom=0.10, wspace=0.25)
-    plt.savefig('photoelectric_effect.png', dpi=300, bbox_inches='tight')
+    render.savefig('photoelectric_effect.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     # --- Virtual lab printout ---
@@ -387,7 +392,7 @@ def determinism_timeline():
     fig.suptitle('From Certainty to Uncertainty: 240 Years of Shifting Worldviews in Physics',
                 fontsize=18, fontweight='bold', y=0.98)
     plt.subplots_adjust(left=0.03, right=0.97, top=0.92, bottom=0.04, wspace=0.15)
-    plt.savefig('determinism_timeline.png', dpi=300, bbox_inches='tight')
+    render.savefig('determinism_timeline.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     # --- Worldview comparison table ---
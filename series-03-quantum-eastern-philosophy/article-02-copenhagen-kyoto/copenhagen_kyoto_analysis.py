@@ -20,8 +20,13 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.path import Path
 
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 print("=" * 70)
 print("Copenhagen vs Kyoto School - Free Version")
@@ -102,7 +107,7 @@ def double_slit_comparison():
              bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.5))
 
     plt.subplots_adjust(bottom=0.16, left=0.07, right=0.97, top=0.92, wspace=0.25)
-    plt.savefig('double_slit_observer_effect.png', dpi=300, bbox_inches='tight')
+    render.savefig('double_slit_observer_effect.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print("  - Left panel: clear interference fringes (multiple peaks)")
@@ -217,7 +222,7 @@ def taiji_complementarity():
     ax2.legend(loc='upper right', fontsize=10, bbox_to_anchor=(1.25, 1.15))
 
     plt.subplots_adjust(left=0.05, right=0.92, top=0.88, bottom=0.08, wspace=0.3)
-    plt.savefig('taiji_complementarity.png', dpi=300, bbox_inches='tight')
+    render.savefig('taiji_complementarity.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print("  Bohr's coat of arms: Taiji (yin-yang)")
@@ -273,7 +278,7 @@ def observer_effect_parallel():
     ax2.grid(alpha=0.3)
 
     plt.subplots_adjust(left=0.07, right=0.97, top=0.90, bottom=0.10, wspace=0.25)
-    plt.savefig('observer_effect_comparison.png', dpi=300, bbox_inches='tight')
+    render.savefig('observer_effect_comparison.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print("  Copenhagen Interpretation:")
@@ -17,8 +17,13 @@ Requirements:
 import numpy as np
 import matplotlib.pyplot as plt
 
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 print("=" * 70)
 print("Quantum Superposition vs the Dao of Laozi and Zhuangzi")
@@ -111,7 +116,7 @@ def schrodinger_cat_basic():
     plt.ylim(0, 1.15)
 
     plt.tight_layout()
-    plt.savefig('schrodinger_cat_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('schrodinger_cat_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     # Run experiment simulations
@@ -192,7 +197,7 @@ def taiji_you_wu():
             bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.7))
 
     plt.tight_layout()
-    plt.savefig('taiji_you_wu_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('taiji_you_wu_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print("\n  Laozi, Dao De Jing:")
@@ -267,7 +272,7 @@ def butterfly_dream():
              bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.5))
 
     plt.tight_layout()
-    plt.savefig('butterfly_dream_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('butterfly_dream_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print("\n  Zhuangzi's question:")
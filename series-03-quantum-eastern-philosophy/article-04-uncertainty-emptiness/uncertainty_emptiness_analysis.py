@@ -18,8 +18,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 import networkx as nx
 
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import layout, render, style
+
+style.apply()
 
 print("=" * 70)
 print("  UNCERTAINTY PRINCIPLE vs BUDDHIST EMPTINESS - Free Version")
@@ -85,7 +90,7 @@ def wave_packet_uncertainty():
                  fontsize=15, fontweight='bold', y=1.02)
 
     plt.tight_layout(rect=[0, 0, 1, 0.96])
-    plt.savefig('wave_packet_uncertainty.png', dpi=300, bbox_inches='tight')
+    render.savefig('wave_packet_uncertainty.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print("\n  Heisenberg Uncertainty Principle:")
@@ -140,7 +145,7 @@ def uncertainty_tradeoff():
              fontsize=11, bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
 
     plt.tight_layout()
-    plt.savefig('uncertainty_tradeoff.png', dpi=300, bbox_inches='tight')
+    render.savefig('uncertainty_tradeoff.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print("\n  Key insight:")
@@ -183,7 +188,7 @@ def emptiness_network():
     G.add_edges_from(edges)
 
     plt.figure(figsize=(14, 10))
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+    pos = layout.spring_layout(G, k=2, iterations=50, seed=42)
 
     node_colors = ['#FF6B6B' if n == 'Table' else '#FFD700' for n in G.nodes()]
     node_sizes = [4000 if n == 'Table' else 2500 for n in G.nodes()]
@@ -208,7 +213,7 @@ def emptiness_network():
 
     plt.axis('off')
     plt.tight_layout()
-    plt.savefig('emptiness_network.png', dpi=300, bbox_inches='tight')
+    render.savefig('emptiness_network.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print("\n  Buddhist Emptiness (Sunyata):")
@@ -18,8 +18,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 import networkx as nx
 
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import netdraw, render, style
+
+style.apply()
 
 print("=" * 70)
 print("Quantum Entanglement vs Indra's Net")
@@ -31,6 +36,24 @@ print()
 # Visualization 1: EPR Correlation Function
 # ============================================================================
 
+def simulate_epr(sim_angles, n_trials):
+    """Monte Carlo E(0, theta) from per-pair hidden phases, one trial at a time."""
+    sim_corrs = []
+    for angle in sim_angles:
+        results_a = []
+        results_b = []
+        for _ in range(n_trials):
+            phase = np.random.uniform(0, 2 * np.pi)
+            prob_up_a = np.cos((0 - phase) / 2) ** 2
+            result_a = +1 if np.random.random() < prob_up_a else -1
+            prob_up_b = np.cos((angle - (phase + np.pi)) / 2) ** 2
+            result_b = +1 if np.random.random() < prob_up_b else -1
+            results_a.append(result_a)
+            results_b.append(result_b)
+        sim_corrs.append(np.mean(np.array(results_a) * np.array(results_b)))
+    return sim_corrs
+
+
 def epr_correlation():
     """
     EPR experiment correlation: quantum vs classical prediction.
@@ -64,19 +87,7 @@ def epr_correlation():
     np.random.seed(42)
     n_trials = 1000
     sim_angles = np.linspace(0, np.pi, 50)
-    sim_corrs = []
-    for angle in sim_angles:
-        results_a = []
-        results_b = []
-        for _ in range(n_trials):
-            phase = np.random.uniform(0, 2 * np.pi)
-            prob_up_a = np.cos((0 - phase) / 2) ** 2
-            result_a = +1 if np.random.random() < prob_up_a else -1
-            prob_up_b = np.cos((angle - (phase + np.pi)) / 2) ** 2
-            result_b = +1 if np.random.random() < prob_up_b else -1
-            results_a.append(result_a)
-            results_b.append(result_b)
-        sim_corrs.append(np.mean(np.array(results_a) * np.array(results_b)))
+    sim_corrs = simulate_epr(sim_angles, n_trials)
 
     ax.scatter(sim_angles * 180 / np.pi, sim_corrs, c='red', s=50,
                label=f'Simulated results ({n_trials} trials)', alpha=0.6, zorder=5)
@@ -113,7 +124,7 @@ def epr_correlation():
                      bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.7))
 
     plt.tight_layout()
-    plt.savefig('epr_correlations.png', dpi=300, bbox_inches='tight')
+    render.savefig('epr_correlations.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print(f"\n  Quantum prediction:  E(theta) = -cos(theta)")
@@ -184,7 +195,7 @@ def bell_inequality_test():
             transform=ax.transAxes)
 
     plt.tight_layout()
-    plt.savefig('bell_inequality_test.png', dpi=300, bbox_inches='tight')
+    render.savefig('bell_inequality_test.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print(f"\n  CHSH Inequality: |S| <= 2 (if local realism holds)")
@@ -200,26 +211,31 @@ def bell_inequality_test():
 # Visualization 3: Indra's Net Network
 # ============================================================================
 
-def indras_net_network():
+def indras_net_network(n_jewels=12):
     """
     Indra's Net visualization using a fully connected graph.
     Every jewel reflects all other jewels.
+
+    Edges come from index arrays rather than an n^2 networkx graph, and
+    large nets are drawn as a density raster (see cogito.netdraw).
     """
     print("\n[Visualization 3] Indra's Net - Basic Network")
     print("-" * 70)
 
-    n_jewels = 12
-    G = nx.complete_graph(n_jewels)
+    G = nx.empty_graph(n_jewels)
+    small = n_jewels <= 50
 
     plt.figure(figsize=(12, 12))
     pos = nx.circular_layout(G)
+    xy = np.array([pos[i] for i in range(n_jewels)])
 
     # Draw all edges (mutual reflections)
-    nx.draw_networkx_edges(G, pos, edge_color='#4ECDC4', alpha=0.15, width=1)
+    u, v = netdraw.complete_edges(n_jewels)
+    netdraw.draw_edges(plt.gca(), xy, u, v, color='#4ECDC4', alpha=0.15, width=1)
 
     # Draw all nodes (jewels)
-    nx.draw_networkx_nodes(G, pos, node_color='#FFD700', node_size=800,
-                           edgecolors='black', linewidths=2)
+    nx.draw_networkx_nodes(G, pos, node_color='#FFD700', node_size=800 if small else 10,
+                           edgecolors='black', linewidths=2 if small else 0)
 
     # Highlight center jewel and its connections
     center_node = 0
@@ -227,13 +243,15 @@ def indras_net_network():
                            node_color='#FF6B6B', node_size=1200,
                            edgecolors='black', linewidths=3)
 
-    center_edges = [(center_node, i) for i in range(1, n_jewels)]
-    nx.draw_networkx_edges(G, pos, edgelist=center_edges,
-                           edge_color='red', width=2.5, alpha=0.6)
+    spokes = np.arange(1, n_jewels)
+    netdraw.draw_edges(plt.gca(), xy, np.full_like(spokes, center_node), spokes,
+                       color='red', width=2.5 if small else 0.2, alpha=0.6 if small else 0.05,
+                       mode='lines')
 
-    labels = {i: f'{i+1}' for i in range(n_jewels)}
-    labels[center_node] = 'Center'
-    nx.draw_networkx_labels(G, pos, labels, font_size=9, font_weight='bold')
+    if small:
+        labels = {i: f'{i+1}' for i in range(n_jewels)}
+        labels[center_node] = 'Center'
+        nx.draw_networkx_labels(G, pos, labels, font_size=9, font_weight='bold')
 
     plt.title("Indra's Net (Huayan Buddhism)\n"
               "Every jewel reflects all others -- One is all, all is one",
@@ -250,7 +268,7 @@ def indras_net_network():
 
     plt.axis('off')
     plt.tight_layout()
-    plt.savefig('indras_net_network.png', dpi=300, bbox_inches='tight')
+    render.savefig('indras_net_network.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print(f"\n  Indra's Net (Avatamsaka Sutra, 7th century):")
@@ -17,8 +17,13 @@ pip install numpy matplotlib
 import numpy as np
 import matplotlib.pyplot as plt
 
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 print("=" * 70)
 print("Many-Worlds vs Huayan Infinite Interpenetration - Free Version")
@@ -114,7 +119,7 @@ def universe_splitting_tree():
                 bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.6))
 
     plt.tight_layout()
-    plt.savefig('universe_splitting_tree.png', dpi=300, bbox_inches='tight')
+    render.savefig('universe_splitting_tree.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     # Data output
@@ -215,7 +220,7 @@ def parallel_yous():
                 bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.6))
 
     plt.tight_layout()
-    plt.savefig('parallel_yous.png', dpi=300, bbox_inches='tight')
+    render.savefig('parallel_yous.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     # Statistics
@@ -309,7 +314,7 @@ def huayan_fractal():
            transform=ax.transAxes)
 
     plt.tight_layout()
-    plt.savefig('huayan_fractal.png', dpi=300, bbox_inches='tight')
+    render.savefig('huayan_fractal.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print("\n" + "=" * 70)
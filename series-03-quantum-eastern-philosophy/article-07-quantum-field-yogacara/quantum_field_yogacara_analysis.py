@@ -19,8 +19,13 @@ pip install numpy matplotlib
 import numpy as np
 import matplotlib.pyplot as plt
 
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 print("=" * 70)
 print("Quantum Field Theory vs Yogacara - Free Version")
@@ -77,7 +82,7 @@ def quantum_field_basic():
     ax2.set_ylim(-1.5, 1.5)
     
     plt.tight_layout()
-    plt.savefig('quantum_field_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('quantum_field_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
     
     print(f"\n  KEY INSIGHT:")
@@ -162,7 +167,7 @@ def vacuum_fluctuations_basic():
     
     ax.grid(alpha=0.3)
     plt.tight_layout()
-    plt.savefig('vacuum_fluctuations_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('vacuum_fluctuations_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
     
     print(f"\n  VACUUM is NOT empty!")
@@ -242,7 +247,7 @@ def eight_consciousnesses_basic():
            bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.7))
     
     plt.tight_layout()
-    plt.savefig('eight_consciousnesses_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('eight_consciousnesses_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
     
     print(f"\n  Eight Consciousnesses (Asta-vijnana):")
@@ -20,8 +20,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 import networkx as nx
 
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 print("=" * 70)
 print("Quantum Entanglement vs Dependent Origination - Free Version")
@@ -89,7 +94,7 @@ def twelve_links_basic():
                 fontsize=14, fontweight='bold', pad=20)
 
     plt.tight_layout()
-    plt.savefig('twelve_links_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('twelve_links_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print("\n  Twelve Links (Pratityasamutpada):")
@@ -188,7 +193,7 @@ def entangled_state_basic():
             bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.6))
 
     plt.tight_layout()
-    plt.savefig('entangled_state_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('entangled_state_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print("\n  Separable state: |psi> = |psi_A> x |psi_B>")
@@ -281,7 +286,7 @@ def bell_inequality_basic():
            bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.6))
 
     plt.tight_layout()
-    plt.savefig('bell_inequality_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('bell_inequality_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print(f"\n  Bell's Inequality:")
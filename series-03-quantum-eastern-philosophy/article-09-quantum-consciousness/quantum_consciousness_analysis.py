@@ -19,8 +19,13 @@ pip install numpy matplotlib scipy
 import numpy as np
 import matplotlib.pyplot as plt
 
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 print("=" * 70)
 print("Quantum Consciousness vs Eastern Mind Philosophy - Free Version")
@@ -148,7 +153,7 @@ def quantum_measurement_basic():
             transform=ax3.transAxes)
 
     plt.tight_layout()
-    plt.savefig('quantum_measurement_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('quantum_measurement_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print(f"\n  Before: Superposition |psi> = (|0>+|1>)/sqrt(2)")
@@ -252,7 +257,7 @@ def orch_or_basic():
             bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.6))
 
     plt.tight_layout()
-    plt.savefig('orch_or_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('orch_or_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print(f"\n  Orch OR Theory:")
@@ -352,7 +357,7 @@ def zen_enlightenment_metaphor():
             bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.6))
 
     plt.tight_layout()
-    plt.savefig('zen_enlightenment_metaphor.png', dpi=300, bbox_inches='tight')
+    render.savefig('zen_enlightenment_metaphor.png', dpi=300, bbox_inches='tight')
     plt.show()
 
     print(f"\n  Parallels:")
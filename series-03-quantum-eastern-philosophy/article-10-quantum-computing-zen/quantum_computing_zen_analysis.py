@@ -13,8 +13,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 print("=" * 70)
 print("Quantum Computing vs Zen - Free Version")
@@ -60,7 +65,7 @@ def bloch_sphere_basic():
     ax.set_zlabel('Z', fontsize=11)
     ax.set_title('Bloch Sphere: Qubit States\nBoth 0 AND 1 Simultaneously', fontsize=13, fontweight='bold')
     ax.legend(fontsize=9, loc='upper left')
-    plt.savefig('bloch_sphere_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('bloch_sphere_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
     print("  Done: Bloch sphere visualized")
 
@@ -101,7 +106,7 @@ def hadamard_gate_basic():
             bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.5))
 
     plt.tight_layout()
-    plt.savefig('hadamard_gate_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('hadamard_gate_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
     print("  Done: Hadamard gate effect shown")
 
@@ -147,7 +152,7 @@ def measurement_collapse_basic():
     ax4.axis('off')
 
     plt.tight_layout()
-    plt.savefig('measurement_collapse_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('measurement_collapse_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
     print("  Done: Measurement vs Qi-Nian compared")
 
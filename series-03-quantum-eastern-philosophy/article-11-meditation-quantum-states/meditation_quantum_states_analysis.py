@@ -12,8 +12,13 @@ pip install numpy matplotlib scipy
 import numpy as np
 import matplotlib.pyplot as plt
 
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 print("=" * 70)
 print("Meditation & Quantum States - Free Version")
@@ -54,7 +59,7 @@ def brainwave_types_basic():
     ax.grid(alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig('brainwave_types_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('brainwave_types_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
     print("  Done: Brain wave types visualized")
 
@@ -98,7 +103,7 @@ def meditation_stages_basic():
             bbox=dict(boxstyle='round', facecolor='lightyellow', edgecolor='red', linewidth=2))
 
     plt.tight_layout()
-    plt.savefig('meditation_stages_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('meditation_stages_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
     print("  Done: Meditation stages compared")
 
@@ -162,7 +167,7 @@ def nothought_superposition_basic():
             fontweight='bold', bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.7))
 
     plt.tight_layout(rect=[0, 0, 1, 0.95])
-    plt.savefig('nothought_superposition_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('nothought_superposition_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
     print("  Done: No-thought vs superposition compared")
 
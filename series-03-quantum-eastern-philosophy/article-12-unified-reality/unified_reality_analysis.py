@@ -13,8 +13,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 import networkx as nx
 
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import layout, render, style
+
+style.apply()
 
 print("=" * 70)
 print("Unified Reality - Free Version (Finale)")
@@ -46,7 +51,7 @@ def correspondences_network_basic():
         G.add_edge(qm, ep, weight=weight/10)
 
     # Position nodes with more spacing
-    pos = nx.spring_layout(G, k=3.5, iterations=100, seed=42)
+    pos = layout.spring_layout(G, k=3.5, iterations=100, seed=42)
 
     # Draw nodes
     qm_nodes = [c[0] for c in correspondences]
@@ -77,7 +82,7 @@ def correspondences_network_basic():
 
     ax.axis('off')
     plt.tight_layout()
-    plt.savefig('correspondences_network_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('correspondences_network_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
     print("  > 11 correspondences network visualized")
 
@@ -117,7 +122,7 @@ def five_patterns_basic():
            bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.5))
 
     plt.tight_layout()
-    plt.savefig('five_patterns_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('five_patterns_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
     print("  > Five common patterns visualized")
 
@@ -191,7 +196,7 @@ def two_paths_basic():
                 fontsize=14, fontweight='bold')
 
     plt.tight_layout()
-    plt.savefig('two_paths_basic.png', dpi=300, bbox_inches='tight')
+    render.savefig('two_paths_basic.png', dpi=300, bbox_inches='tight')
     plt.show()
     print("  > Two paths convergence visualized")
 
@@ -12,8 +12,13 @@ import networkx as nx
 import matplotlib.pyplot as plt
 import numpy as np
 
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import layout, render, style
+
+style.apply()
 
 
 # ============================================================
@@ -64,7 +69,7 @@ plt.figure(figsize=(12, 9))
 era_colors = {'early': '#E74C3C', 'mid': '#F39C12', 'late': '#3498DB'}
 node_colors = [era_colors[humanists[n]['era']] for n in G.nodes()]
 node_sizes = [humanists[n]['letters'] * 2.5 + 200 for n in G.nodes()]
-pos = nx.spring_layout(G, k=2.5, iterations=80, seed=42)
+pos = layout.spring_layout(G, k=2.5, iterations=80, seed=42)
 
 nx.draw_networkx_nodes(G, pos, node_size=node_sizes, node_color=node_colors,
                        alpha=0.9, edgecolors='black', linewidths=2)
@@ -77,7 +82,7 @@ plt.title('Humanist Intellectual Network (14th-16th Century)\n'
           fontsize=13, fontweight='bold', pad=20)
 plt.axis('off')
 plt.tight_layout()
-plt.savefig('01_humanist_network.png', dpi=300, bbox_inches='tight')
+render.savefig('01_humanist_network.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("\n=> Saved: 01_humanist_network.png")
 
@@ -110,7 +115,7 @@ ax.grid(axis='y', alpha=0.3)
 for i, v in enumerate(ratio):
     ax.text(i, v + 0.04, f'{v:.2f}', ha='center', fontweight='bold', fontsize=12)
 plt.tight_layout()
-plt.savefig('02_human_centered_index.png', dpi=300, bbox_inches='tight')
+render.savefig('02_human_centered_index.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 for p, r in zip(periods, ratio):
@@ -144,7 +149,7 @@ ax.set_title('Speed of Influence Building: 14th vs 21st Century\n'
 ax.legend(fontsize=11)
 ax.grid(alpha=0.3)
 plt.tight_layout()
-plt.savefig('03_influence_speed.png', dpi=300, bbox_inches='tight')
+render.savefig('03_influence_speed.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print("  Petrarch: ~9 years to 50% influence")
@@ -179,7 +184,7 @@ ax.set_title('600 Years of Falling Knowledge Access Costs\n$10,000 → $0',
 ax.grid(alpha=0.3)
 ax.set_xlim(1380, 2040)
 plt.tight_layout()
-plt.savefig('04_knowledge_cost.png', dpi=300, bbox_inches='tight')
+render.savefig('04_knowledge_cost.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print("  1400: $10,000 (hand-copied manuscript)")
@@ -243,7 +248,7 @@ ax.set_title('Lorenz Curve: Influence Inequality\n'
 ax.legend(fontsize=11)
 ax.grid(alpha=0.3)
 plt.tight_layout()
-plt.savefig('05_influence_inequality.png', dpi=300, bbox_inches='tight')
+render.savefig('05_influence_inequality.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print(f"  Renaissance Gini: {gini_r:.3f}")
@@ -12,8 +12,13 @@ import networkx as nx
 import matplotlib.pyplot as plt
 import numpy as np
 
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 
 # ============================================================
@@ -51,7 +56,7 @@ for i in range(len(intervals)):
                 fontsize=7, ha='center', color='gray', style='italic')
 
 plt.tight_layout()
-plt.savefig('01_info_speed_comparison.png', dpi=300, bbox_inches='tight')
+render.savefig('01_info_speed_comparison.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print("\nRelative speed over centuries:")
@@ -96,7 +101,7 @@ ax1.legend(fontsize=11, loc='upper left')
 ax1.grid(alpha=0.3)
 ax1.set_xlim(1445, 1505)
 plt.tight_layout()
-plt.savefig('02_book_production_explosion.png', dpi=300, bbox_inches='tight')
+render.savefig('02_book_production_explosion.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 for y, p, g in zip(prod_years, printed, growth_factor):
@@ -154,7 +159,7 @@ fig.suptitle('SIR Model: Information Spread as Epidemic\n'
              'Fake news peaks faster (day 8) and recovers slower than real news (day 12)',
              fontsize=13, fontweight='bold')
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('03_fake_news_sir_model.png', dpi=300, bbox_inches='tight')
+render.savefig('03_fake_news_sir_model.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 peak_luther = np.argmax(I1)
@@ -212,7 +217,7 @@ lines2, labels2 = ax2.get_legend_handles_labels()
 ax1.legend(lines1 + lines2, labels1 + labels2, fontsize=10, loc='upper right')
 ax1.grid(axis='y', alpha=0.3)
 plt.tight_layout()
-plt.savefig('04_content_filtering_evolution.png', dpi=300, bbox_inches='tight')
+render.savefig('04_content_filtering_evolution.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print("\nHistorical content gatekeeping:")
@@ -266,7 +271,7 @@ lines2, labels2 = ax2.get_legend_handles_labels()
 ax1.legend(lines1 + lines2, labels1 + labels2, fontsize=10, loc='upper right')
 ax1.grid(alpha=0.3)
 plt.tight_layout()
-plt.savefig('05_attention_economy.png', dpi=300, bbox_inches='tight')
+render.savefig('05_attention_economy.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 ratio_collapse = attention_seconds[0] / attention_seconds[-1]
@@ -353,7 +358,7 @@ fig.suptitle('Echo Chamber Effect: Geography vs Algorithm\n'
              'Algorithms create sharper polarization despite lower homophily',
              fontsize=13, fontweight='bold')
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('06_echo_chamber_effect.png', dpi=300, bbox_inches='tight')
+render.savefig('06_echo_chamber_effect.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print(f"\n  Geographic echo chamber -- final std dev: {geo_polar[-1]:.3f}")
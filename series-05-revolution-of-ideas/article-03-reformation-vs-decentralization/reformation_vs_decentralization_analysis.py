@@ -13,8 +13,13 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import numpy as np
 
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import layout, render, style
+
+style.apply()
 
 
 # ============================================================
@@ -79,7 +84,7 @@ for idx, (name, data) in enumerate(systems.items()):
     ax.axis('off')
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('01_authority_hierarchy_collapse.png', dpi=300, bbox_inches='tight')
+render.savefig('01_authority_hierarchy_collapse.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print(f"\n{'System':<25} {'Layers':<8} {'Decentr.':<12} {'Top:Bottom Ratio'}")
@@ -148,7 +153,7 @@ fig.suptitle('Idea Propagation: Reformation vs Crypto\n'
              'Same SIR dynamics, 180x speed difference',
              fontsize=13, fontweight='bold')
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('02_theses_propagation.png', dpi=300, bbox_inches='tight')
+render.savefig('02_theses_propagation.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 peak_l = np.argmax(I_luther)
@@ -205,7 +210,7 @@ G_btc.add_edges_from(btc_edges)
 fig, axes = plt.subplots(1, 2, figsize=(18, 8))
 
 # Religious tree
-pos_rel = nx.spring_layout(G_rel, k=2.0, iterations=60, seed=42)
+pos_rel = layout.spring_layout(G_rel, k=2.0, iterations=60, seed=42)
 years_rel = [G_rel.nodes[n]['year'] for n in G_rel.nodes()]
 nx.draw_networkx_nodes(G_rel, pos_rel, ax=axes[0], node_size=1200,
                        node_color=years_rel, cmap=plt.cm.RdYlGn_r,
@@ -220,7 +225,7 @@ axes[0].set_title('Religious Schisms (1517–1738)\n1 church → 8+ denomination
 axes[0].axis('off')
 
 # Blockchain tree
-pos_btc = nx.spring_layout(G_btc, k=2.0, iterations=60, seed=42)
+pos_btc = layout.spring_layout(G_btc, k=2.0, iterations=60, seed=42)
 years_btc = [G_btc.nodes[n]['year'] for n in G_btc.nodes()]
 nx.draw_networkx_nodes(G_btc, pos_btc, ax=axes[1], node_size=1200,
                        node_color=years_btc, cmap=plt.cm.YlOrRd,
@@ -238,7 +243,7 @@ fig.suptitle('Decentralization Produces Fragmentation, Not Unity\n'
              'Same pattern, 24x faster in crypto',
              fontsize=14, fontweight='bold')
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('03_church_division_network.png', dpi=300, bbox_inches='tight')
+render.savefig('03_church_division_network.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print(f"\n  Religious schisms: 1 -> {len(rel_nodes)} branches in ~220 years")
@@ -302,7 +307,7 @@ fig.suptitle('Selling Dreams: Indulgences vs ICO Scams\n'
              '~80% fraud rate in both eras | Same human psychology',
              fontsize=13, fontweight='bold')
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('04_indulgences_vs_ico.png', dpi=300, bbox_inches='tight')
+render.savefig('04_indulgences_vs_ico.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print("\n  Comparison:")
@@ -354,7 +359,7 @@ for i, v in enumerate(coefficients):
     ax.text(i, v + 1, str(v), ha='center', fontweight='bold', fontsize=12)
 
 plt.tight_layout()
-plt.savefig('05_nakamoto_coefficient.png', dpi=300, bbox_inches='tight')
+render.savefig('05_nakamoto_coefficient.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print(f"\n{'System':<25} {'Nakamoto Coeff.':<18} {'Interpretation'}")
@@ -479,7 +484,7 @@ fig.suptitle('Phase Transition: When Reform Becomes Revolution\n'
              'Once past the critical point, there is no going back',
              fontsize=13, fontweight='bold')
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('06_phase_transition.png', dpi=300, bbox_inches='tight')
+render.savefig('06_phase_transition.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print("\n  Reformation phase transition:")
@@ -11,8 +11,13 @@ Requirements: pip install networkx matplotlib numpy
 import matplotlib.pyplot as plt
 import numpy as np
 
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 
 # ============================================================
@@ -48,15 +53,20 @@ tulip_norm = normalize(tulip_prices_raw.astype(float))
 btc_norm = normalize(btc_prices_raw.astype(float))
 
 # DTW computation
-n, m = len(tulip_norm), len(btc_norm)
-dtw_matrix = np.full((n + 1, m + 1), np.inf)
-dtw_matrix[0, 0] = 0
-for i in range(1, n + 1):
-    for j in range(1, m + 1):
-        cost = abs(tulip_norm[i-1] - btc_norm[j-1])
-        dtw_matrix[i, j] = cost + min(
-            dtw_matrix[i-1, j], dtw_matrix[i, j-1], dtw_matrix[i-1, j-1])
+def dtw_cost_matrix(a, b):
+    """Cumulative DTW cost matrix; [n, m] is the DTW distance."""
+    n, m = len(a), len(b)
+    dtw_matrix = np.full((n + 1, m + 1), np.inf)
+    dtw_matrix[0, 0] = 0
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+            cost = abs(a[i-1] - b[j-1])
+            dtw_matrix[i, j] = cost + min(
+                dtw_matrix[i-1, j], dtw_matrix[i, j-1], dtw_matrix[i-1, j-1])
+    return dtw_matrix
 
+n, m = len(tulip_norm), len(btc_norm)
+dtw_matrix = dtw_cost_matrix(tulip_norm, btc_norm)
 dtw_distance = dtw_matrix[n, m]
 max_possible = 100 * max(n, m)
 similarity = (1 - dtw_distance / max_possible) * 100
@@ -112,7 +122,7 @@ ax.set_title('DTW Cost Matrix', fontsize=12, fontweight='bold')
 plt.colorbar(im, ax=ax, label='Cumulative Cost')
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('01_bubble_trajectory_dtw.png', dpi=300, bbox_inches='tight')
+render.savefig('01_bubble_trajectory_dtw.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("\n=> Saved: 01_bubble_trajectory_dtw.png")
 
@@ -185,7 +195,7 @@ for i, v in enumerate(avg_return):
 ax.grid(axis='y', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('02_investor_types.png', dpi=300, bbox_inches='tight')
+render.savefig('02_investor_types.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 02_investor_types.png")
 
@@ -319,7 +329,7 @@ ax.legend(fontsize=10)
 ax.grid(alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('03_greater_fool.png', dpi=300, bbox_inches='tight')
+render.savefig('03_greater_fool.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 03_greater_fool.png")
 
@@ -396,7 +406,7 @@ ax.legend(fontsize=9)
 ax.grid(axis='y', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('04_fear_greed.png', dpi=300, bbox_inches='tight')
+render.savefig('04_fear_greed.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 for s, t, b in zip(stages, tulip_fg, btc_fg):
@@ -505,7 +515,7 @@ ax.legend(fontsize=9)
 ax.grid(axis='y', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('05_wealth_gini.png', dpi=300, bbox_inches='tight')
+render.savefig('05_wealth_gini.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print(f"  Pre-bubble Gini (simulated):  {gini_pre:.3f}")
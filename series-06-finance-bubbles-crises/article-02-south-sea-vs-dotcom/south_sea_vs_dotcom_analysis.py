@@ -11,8 +11,13 @@ Requirements: pip install networkx matplotlib numpy
 import matplotlib.pyplot as plt
 import numpy as np
 
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 
 # ============================================================
@@ -94,7 +99,7 @@ ax.legend(fontsize=9)
 ax.grid(alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('01_pe_deviation.png', dpi=300, bbox_inches='tight')
+render.savefig('01_pe_deviation.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 01_pe_deviation.png")
 
@@ -170,7 +175,7 @@ for bar, v in zip(bars, profit_pct):
 ax.grid(axis='y', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('02_ipo_mania.png', dpi=300, bbox_inches='tight')
+render.savefig('02_ipo_mania.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 02_ipo_mania.png")
 
@@ -242,7 +247,7 @@ for i, m in enumerate(months_sorted):
 ax.grid(axis='x', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('03_promise_vs_reality.png', dpi=300, bbox_inches='tight')
+render.savefig('03_promise_vs_reality.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 03_promise_vs_reality.png")
 
@@ -319,7 +324,7 @@ ax.set_xlim(0, 110)
 ax.grid(axis='x', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('04_rationality_collapse.png', dpi=300, bbox_inches='tight')
+render.savefig('04_rationality_collapse.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 04_rationality_collapse.png")
 
@@ -393,7 +398,7 @@ ax.set_ylim(0, 105)
 ax.grid(axis='y', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('05_collapse_chain.png', dpi=300, bbox_inches='tight')
+render.savefig('05_collapse_chain.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 05_collapse_chain.png")
 
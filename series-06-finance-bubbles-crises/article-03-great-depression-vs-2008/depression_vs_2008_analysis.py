@@ -12,8 +12,13 @@ import matplotlib.pyplot as plt
 import numpy as np
 import random
 
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 
 # ============================================================
@@ -95,7 +100,7 @@ ax.axis('off')
 ax.set_title('Contagion Chain Length', fontsize=12, fontweight='bold')
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('01_leverage_evolution.png', dpi=300, bbox_inches='tight')
+render.savefig('01_leverage_evolution.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 01_leverage_evolution.png")
 
@@ -210,7 +215,7 @@ for bar, v in zip(bars, collapse_steps):
 ax.grid(axis='y', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('02_bank_run_agents.png', dpi=300, bbox_inches='tight')
+render.savefig('02_bank_run_agents.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 02_bank_run_agents.png")
 
@@ -259,7 +264,7 @@ for idx, (metric, label) in enumerate([('gdp', 'GDP Index'), ('credit', 'Credit
     ax.grid(alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('03_credit_spiral.png', dpi=300, bbox_inches='tight')
+render.savefig('03_credit_spiral.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 03_credit_spiral.png")
 
@@ -326,7 +331,7 @@ ax.legend(fontsize=10)
 ax.grid(axis='x', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('04_unemployment_cascade.png', dpi=300, bbox_inches='tight')
+render.savefig('04_unemployment_cascade.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 04_unemployment_cascade.png")
 
@@ -385,7 +390,7 @@ for bar, direction in zip(bars, inequality_direction):
 ax.grid(axis='y', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('05_wealth_gini.png', dpi=300, bbox_inches='tight')
+render.savefig('05_wealth_gini.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 05_wealth_gini.png")
 
@@ -454,7 +459,7 @@ ax.legend(fontsize=9)
 ax.set_xlim(0, 1.2)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('06_recovery_time.png', dpi=300, bbox_inches='tight')
+render.savefig('06_recovery_time.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 for m, r1, r2, r in zip(metrics, recovery_1929, recovery_2008, ratio_r):
@@ -0,0 +1,358 @@
+"""
+Cohort-component population projection: Leslie matrices, batched scenarios.
+
+MODEL 3 in the article script shrinks Taiwan by 13% per step, and its
+Japan line is typed in. This module projects by single year of age
+(0-99, then 100+) and by sex, for every combination of fertility,
+mortality and migration scenario at once.
+
+- Rate tables. Age-specific fertility is a normal-shaped schedule over
+  ages 15-49, scaled to the total fertility rate (TFR). Mortality is a
+  three-term hazard: child, background and Gompertz. It is scaled
+  proportionally to hit each scenario's life expectancy, and all levels
+  are bisected together. Net migrants follow a Rogers-Castro age profile,
+  half of them female. The tables are cached on disk, keyed by their
+  inputs.
+- Leslie matrices. There is one (2 x 101)-square matrix per (TFR, life
+  expectancy) pair, built once: survival on the subdiagonals, and births
+  to women in the first row of each sex.
+- Projection. The population is a (TFR x e0, migration, age-sex) array.
+  Each year is one batched matrix product, stack of populations @ stack
+  of matrices, plus migrants. Births and the young / working / old
+  totals are read off as the years go.
+
+The base populations are reconstructions, not census data. Each starts
+from the annual births history of the cohorts now alive. Those are
+survived through a life table whose level is chosen so that the 65+
+share matches the article's 2023 figure, and then scaled to the total
+population. Pass `base=` to project a real census pyramid.
+
+Usage:
+    # importers need the repo root on sys.path, for cogito/ (e.g. PYTHONPATH=../..)
+    import cohort
+    res = cohort.project(cohort.JAPAN, tfr=np.linspace(0.8, 2.1, 14),
+                         e0=np.linspace(84, 95, 12), migration=np.linspace(0, 4e5, 20))
+    res.population[:, -1]          # per scenario, after 100 years
+    res.old_age_ratio, res.births   # (scenarios, years)
+    res.at(tfr=1.2, e0=87.1, migration=0).population
+
+    python cohort.py --country taiwan --years 100
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+if __name__ == "__main__":  # importers set up their own path, as for bass.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito.cache import cache_dir, input_key
+
+AGES = 101          # single years 0-99 and an open 100+ group
+FERTILE = (15, 50)  # ages with non-zero fertility
+_VERSION = 1        # bump when the rate tables change, to invalidate the cache
+
+
+class Country(NamedTuple):
+    name: str
+    year: int
+    total: float         # population in the base year
+    old_share: float     # 65+ share in the base year
+    births: dict         # year -> live births, for the base reconstruction
+    tfr: float           # current total fertility rate
+    e0: float            # current female life expectancy at birth
+    male_gap: float      # female minus male life expectancy
+    mean_age: float      # mean age at childbearing
+    migration: float     # current net migrants per year
+
+
+# Totals, 65+ shares and the latest births are the article's (MODEL 3);
+# earlier births are rounded national statistics.
+JAPAN = Country(
+    "Japan", 2023, 125.0e6, 0.291,
+    births={1922: 2.0e6, 1930: 2.09e6, 1938: 1.93e6, 1943: 2.25e6, 1945: 1.69e6,
+            1947: 2.68e6, 1949: 2.70e6, 1951: 2.14e6, 1957: 1.57e6, 1965: 1.82e6,
+            1966: 1.36e6, 1967: 1.94e6, 1973: 2.09e6, 1980: 1.58e6, 1990: 1.22e6,
+            2000: 1.19e6, 2005: 1.06e6, 2010: 1.07e6, 2016: 0.98e6, 2020: 0.84e6,
+            2023: 0.76e6},
+    tfr=1.20, e0=87.1, male_gap=6.0, mean_age=32.2, migration=1.5e5)
+TAIWAN = Country(
+    "Taiwan", 2023, 23.4e6, 0.184,
+    births={1922: 0.16e6, 1940: 0.24e6, 1951: 0.385e6, 1963: 0.42e6, 1970: 0.394e6,
+            1976: 0.423e6, 1980: 0.413e6, 1986: 0.309e6, 1990: 0.335e6, 1998: 0.271e6,
+            2000: 0.305e6, 2005: 0.206e6, 2010: 0.167e6, 2012: 0.229e6, 2015: 0.214e6,
+            2020: 0.165e6, 2023: 0.135e6},
+    tfr=0.87, e0=84.0, male_gap=6.6, mean_age=32.5, migration=2e4)
+COUNTRIES = {"japan": JAPAN, "taiwan": TAIWAN}
+
+
+class RateTables(NamedTuple):
+    """Age-specific rates; F fertility levels, M mortality levels."""
+    fertility: np.ndarray   # (F, AGES): births per woman per year of age
+    survival: np.ndarray    # (M, 2, AGES): survival to the next age, by sex; [.., 99:] into 100+
+    infant: np.ndarray      # (M, 2): share of a year's births alive at its end
+    e0: np.ndarray          # (M, 2): life expectancy the tables reproduce
+    migration: np.ndarray   # (2, AGES): age-sex profile of net migrants, sums to 1
+
+
+class Projection(NamedTuple):
+    """Per scenario (TFR x e0 x migration, migration fastest) and year."""
+    tfr: np.ndarray          # (S,)
+    e0: np.ndarray           # (S,) female life expectancy
+    migration: np.ndarray    # (S,) net migrants per year
+    year: np.ndarray         # (T + 1,)
+    population: np.ndarray   # (S, T + 1)
+    young: np.ndarray        # (S, T + 1): ages 0-14
+    working: np.ndarray      # (S, T + 1): ages 15-64
+    old: np.ndarray          # (S, T + 1): ages 65+
+    births: np.ndarray       # (S, T): live births in each projected year
+    pyramid: np.ndarray      # (S, 2, AGES): females, males in the final year
+    wall: float
+
+    @property
+    def old_age_ratio(self):
+        return self.old / self.working
+
+    @property
+    def youth_ratio(self):
+        return self.young / self.working
+
+    @property
+    def dependency_ratio(self):
+        return (self.young + self.old) / self.working
+
+    def at(self, tfr, e0, migration):
+        """The scenario on the nearest level of each axis, as a one-row Projection."""
+        def nearest(values, x):
+            levels = np.unique(values)
+            return values == levels[np.argmin(np.abs(levels - x))]
+        s = np.flatnonzero(nearest(self.tfr, tfr) & nearest(self.e0, e0)
+                           & nearest(self.migration, migration))[0]
+        rows = {f: getattr(self, f)[s:s + 1] for f in
+                ("tfr", "e0", "migration", "population", "young", "working", "old",
+                 "births", "pyramid")}
+        return self._replace(**rows)
+
+
+# ---------------------------------------------------------------------------
+# Rate tables
+# ---------------------------------------------------------------------------
+def _hazard_integral(x):
+    """Integral of the baseline hazard over [x, x + 1]: child, background, Gompertz."""
+    child = 0.0025 * np.exp(-1.2 * x) * (1 - np.exp(-1.2)) / 1.2
+    gompertz = 2.5e-5 * np.exp(0.105 * x) * (np.exp(0.105) - 1) / 0.105
+    return child + 1.5e-4 + gompertz
+
+
+def _life_table(k):
+    """(person-years L (.., AGES), with L[.., 100] for 100+), hazard scaled by k (..,)."""
+    x = np.arange(AGES)
+    k = np.asarray(k, dtype=float)[..., None]
+    p = np.exp(-k * _hazard_integral(x[:-1]))
+    lx = np.concatenate([np.ones(k.shape), np.cumprod(p, axis=-1)], axis=-1)
+    L = 0.5 * (lx[..., :-1] + lx[..., 1:])
+    L[..., 0] = 0.1 * lx[..., 0] + 0.9 * lx[..., 1]
+    # 100+: a constant hazard at its level at 100.
+    open_hazard = k[..., 0] * _hazard_integral(np.float64(100))
+    return np.concatenate([L, (lx[..., -1] / open_hazard)[..., None]], axis=-1)
+
+
+def _calibrate(e0, tol=1e-9):
+    """Hazard scale k per target e0, bisected on log k for all targets at once."""
+    e0 = np.asarray(e0, dtype=float)
+    lo, hi = np.full(e0.shape, -8.0), np.full(e0.shape, 8.0)
+    while (hi - lo).max(initial=0.0) > tol:
+        mid = 0.5 * (lo + hi)
+        longer = _life_table(np.exp(mid)).sum(axis=-1) > e0
+        lo = np.where(longer, mid, lo)
+        hi = np.where(longer, hi, mid)
+    return np.exp(0.5 * (lo + hi))
+
+
+def _survival(L):
+    """Leslie survival ratios from person-years; the last two feed 100+."""
+    s = L[..., 1:] / L[..., :-1]
+    T100 = L[..., -1]
+    into_open = T100 / (L[..., -2] + T100)
+    s[..., -1] = into_open
+    return np.concatenate([s, into_open[..., None]], axis=-1)
+
+
+def _fertility(tfr, mean_age, sd=5.5):
+    x = np.arange(AGES) + 0.5
+    w = np.exp(-0.5 * ((x - mean_age) / sd) ** 2)
+    w[:FERTILE[0]] = w[FERTILE[1]:] = 0.0
+    return np.asarray(tfr, dtype=float)[:, None] * (w / w.sum())
+
+
+def _migration_profile():
+    """Rogers-Castro: children with their parents, a labour peak in the twenties."""
+    x = np.arange(AGES, dtype=float)
+    m = (0.02 * np.exp(-0.1 * x)
+         + 0.06 * np.exp(-0.1 * (x - 20) - np.exp(-0.4 * (x - 20))) + 0.003)
+    m /= 2 * m.sum()
+    return np.stack([m, m])
+
+
+def rate_tables(tfr, e0, male_gap=6.0, mean_age=32.0, cache=True):
+    """RateTables for each TFR and each female e0 (males: e0 - male_gap)."""
+    tfr = np.atleast_1d(np.asarray(tfr, dtype=float))
+    e0 = np.atleast_1d(np.asarray(e0, dtype=float))
+    path = None
+    if cache:
+        key = input_key(_VERSION, tfr, e0, float(male_gap), float(mean_age))
+        path = cache_dir("cohort") / f"{key}.npz"
+        if path.exists():
+            with np.load(path) as z:
+                return RateTables(*(z[f] for f in RateTables._fields))
+
+    targets = np.stack([e0, e0 - male_gap], axis=-1)           # (M, 2)
+    L = _life_table(_calibrate(targets))                       # (M, 2, AGES)
+    tables = RateTables(fertility=_fertility(tfr, mean_age), survival=_survival(L),
+                        infant=L[..., 0], e0=L.sum(axis=-1), migration=_migration_profile())
+    if path is not None:
+        tmp = path.with_suffix(f".{os.getpid()}.tmp.npz")
+        np.savez(tmp, **tables._asdict())
+        tmp.replace(path)
+    return tables
+
+
+# ---------------------------------------------------------------------------
+# Leslie matrices and projection
+# ---------------------------------------------------------------------------
+def birth_rows(tables):
+    """(F, M, AGES): births in a year per woman of each age at its start."""
+    f = tables.fertility[:, None, :]
+    s = tables.survival[None, :, 0, :]
+    f_next = np.concatenate([tables.fertility[:, 1:], tables.fertility[:, -1:]], axis=-1)
+    return 0.5 * (f + s * f_next[:, None, :])
+
+
+def leslie(tables, srb=1.05):
+    """(F, M, 2 AGES, 2 AGES) Leslie matrices; state is [females 0..100+, males 0..100+]."""
+    n = AGES
+    F, M = len(tables.fertility), len(tables.survival)
+    A = np.zeros((F, M, 2 * n, 2 * n))
+    b = birth_rows(tables)
+    girls = 1 / (1 + srb)
+    A[:, :, 0, :n] = b * girls * tables.infant[None, :, 0, None]
+    A[:, :, n, :n] = b * (1 - girls) * tables.infant[None, :, 1, None]
+    i = np.arange(n - 1)
+    for sex in (0, 1):
+        o = sex * n
+        A[:, :, o + i + 1, o + i] = tables.survival[None, :, sex, :-1]
+        A[:, :, o + n - 1, o + n - 1] = tables.survival[None, :, sex, -1]
+    return A
+
+
+def base_population(country, tol=1e-9):
+    """(2, AGES) reconstructed pyramid for `country.year`; see the module docstring."""
+    years = np.array(sorted(country.births))
+    born = np.interp(country.year - np.arange(AGES), years,
+                     [country.births[y] for y in years])
+    girls = 1 / 2.05
+    old = np.arange(AGES) >= 65
+
+    def pyramid(e0):
+        L = _life_table(_calibrate(np.array([e0, e0 - country.male_gap])))
+        # L[100] is a cohort's person-years beyond 100: in a stationary
+        # population, the size of the whole 100+ group.
+        return born * np.array([[girls], [1 - girls]]) * L
+
+    lo, hi = 40.0, 100.0
+    while hi - lo > tol:
+        mid = 0.5 * (lo + hi)
+        p = pyramid(mid)
+        if p[:, old].sum() / p.sum() > country.old_share:
+            hi = mid
+        else:
+            lo = mid
+    p = pyramid(0.5 * (lo + hi))
+    return p * (country.total / p.sum())
+
+
+def project(country, tfr=None, e0=None, migration=None, years=100, srb=1.05, base=None,
+            cache=True):
+    """Project every (tfr, e0, migration) combination `years` years ahead.
+
+    Each argument is a level or an array of levels (None: the country's
+    current value). e0 is female life expectancy; males trail by
+    `country.male_gap`. base: (2, AGES) females / males (default: the
+    reconstruction from `base_population`).
+    """
+    tfr = np.atleast_1d(country.tfr if tfr is None else np.asarray(tfr, dtype=float))
+    e0 = np.atleast_1d(country.e0 if e0 is None else np.asarray(e0, dtype=float))
+    mig = np.atleast_1d(country.migration if migration is None
+                        else np.asarray(migration, dtype=float))
+    t0 = time.perf_counter()
+    tables = rate_tables(tfr, e0, country.male_gap, country.mean_age, cache=cache)
+    F, M, G, n = len(tfr), len(e0), len(mig), AGES
+    A = leslie(tables, srb).reshape(F * M, 2 * n, 2 * n)
+    At = np.ascontiguousarray(A.transpose(0, 2, 1))
+    b = birth_rows(tables).reshape(F * M, n)
+    arrivals = mig[:, None] * tables.migration.reshape(2 * n)   # (G, 2n)
+
+    age = np.tile(np.arange(n), 2)
+    groups = np.stack([age < 15, (age >= 15) & (age < 65), age >= 65], axis=1).astype(float)
+    pop = np.empty((F * M, G, 2 * n))
+    pop[:] = (base_population(country) if base is None else np.asarray(base, float)).ravel()
+    counts = np.empty((years + 1, F * M, G, 3))
+    births = np.empty((years, F * M, G))
+    counts[0] = pop @ groups
+    for t in range(years):
+        births[t] = np.einsum("kgn,kn->kg", pop[..., :n], b)
+        pop = np.matmul(pop, At)
+        pop += arrivals
+        np.maximum(pop, 0.0, out=pop)  # emigration cannot empty an age below zero
+        counts[t + 1] = pop @ groups
+
+    S = F * M * G
+    counts = counts.reshape(years + 1, S, 3).transpose(2, 1, 0)
+    grid = np.meshgrid(tfr, e0, mig, indexing="ij")
+    return Projection(
+        tfr=grid[0].ravel(), e0=grid[1].ravel(), migration=grid[2].ravel(),
+        year=country.year + np.arange(years + 1),
+        population=counts.sum(axis=0), young=counts[0], working=counts[1], old=counts[2],
+        births=births.reshape(years, S).T, pyramid=pop.reshape(S, 2, n),
+        wall=time.perf_counter() - t0)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--country", default="japan", choices=sorted(COUNTRIES))
+    parser.add_argument("--years", type=int, default=100)
+    parser.add_argument("--tfr", type=int, default=14, help="fertility levels, 0.8-2.1")
+    parser.add_argument("--e0", type=int, default=12, help="life-expectancy levels, +-6 years")
+    parser.add_argument("--migration", type=int, default=20,
+                        help="migration levels, 0 to 3x current")
+    args = parser.parse_args()
+
+    c = COUNTRIES[args.country]
+    res = project(c, tfr=np.linspace(0.8, 2.1, args.tfr),
+                  e0=np.linspace(c.e0 - 6, c.e0 + 6, args.e0),
+                  migration=np.linspace(0, 3 * c.migration, args.migration), years=args.years)
+    S = len(res.tfr)
+    print(f"{c.name}: {S:,} scenarios x {args.years} years, single-year ages by sex: "
+          f"{res.wall:.2f} s")
+    now = project(c, years=args.years)
+    marks = [y for y in (2035, 2045, 2055, 2065, 2075, 2100, 2123) if y <= now.year[-1]]
+    idx = np.searchsorted(now.year, marks)
+    print(f"  at current rates (TFR {c.tfr}, e0 {c.e0}, {c.migration:,.0f} migrants/yr):")
+    print("    " + "  ".join(f"{y}: {p / 1e6:5.1f}M" for y, p in
+                             zip(marks, now.population[0, idx])))
+    print("    old-age ratio " + "  ".join(f"{y}: {r:.2f}" for y, r in
+                                         zip(marks, now.old_age_ratio[0, idx])))
+    print(f"    births: {now.births[0, 0] / 1e3:,.0f}k in {c.year}, "
+          f"{now.births[0, -1] / 1e3:,.0f}k in {now.year[-1] - 1}")
+    end = res.population[:, -1] / res.population[:, 0]
+    q = np.quantile(end, [0.05, 0.5, 0.95])
+    print(f"  all scenarios, population in {res.year[-1]} vs {c.year}: "
+          f"p5 {q[0]:.0%}, median {q[1]:.0%}, p95 {q[2]:.0%}")
+    ratio = res.old_age_ratio[:, -1]
+    print(f"  old-age dependency in {res.year[-1]}: p5 {np.quantile(ratio, 0.05):.2f}, "
+          f"median {np.median(ratio):.2f}, p95 {np.quantile(ratio, 0.95):.2f}")
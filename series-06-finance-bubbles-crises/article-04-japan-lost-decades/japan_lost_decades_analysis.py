@@ -11,8 +11,13 @@ Requirements: pip install matplotlib numpy
 import matplotlib.pyplot as plt
 import numpy as np
 
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import render, style
+
+style.apply()
 
 
 # ============================================================
@@ -99,7 +104,7 @@ ax.legend(fontsize=9)
 ax.grid(alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('01_price_to_income.png', dpi=300, bbox_inches='tight')
+render.savefig('01_price_to_income.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 01_price_to_income.png")
 
@@ -174,7 +179,7 @@ ax.legend(lines1 + lines2, labels1 + labels2, fontsize=9, loc='center left')
 ax.grid(alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('02_housing_hoarding.png', dpi=300, bbox_inches='tight')
+render.savefig('02_housing_hoarding.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print("  Taiwan vacancy: 19% (1.66M empty homes)")
@@ -257,7 +262,7 @@ ax.legend(fontsize=10)
 ax.grid(alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('03_demographics.png', dpi=300, bbox_inches='tight')
+render.savefig('03_demographics.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print("  Japan fertility: 1.54 (1990) -> 1.20 (2023) -- 30 years")
@@ -329,7 +334,7 @@ for bar, v in zip(bars, zombie_impact):
 ax.grid(axis='x', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('04_zombie_companies.png', dpi=300, bbox_inches='tight')
+render.savefig('04_zombie_companies.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("  Peak zombie share: 26% of listed companies (2000)")
 print("  Hidden bad debt gap: up to 12 percentage points")
@@ -409,7 +414,7 @@ ax.legend(fontsize=9)
 ax.grid(axis='x', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('05_lost_generation.png', dpi=300, bbox_inches='tight')
+render.savefig('05_lost_generation.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print("  Taiwan: homeownership by 30 dropped from 40% to 17%")
@@ -11,8 +11,13 @@ Requirements: pip install networkx matplotlib numpy
 import matplotlib.pyplot as plt
 import numpy as np
 
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import layout, render, style
+
+style.apply()
 
 
 # ============================================================
@@ -91,7 +96,7 @@ ax.text(0, -1.8, 'Normal: slow orderly exit\nPanic: stampede -> everyone trapped
 ax.axis('off')
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('01_maturity_mismatch.png', dpi=300, bbox_inches='tight')
+render.savefig('01_maturity_mismatch.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 01_maturity_mismatch.png")
 
@@ -158,7 +163,7 @@ ax.legend(fontsize=10)
 ax.grid(alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('02_bank_run_speed.png', dpi=300, bbox_inches='tight')
+render.savefig('02_bank_run_speed.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 02_bank_run_speed.png")
 
@@ -254,7 +259,7 @@ ax.set_ylim(0, 120)
 ax.grid(axis='y', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('03_nash_equilibrium.png', dpi=300, bbox_inches='tight')
+render.savefig('03_nash_equilibrium.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 03_nash_equilibrium.png")
 
@@ -329,7 +334,7 @@ ax.legend(fontsize=10)
 ax.grid(axis='y', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('04_deposit_insurance.png', dpi=300, bbox_inches='tight')
+render.savefig('04_deposit_insurance.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 04_deposit_insurance.png")
 
@@ -403,7 +408,7 @@ ax.set_xlim(0, 105)
 ax.grid(axis='x', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('05_svb_analysis.png', dpi=300, bbox_inches='tight')
+render.savefig('05_svb_analysis.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 05_svb_analysis.png")
 
@@ -440,7 +445,7 @@ fig.suptitle('Bank Run Contagion Network: How SVB\'s Failure Spread\n'
 
 # Panel 1: Contagion network
 ax = axes[0]
-pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+pos = layout.spring_layout(G, k=2, iterations=50, seed=42)
 failed = ['SVB', 'Signature\nBank', 'First\nRepublic']
 node_colors = ['#E74C3C' if n in failed else '#F39C12' if n == 'Credit\nSuisse' else '#3498DB'
                for n in G.nodes()]
@@ -486,7 +491,7 @@ ax.set_xlim(0, 110)
 ax.grid(axis='x', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('06_contagion.png', dpi=300, bbox_inches='tight')
+render.savefig('06_contagion.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 06_contagion.png")
 
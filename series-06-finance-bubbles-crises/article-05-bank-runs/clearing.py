@@ -0,0 +1,228 @@
+"""
+Eisenberg-Noe clearing: interbank contagion on sparse exposure matrices.
+
+MODEL 6 in the article script draws contagion by hand. Here it is
+computed. Bank i owes L[i, j] to bank j, plus `external_liabilities[i]` to
+creditors outside the system, and holds external assets e_i. In a
+clearing vector p, every bank pays
+
+    p_i = min(pbar_i, max(0, e_i + sum_j L[j, i] * p_j / pbar_j))
+
+which is all it owes or everything it has, with losses shared pro rata by
+its creditors. The greatest such p is found by Eisenberg and Noe's
+fictitious-default algorithm:
+- Round 0: banks that cannot pay in full even if everyone else does
+  (fundamental defaults).
+- Each round then solves the payments of the current defaulters, with
+  all other banks paying in full, and marks the banks that this pushes
+  under. Those are the contagion defaults of the next round.
+- It stops when a round adds no one. The default set only grows, so
+  there are at most n rounds, and in practice a handful.
+
+The work is batched over scenarios. External assets are an (n, S) matrix,
+one column per shock scenario, and everything is carried as the fraction
+of obligations paid, r = p / pbar. A bank's interbank income is then a
+single sparse product L^T @ r for all scenarios at once. Each round's
+defaulter system is solved by Jacobi sweeps of that product; they start
+from the previous round's payments, fall monotonically to the solution,
+and drop scenarios as they converge. A scenario has converged once the
+error bound implied by its observed rate of contraction, not just the last
+step, is below `tol`. Nothing loops over banks or scenarios in Python,
+except for scenarios whose sweeps converge too slowly: e.g. a long ring
+of defaulters with little owed outside, where each sweep shrinks the error
+by only the ring's interbank share. After `max_sweeps` in a round, those
+scenarios' defaulter systems are solved directly, one sparse LU each.
+(LU is not the default: on a large random network its fill-in makes a
+single scenario take tens of seconds, against milliseconds for sweeps.)
+
+Usage:
+    import clearing
+    L, ext_assets, ext_liab = clearing.interbank_network(10_000, seed=1)
+    shocked = clearing.shock(ext_assets, 1000, seed=2)          # (n, S)
+    res = clearing.clear(L, shocked, external_liabilities=ext_liab)
+    res.defaulted.sum(axis=0)      # defaults per scenario
+    res.cascade                    # (rounds, S): new defaults per round
+    res.default_round              # -1, or the round a bank went under
+
+    python clearing.py --banks 10000 --scenarios 1000
+"""
+
+import time
+from typing import NamedTuple
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+
+class Clearing(NamedTuple):
+    """Clearing payments and the default cascade, per bank x scenario."""
+    payments: np.ndarray       # p: amount each bank pays in total
+    recovery: np.ndarray       # p / pbar: share of obligations honoured
+    equity: np.ndarray         # e + interbank income - pbar (negative: shortfall)
+    default_round: np.ndarray  # -1 solvent, 0 fundamental, k >= 1 contagion wave
+    cascade: np.ndarray        # (rounds, S): banks newly defaulting per round
+    sweeps: int                # Jacobi sweeps over all rounds
+    direct: int                # (round, scenario) systems left to a direct solve
+
+    @property
+    def defaulted(self):
+        return self.default_round >= 0
+
+    @property
+    def rounds(self):
+        return len(self.cascade)
+
+
+def _solve_direct(income_of, scale, E, r, defaulted, col):
+    """Payments of one scenario's defaulters, everyone else paying in full."""
+    d = np.flatnonzero(defaulted)
+    rows = income_of[d]
+    A = sp.diags(scale[d]) - rows[:, d]
+    rhs = E[d, col] + rows @ np.where(defaulted, 0.0, 1.0)
+    r[d, col] = np.clip(spla.spsolve(A.tocsc(), rhs), 0.0, 1.0)
+
+
+def clear(liabilities, external_assets, external_liabilities=None, tol=1e-10,
+          max_sweeps=1000):
+    """Greatest clearing vector for each column of `external_assets`.
+
+    liabilities: (n, n) sparse or dense, [i, j] = what i owes j.
+    external_assets: (n,) or (n, S). Results have the same shape.
+    external_liabilities: (n,) owed outside the system, pari passu with
+    interbank debt (None: none).
+    max_sweeps: Jacobi sweeps per round before the scenarios still
+    unconverged are solved directly instead.
+    """
+    L = sp.csr_matrix(liabilities, dtype=float)
+    n = L.shape[0]
+    E = np.asarray(external_assets, dtype=float)
+    single = E.ndim == 1
+    if single:
+        E = E[:, None]
+    pbar = np.asarray(L.sum(axis=1)).ravel()
+    if external_liabilities is not None:
+        pbar = pbar + np.asarray(external_liabilities, dtype=float)
+    owes = pbar > 0
+    scale = np.where(owes, pbar, 1.0)
+    income_of = L.T.tocsr()  # income_of @ r: interbank income, per bank
+
+    S = E.shape[1]
+    r = np.ones((n, S))
+    default_round = np.full((n, S), -1, dtype=np.int32)
+    cascade = []
+    sweeps = direct = 0
+    while True:
+        income = income_of @ r
+        new = (E + income < pbar[:, None] * (1 - tol)) & owes[:, None] & (default_round < 0)
+        if not new.any():
+            break
+        default_round[new] = len(cascade)
+        cascade.append(new.sum(axis=0))
+        # Defaulters pay what they have; everyone else pays in full.
+        active = np.flatnonzero(new.any(axis=0))
+        last = np.full(len(active), np.inf)
+        for _ in range(max_sweeps):
+            if not len(active):
+                break
+            sweeps += 1
+            cur = r[:, active]
+            paid = np.clip((E[:, active] + income_of @ cur) / scale[:, None], 0.0, 1.0)
+            nxt = np.where(default_round[:, active] >= 0, paid, 1.0)
+            change = np.abs(nxt - cur).max(axis=0)
+            r[:, active] = nxt
+            # Steps shrink by ~rate per sweep, so the error left is about
+            # change * rate / (1 - rate).
+            rate = np.minimum(change / last, 1.0)
+            done = (change <= tol) & (change * rate <= tol * (1 - rate))
+            active, last = active[~done], change[~done]
+        for col in active:
+            _solve_direct(income_of, scale, E, r, default_round[:, col] >= 0, col)
+        direct += len(active)
+    income = income_of @ r
+    out = Clearing(
+        payments=r * pbar[:, None],
+        recovery=r,
+        equity=E + income - pbar[:, None],
+        default_round=default_round,
+        cascade=np.array(cascade, dtype=np.int64).reshape(-1, S),
+        sweeps=sweeps,
+        direct=direct,
+    )
+    if single:
+        out = out._replace(payments=out.payments[:, 0], recovery=out.recovery[:, 0],
+                           equity=out.equity[:, 0], default_round=out.default_round[:, 0],
+                           cascade=out.cascade[:, 0])
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Synthetic systems and shocks
+# ---------------------------------------------------------------------------
+def interbank_network(n, degree=10, interbank_share=0.2, capital=0.05, tail=1.3, seed=None):
+    """A random interbank system: (L csr, external assets, external liabilities).
+
+    Balance-sheet sizes are Pareto(`tail`), so a few banks are very large.
+    Each bank borrows `interbank_share` of its size from `degree` lenders
+    drawn in proportion to size (large banks are everybody's
+    counterparty). It owes the rest of its liabilities outside the system
+    and holds `capital` of its size as equity. External assets make the
+    balance sheet add up.
+    """
+    rng = np.random.default_rng(seed)
+    size = rng.pareto(tail, n) + 1.0
+    rows = np.repeat(np.arange(n), degree)
+    cols = rng.choice(n, n * degree, p=size / size.sum())
+    amount = rng.random((n, degree))
+    amount = (amount * (interbank_share * size / amount.sum(axis=1))[:, None]).ravel()
+    keep = rows != cols
+    L = sp.csr_matrix((amount[keep], (rows[keep], cols[keep])), shape=(n, n))
+    L.sum_duplicates()
+    borrowed = np.asarray(L.sum(axis=1)).ravel()
+    lent = np.asarray(L.sum(axis=0)).ravel()
+    ext_liab = (1 - capital) * size - borrowed
+    ext_assets = np.maximum(size - lent, 0.0)
+    return L, ext_assets, ext_liab
+
+
+def shock(external_assets, n_scenarios, common=0.02, idiosyncratic=0.015, seed=None):
+    """(n, S) shocked external assets.
+
+    Scenario s loses a common fraction ~ Exponential(`common`) of every
+    bank's external assets, plus a bank-specific Normal(0, `idiosyncratic`)
+    on top, clipped to [0, 1].
+    """
+    rng = np.random.default_rng(seed)
+    e = np.asarray(external_assets, dtype=float)
+    loss = rng.exponential(common, n_scenarios) + rng.normal(0, idiosyncratic,
+                                                             (len(e), n_scenarios))
+    return e[:, None] * (1 - np.clip(loss, 0.0, 1.0))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--banks", type=int, default=10_000)
+    parser.add_argument("--scenarios", type=int, default=1000)
+    parser.add_argument("--degree", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    L, ext_assets, ext_liab = interbank_network(args.banks, degree=args.degree, seed=args.seed)
+    shocked = shock(ext_assets, args.scenarios, seed=args.seed + 1)
+    t0 = time.perf_counter()
+    res = clear(L, shocked, external_liabilities=ext_liab)
+    wall = time.perf_counter() - t0
+
+    fundamental = (res.default_round == 0).sum(axis=0)
+    contagion = (res.default_round > 0).sum(axis=0)
+    print(f"{args.banks:,} banks x {args.scenarios:,} scenarios, {L.nnz:,} exposures: "
+          f"{wall:.2f} s ({res.rounds} rounds, {res.sweeps} sweeps, {res.direct} direct solves)")
+    print(f"  fundamental defaults per scenario: mean {fundamental.mean():.1f}, "
+          f"max {fundamental.max()}")
+    print(f"  contagion defaults per scenario:   mean {contagion.mean():.1f}, "
+          f"max {contagion.max()}  ({(contagion > 0).mean():.0%} of scenarios)")
+    print(f"  deepest cascade: {int((res.cascade > 0).sum(axis=0).max())} rounds")
+    shortfall = (np.asarray(L.sum(axis=1)).ravel() + ext_liab)[:, None] - res.payments
+    print(f"  unpaid obligations per scenario:   mean {shortfall.sum(axis=0).mean():,.1f}")
@@ -0,0 +1,193 @@
+"""
+DebtRank: systemic impact on a lending-exposure network.
+
+MODEL 5 in the article script tells the 2022 domino chain (Terra -> 3AC ->
+Celsius -> Voyager -> FTX) with hard-coded losses. DebtRank (Battiston et
+al. 2012) instead asks, for each counterparty, how much of the whole
+network's value would be put in distress if that counterparty failed.
+
+Exposures X[i, j] are what i has lent to j, which is i's loss if j
+defaults. j's distress hits i in proportion to the share of i's capital at
+stake: W[j, i] = min(1, X[i, j] / capital_i). Each node's distress h is in
+[0, 1] and its state is Undistressed, Distressed or Inactive. Round by
+round:
+
+    h_i <- min(1, h_i + sum over distressed j of W[j, i] * h_j)
+
+Nodes that were distressed go inactive, so each node passes its distress
+on only once and cycles cannot amplify without bound. Nodes that picked up
+distress become distressed. A shock's DebtRank is the value-weighted
+distress at the end, minus the shock itself:
+
+    R = sum_i v_i h_i(T) - sum_i v_i h_i(0)
+
+Shocking every node in turn is batched: distress and state are (n, b)
+arrays with one column per shocked node. A round is a single sparse
+product W^T @ F for the whole batch, where F holds the distress of the
+currently distressed (node, shock) pairs only. Batches are independent
+and can be spread over worker processes.
+
+Usage:
+    import debtrank
+    X, capital = debtrank.lending_network(10_000, seed=1)
+    res = debtrank.debtrank(X, capital)            # every node shocked in turn
+    res.top(10)                                    # most systemic nodes
+    res.rank, res.defaults, res.rounds             # per shocked node
+
+    python debtrank.py --nodes 10000 --workers 4
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+import scipy.sparse as sp
+
+UNDISTRESSED, DISTRESSED, INACTIVE = 0, 1, 2
+
+
+class DebtRank(NamedTuple):
+    """One entry per shock scenario (by default: per shocked node)."""
+    shocked: np.ndarray    # node shocked in each scenario
+    rank: np.ndarray       # DebtRank R: value put in distress, excluding the shock
+    distress: np.ndarray   # total value-weighted distress, including the shock
+    defaults: np.ndarray   # nodes ending fully distressed (h = 1)
+    rounds: np.ndarray     # propagation rounds until no node was distressed
+
+    def top(self, k=10):
+        """(node, R) of the k most systemic shocked nodes."""
+        order = np.argsort(-self.rank, kind="stable")[:k]
+        return list(zip(self.shocked[order].tolist(), self.rank[order].tolist()))
+
+
+def impact_matrix(exposures, capital):
+    """CSR of W^T: row i lists W[j, i] = min(1, X[i, j] / capital_i)."""
+    X = sp.csr_matrix(exposures, dtype=float)
+    X.setdiag(0)
+    X.eliminate_zeros()
+    cap = np.asarray(capital, dtype=float)
+    # Row i of X is i's lending; no capital means any loss wipes it out.
+    inv = np.divide(1.0, cap, out=np.full(len(cap), np.inf), where=cap > 0)
+    W = sp.diags(inv) @ X
+    W.data = np.minimum(W.data, 1.0)
+    return W.tocsr()
+
+
+def _propagate(impact, h):
+    """Run the cascade from initial distress h (n, b), in place.
+
+    Only the distressed frontier is carried as a sparse (n, b) matrix, so
+    a round costs in proportion to the edges it actually crosses, not n*b.
+    """
+    n, b = h.shape
+    flat_h = h.reshape(-1)
+    state = np.zeros(n * b, dtype=np.int8)
+    rows, cols = np.nonzero(h)  # row-major, as CSR wants it
+    rounds = np.zeros(b, dtype=np.int64)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    while len(rows):
+        rounds += np.bincount(cols, minlength=b) > 0
+        idx = rows * b + cols
+        state[idx] = INACTIVE
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+        frontier = sp.csr_matrix((flat_h[idx], cols, indptr), shape=(n, b))
+        spread = impact @ frontier
+        rows = np.repeat(np.arange(n), np.diff(spread.indptr))
+        cols = spread.indices
+        idx = rows * b + cols
+        flat_h[idx] = np.minimum(1.0, flat_h[idx] + spread.data)
+        fresh = state[idx] == UNDISTRESSED
+        rows, cols = rows[fresh], cols[fresh]
+        state[idx[fresh]] = DISTRESSED
+    return h, rounds
+
+
+_shared = {}
+
+
+def _init_worker(impact, value):
+    _shared["impact"], _shared["value"] = impact, value
+
+
+def _run_batch(nodes, psi, impact=None, value=None):
+    impact = impact if impact is not None else _shared["impact"]
+    value = value if value is not None else _shared["value"]
+    h = np.zeros((impact.shape[0], len(nodes)))
+    h[nodes, np.arange(len(nodes))] = psi
+    start = value @ h
+    h, rounds = _propagate(impact, h)
+    total = value @ h
+    return total - start, total, (h >= 1.0).sum(axis=0), rounds
+
+
+def debtrank(exposures, capital, value=None, shocked=None, psi=1.0, workers=1, batch=256):
+    """DebtRank of shocking each node in `shocked` alone (default: all nodes).
+
+    exposures: (n, n) sparse or dense, [i, j] = what i has lent to j.
+    capital: (n,) equity buffers. value: (n,) economic weights, normalised
+    to sum to 1 (default: each node's share of total borrowing).
+    psi: initial distress of the shocked node (1 = default).
+    """
+    impact = impact_matrix(exposures, capital)
+    n = impact.shape[0]
+    if value is None:
+        value = np.asarray(sp.csr_matrix(exposures).sum(axis=0), dtype=float).ravel()
+    value = np.asarray(value, dtype=float)
+    value = value / value.sum()
+    shocked = np.arange(n) if shocked is None else np.asarray(shocked)
+    batches = [shocked[i:i + batch] for i in range(0, len(shocked), batch)]
+    if workers and workers > 1 and len(batches) > 1:
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(impact, value)) as pool:
+            parts = list(pool.map(_run_batch, batches, [psi] * len(batches)))
+    else:
+        parts = [_run_batch(b, psi, impact, value) for b in batches]
+    rank, distress, defaults, rounds = (np.concatenate(p) for p in zip(*parts))
+    return DebtRank(shocked, rank, distress, defaults, rounds)
+
+
+def lending_network(n, degree=8, lending_share=0.15, tail=1.2, seed=None):
+    """A random crypto-lending network: (exposures csr, capital).
+
+    Sizes are Pareto(`tail`). Each lender puts `lending_share` of its
+    balance sheet into `degree` loans to borrowers drawn in proportion to
+    size. Capital ratios are lognormal around 10%, so some lenders are thinly
+    capitalised (the 3AC / Celsius profile).
+    """
+    rng = np.random.default_rng(seed)
+    size = rng.pareto(tail, n) + 1.0
+    rows = np.repeat(np.arange(n), degree)
+    cols = rng.choice(n, n * degree, p=size / size.sum())
+    amount = rng.random((n, degree))
+    amount = (amount * (lending_share * size / amount.sum(axis=1))[:, None]).ravel()
+    keep = rows != cols
+    X = sp.csr_matrix((amount[keep], (rows[keep], cols[keep])), shape=(n, n))
+    X.sum_duplicates()
+    capital = size * np.clip(rng.lognormal(np.log(0.1), 0.5, n), 0.01, 0.5)
+    return X, capital
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--degree", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    X, capital = lending_network(args.nodes, degree=args.degree, seed=args.seed)
+    t0 = time.perf_counter()
+    res = debtrank(X, capital, workers=args.workers)
+    wall = time.perf_counter() - t0
+    borrowed = np.asarray(X.sum(axis=0)).ravel()
+    print(f"{args.nodes:,} nodes, {X.nnz:,} exposures, every node shocked: {wall:.2f} s "
+          f"(max {res.rounds.max()} rounds)")
+    print(f"  mean DebtRank {res.rank.mean():.4f}, "
+          f"{(res.rank > 0.1).sum()} nodes put >10% of the network in distress")
+    print("  most systemic:")
+    for node, r in res.top(10):
+        print(f"    node {node:>6}  R = {r:.3f}  borrowed {borrowed[node]:10.1f}  "
+              f"defaults {res.defaults[node]:>5}")
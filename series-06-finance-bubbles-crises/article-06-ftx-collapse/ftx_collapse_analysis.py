@@ -12,8 +12,13 @@ import networkx as nx
 import matplotlib.pyplot as plt
 import numpy as np
 
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for cogito/
+from cogito import layout, render, style
+
+style.apply()
 
 
 # ============================================================
@@ -89,7 +94,7 @@ ax.set_title('From Cover to Prison: 18 Months', fontsize=12, fontweight='bold')
 ax.grid(alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('01_fund_flow.png', dpi=300, bbox_inches='tight')
+render.savefig('01_fund_flow.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 01_fund_flow.png")
 
@@ -189,7 +194,7 @@ ax.set_ylim(-2, 2)
 ax.axis('off')
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('02_leverage_tower.png', dpi=300, bbox_inches='tight')
+render.savefig('02_leverage_tower.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 02_leverage_tower.png")
 
@@ -237,7 +242,7 @@ fig.suptitle('Trust Network: Every Gatekeeper Failed\n'
 
 # Panel 1: Network graph
 ax = axes[0]
-pos = nx.spring_layout(G, k=2.5, iterations=80, seed=42)
+pos = layout.spring_layout(G, k=2.5, iterations=80, seed=42)
 node_colors = [actors[n]['color'] for n in G.nodes()]
 node_sizes = [1500 if n == 'SBF/FTX' else 1000 if n == 'Customers' else 800 for n in G.nodes()]
 nx.draw_networkx_nodes(G, pos, ax=ax, node_size=node_sizes, node_color=node_colors,
@@ -282,7 +287,7 @@ ax.set_xlim(0, 105)
 ax.grid(axis='x', alpha=0.3)
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('03_trust_network.png', dpi=300, bbox_inches='tight')
+render.savefig('03_trust_network.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 03_trust_network.png")
 
@@ -359,7 +364,7 @@ ax.text(1, 55, '"Just trust\nSBF"', ha='center', fontsize=10, fontweight='bold',
         color='#E74C3C')
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('04_regulatory_arbitrage.png', dpi=300, bbox_inches='tight')
+render.savefig('04_regulatory_arbitrage.png', dpi=300, bbox_inches='tight')
 plt.close()
 print("=> Saved: 04_regulatory_arbitrage.png")
 
@@ -432,7 +437,7 @@ ax.set_title('Causal Chain', fontsize=12, fontweight='bold')
 ax.axis('off')
 
 plt.tight_layout(rect=[0, 0, 1, 0.92], w_pad=3)
-plt.savefig('05_crypto_contagion.png', dpi=300, bbox_inches='tight')
+render.savefig('05_crypto_contagion.png', dpi=300, bbox_inches='tight')
 plt.close()
 
 print(f"  Total value destroyed: ${sum(value_destroyed):.1f}B")